@@ -0,0 +1,129 @@
+"""
+Latency of /cancel_payment with a new Telegram bot per request and with the bot shared by the lifespan
+
+The previous handler built Bot(TELEGRAM_AUTH_TOKEN) on every request, so every request created a new
+HTTP client and opened a new connection to Telegram. Stripe and Telegram are local stubs.
+
+Usage:
+    python -m src.benchmarks.bench_bot [n_requests] [concurrency]
+"""
+
+import os
+import sys
+import time
+import uuid
+import asyncio
+import tempfile
+import statistics
+
+from .fixtures import use_temp_config, use_temp_databases
+from .fake_stripe import FakeStripeAPI
+from .fake_telegram import FakeTelegramAPI
+
+
+def create_previous_app(stripe_backend, api_url):
+    from fastapi import FastAPI, Request
+    from fastapi.responses import HTMLResponse
+    from telegram import Bot
+
+    previous_app = FastAPI()
+
+    @previous_app.get("/cancel_payment", response_class=HTMLResponse)
+    async def cancel_payment(request: Request, session_id: str, web_app_query_id: str):
+
+        telegram_bot = Bot(
+            stripe_backend.TELEGRAM_AUTH_TOKEN, base_url=f"{api_url}/bot"
+        )
+        await stripe_backend.run_stripe(
+            stripe_backend.stripe.checkout.Session.expire, session_id
+        )
+
+        result = {
+            "message_text": stripe_backend.PAYMENT_CANCELLATION_MESSAGE_TEXT,
+            "type": "article",
+            "title": "Payment Cancelled",
+            "id": str(uuid.uuid4()),
+        }
+
+        await telegram_bot.answer_web_app_query(web_app_query_id, result)
+
+        return stripe_backend.templates.TemplateResponse(
+            request=request, name="cancel.html"
+        )
+
+    return previous_app
+
+
+async def cancel(client, i):
+    start = time.perf_counter()
+    response = await client.get(
+        "/cancel_payment",
+        params={"session_id": f"cs_{i}", "web_app_query_id": f"query_{i}"},
+    )
+    response.raise_for_status()
+
+    return time.perf_counter() - start
+
+
+async def measure(app, n_requests, concurrency):
+    import httpx
+
+    # The lifespan is entered by hand because httpx.ASGITransport doesn't run it
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            latencies = []
+            for start in range(0, n_requests, concurrency):
+                latencies += await asyncio.gather(
+                    *[
+                        cancel(client, i)
+                        for i in range(start, min(start + concurrency, n_requests))
+                    ]
+                )
+
+    return [latency * 1000 for latency in latencies]
+
+
+def main(n_requests, concurrency):
+    with tempfile.TemporaryDirectory() as directory:
+        use_temp_config(directory)
+        use_temp_databases(directory)
+        os.environ["STATIC_DIR"] = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "client"
+        )
+
+        import stripe
+        from ..server import stripe_backend
+
+        results = {}
+        with FakeStripeAPI() as fake_stripe, FakeTelegramAPI() as fake_telegram:
+            stripe.api_key = "sk_test_bench"
+            stripe.api_base = fake_stripe.url
+            stripe_backend.TELEGRAM_API_URL = fake_telegram.url
+
+            previous_app = create_previous_app(stripe_backend, fake_telegram.url)
+            for name, app in [
+                ("bot per request", previous_app),
+                ("shared bot", stripe_backend.app),
+            ]:
+                results[name] = asyncio.run(measure(app, n_requests, concurrency))
+
+            answered = fake_telegram.count("answerWebAppQuery")
+
+    assert answered == 2 * n_requests, answered
+
+    print(f"{n_requests} /cancel_payment requests, {concurrency} at a time")
+    print(f"{'telegram bot':<16} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, latencies in results.items():
+        latencies = sorted(latencies)
+        p50 = statistics.median(latencies)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(f"{name:<16} {p50:>8.2f} {p95:>8.2f}")
+
+
+if __name__ == "__main__":
+    n_requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    main(n_requests, concurrency)
@@ -0,0 +1,105 @@
+"""
+Lookups of the /successful_payment handler (price, product and groups) from SQLite and from the catalog cache
+
+Also checks that the warm catalog does not run any SQLite statement and that a product created by
+another connection is picked up once the version counter is checked.
+
+Usage:
+    python -m src.benchmarks.bench_catalog
+"""
+
+import time
+import sqlite3
+import tempfile
+
+from .fixtures import use_temp_config, use_temp_databases
+
+N_PRODUCTS = 1_000
+REPEAT = 2_000
+
+
+def fill(database):
+    database.creator.create_tables()
+    database.selector.create_products(
+        [
+            {"name": f"product {i}", "stripe_product_id": f"prod_{i}", "quantity": 1}
+            for i in range(N_PRODUCTS)
+        ]
+    )
+    database.selector.create_prices(
+        [
+            {
+                "stripe_price_id": f"price_{i}",
+                "price": 399,
+                "currency": "sek",
+                "product_id": i + 1,
+            }
+            for i in range(N_PRODUCTS)
+        ]
+    )
+    database.selector.create_groups(
+        [
+            {"name": f"group {i}", "telegram_group_id": f"-100{i}", "product_id": i + 1}
+            for i in range(N_PRODUCTS)
+        ]
+    )
+
+
+def lookup(source, i):
+    price = source.get_prices(stripe_price_id=f"price_{i % N_PRODUCTS}")[0]
+    product = source.get_products(product_id=price["product_id"])[0]
+    return source.get_groups(product_id=product["id"])
+
+
+def measure(source):
+    start = time.perf_counter()
+    for i in range(REPEAT):
+        lookup(source, i)
+
+    return (time.perf_counter() - start) * 1_000_000 / REPEAT
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        use_temp_config(directory)
+        use_temp_databases(directory)
+
+        from .. import database
+
+        fill(database)
+        catalog = database.catalog.Catalog(check_interval=60)
+
+        selector_us = measure(database.selector)
+        lookup(catalog, 0)
+        catalog_us = measure(catalog)
+
+        # Count the statements sent to SQLite by the warm catalog
+        statements = []
+        conn = database.connection.get_connection()
+        conn.set_trace_callback(statements.append)
+        for i in range(REPEAT):
+            lookup(catalog, i)
+        conn.set_trace_callback(None)
+        assert not statements, statements
+
+        # A product created by another process is only seen once the version counter is checked
+        other_process = sqlite3.connect(database.connection.PAYMENTS_DB_NAME)
+        with other_process:
+            other_process.execute(
+                "INSERT INTO products (name, stripe_product_id, quantity) VALUES ('new', 'prod_new', 1)"
+            )
+        other_process.close()
+
+        assert not catalog.get_products(stripe_product_id="prod_new")
+        catalog.check_interval = 0
+        assert catalog.get_products(stripe_product_id="prod_new")
+
+    print(f"{N_PRODUCTS:,} products, {REPEAT:,} price/product/groups lookups")
+    print(f"{'source':<10} {'us/lookup':>10}")
+    print(f"{'selector':<10} {selector_us:>10.1f}")
+    print(f"{'catalog':<10} {catalog_us:>10.1f}")
+    print(f"SQLite statements on the warm path: {len(statements)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Load test of the payment flow of the FastAPI backend against a local Stripe stub
+
+Every user opens a checkout session and comes back to /successful_payment at the same time. The
+previous handlers called the blocking Stripe SDK on the event loop, which is reproduced by running
+the Stripe calls inline instead of on the Stripe thread pool.
+
+Usage:
+    python -m src.benchmarks.bench_checkout [n_users] [stripe_latency_seconds]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import statistics
+
+from .fixtures import FakeBot, use_temp_config, use_temp_databases
+from .fake_stripe import FakeStripeAPI
+
+
+async def run_inline(function, *args, **kwargs):
+    return function(*args, **kwargs)
+
+
+async def pay(client, user):
+    start = time.perf_counter()
+
+    response = await client.get(
+        "/create_checkout_session",
+        params={
+            "price_id": "price_0",
+            "web_app_query_id": f"query_{user}",
+            "temp_message_id": "1",
+            "telegram_user_id": str(user),
+        },
+    )
+    session_id = response.json()["session_id"]
+
+    response = await client.get(
+        "/successful_payment",
+        params={
+            "web_app_query_id": f"query_{user}",
+            "temp_message_id": "1",
+            "telegram_user_id": str(user),
+            "session_id": session_id,
+        },
+    )
+    response.raise_for_status()
+
+    return time.perf_counter() - start
+
+
+async def load_test(app, n_users):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        start = time.perf_counter()
+        latencies = await asyncio.gather(
+            *[pay(client, user) for user in range(n_users)]
+        )
+        elapsed = time.perf_counter() - start
+
+    return elapsed, latencies
+
+
+def main(n_users, latency):
+    with tempfile.TemporaryDirectory() as directory:
+        use_temp_config(directory)
+        use_temp_databases(directory)
+        os.environ["STATIC_DIR"] = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "client"
+        )
+
+        import stripe
+        from .. import database
+        from ..server import stripe_backend
+
+        database.creator.create_tables()
+        database.selector.create_products(
+            [{"name": "product", "stripe_product_id": "prod_0", "quantity": 1}]
+        )
+        database.selector.create_prices(
+            [
+                {
+                    "stripe_price_id": "price_0",
+                    "price": 399,
+                    "currency": "sek",
+                    "product_id": 1,
+                }
+            ]
+        )
+        database.updater.update_ngrok_url("https://bench.ngrok.app")
+
+        # httpx.ASGITransport doesn't run the lifespan that creates the shared bot
+        stripe_backend.app.state.telegram_bot = FakeBot()
+        pooled_run_stripe = stripe_backend.run_stripe
+
+        results = {}
+        with FakeStripeAPI(latency=latency) as fake_stripe:
+            stripe.api_key = "sk_test_bench"
+            stripe.api_base = fake_stripe.url
+
+            for name, run_stripe in [
+                ("inline", run_inline),
+                ("thread pool", pooled_run_stripe),
+            ]:
+                stripe_backend.run_stripe = run_stripe
+                results[name] = asyncio.run(load_test(stripe_backend.app, n_users))
+
+            stripe_backend.run_stripe = pooled_run_stripe
+
+    print(
+        f"{n_users} users paying at the same time, {latency * 1000:.0f} ms per Stripe call"
+    )
+    print(
+        f"{'stripe calls':<14} {'total s':>8} {'payments/s':>11} {'p50 ms':>8} {'p95 ms':>8}"
+    )
+    for name, (elapsed, latencies) in results.items():
+        latencies = sorted(latencies)
+        p50 = statistics.median(latencies) * 1000
+        p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+        print(
+            f"{name:<14} {elapsed:>8.2f} {n_users / elapsed:>11.1f} {p50:>8.0f} {p95:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    n_users = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    main(n_users, latency)
@@ -0,0 +1,136 @@
+"""
+Dedup time of one poll against a bets table with a growing number of stored rows
+
+The previous version looked the ids up with an IN clause on a table without any index and then
+inserted the new bets, the current one does both with the INSERT ... ON CONFLICT of upsert_data on
+the primary key, which leaves the stored bets alone when their price is the same.
+
+Usage:
+    python -m src.benchmarks.bench_dedup [stored_rows ...]
+"""
+
+import os
+import sys
+import time
+import random
+import sqlite3
+import tempfile
+
+from ..bot_db import Database
+
+BATCH_SIZE = 500
+REPEAT = 5
+
+UNINDEXED_TABLE = """
+    CREATE TABLE bets (
+        id TEXT, market_and_bet_type INTEGER, bookmaker_event_id INTEGER, bookmaker_id INTEGER,
+        league TEXT, event_name TEXT, home TEXT, away TEXT, swap_teams INTEGER, started_at TEXT,
+        koef_last_modified_at TEXT, bookmaker_event_direct_link TEXT, koef REAL, avg_koef REAL,
+        percent REAL, min_koef REAL, bet_url TEXT, bet_info TEXT, receive_date TEXT, sport_id INTEGER
+    )
+"""
+
+COLUMNS = [
+    "id",
+    "market_and_bet_type",
+    "bookmaker_event_id",
+    "bookmaker_id",
+    "league",
+    "event_name",
+    "home",
+    "away",
+    "swap_teams",
+    "started_at",
+    "koef_last_modified_at",
+    "bookmaker_event_direct_link",
+    "koef",
+    "avg_koef",
+    "percent",
+    "min_koef",
+    "bet_url",
+    "bet_info",
+    "receive_date",
+    "sport_id",
+]
+
+
+def bet_id(i):
+    return f"bet{i:010d}"
+
+
+def fill(conn, stored_rows):
+    conn.execute(
+        """
+        INSERT INTO bets (id, market_and_bet_type, bookmaker_event_id, league, koef)
+        WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i + 1 < ?)
+        SELECT printf('bet%010d', i), i % 300, i / 5, 'Sweden. Allsvenskan', 2.0 FROM n
+    """,
+        (stored_rows,),
+    )
+    conn.commit()
+
+
+def make_batch(stored_rows, repetition, rng):
+    # Half of a poll is usually already stored, the other half is new
+    seen = [bet_id(rng.randrange(stored_rows)) for _ in range(BATCH_SIZE // 2)]
+    new = [
+        bet_id(stored_rows + repetition * BATCH_SIZE + i)
+        for i in range(BATCH_SIZE // 2)
+    ]
+    return [{**dict.fromkeys(COLUMNS), "id": id, "koef": 2.0} for id in seen + new]
+
+
+def unindexed_dedup(conn, batch):
+    ids = tuple(bet["id"] for bet in batch)
+    stored_ids = {
+        row[0]
+        for row in conn.execute(f"SELECT * FROM bets WHERE id IN {ids}").fetchall()
+    }
+    new_bets = [bet for bet in batch if bet["id"] not in stored_ids]
+    conn.executemany(
+        f"INSERT INTO bets ({', '.join(COLUMNS)}) VALUES ({', '.join(':' + c for c in COLUMNS)})",
+        new_bets,
+    )
+    conn.commit()
+
+    return len(new_bets)
+
+
+def run(stored_rows, directory):
+    rng = random.Random(stored_rows)
+    timings = {}
+
+    # Previous schema and dedup
+    conn = sqlite3.connect(os.path.join(directory, f"unindexed_{stored_rows}.db"))
+    conn.execute(UNINDEXED_TABLE)
+    fill(conn, stored_rows)
+    start = time.perf_counter()
+    for repetition in range(REPEAT):
+        assert unindexed_dedup(conn, make_batch(stored_rows, repetition, rng)) >= 250
+    timings["unindexed"] = (time.perf_counter() - start) / REPEAT
+    conn.close()
+
+    # Primary key and INSERT ... ON CONFLICT
+    with Database(os.path.join(directory, f"indexed_{stored_rows}.db")) as db:
+        fill(db.conn, stored_rows)
+        start = time.perf_counter()
+        for repetition in range(REPEAT):
+            assert db.upsert_data(make_batch(stored_rows, repetition, rng)) >= 250
+        timings["indexed"] = (time.perf_counter() - start) / REPEAT
+
+    return timings
+
+
+def main(sizes):
+    print(f"{'stored rows':>12} {'unindexed ms':>13} {'indexed ms':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for stored_rows in sizes:
+            timings = run(stored_rows, directory)
+            print(
+                f"{stored_rows:>12,} {timings['unindexed'] * 1000:>13.1f} "
+                f"{timings['indexed'] * 1000:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [10_000, 1_000_000, 10_000_000])
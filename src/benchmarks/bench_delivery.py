@@ -0,0 +1,50 @@
+"""
+Delivery time of a batch of messages against a local fake Telegram API
+
+The previous delivery loop sent every message one after the other with a 3 second sleep in between,
+the rate limited sender sends to the chats in parallel at the per chat rate.
+
+Usage:
+    python -m src.benchmarks.bench_delivery [n_messages] [n_chats]
+"""
+
+import sys
+import time
+import asyncio
+
+from .fake_telegram import FakeTelegramAPI
+from ..delivery import TelegramSender
+
+SLEEP_AFTER_EACH_MESSAGE = 3
+
+
+def main(n_messages, n_chats):
+    chat_ids = [f"-100{i}" for i in range(n_chats)]
+    messages_by_chat = {chat_id: [] for chat_id in chat_ids}
+    for i in range(n_messages):
+        messages_by_chat[chat_ids[i % n_chats]].append(f"Message {i}")
+
+    with FakeTelegramAPI(latency=0.05, min_chat_interval=0.95) as api:
+        sender = TelegramSender("token", api_url=api.url)
+
+        start = time.perf_counter()
+        responses = asyncio.run(sender.send_all(messages_by_chat))
+        elapsed = time.perf_counter() - start
+
+        delivered = sum(
+            1
+            for chat_responses in responses.values()
+            for response in chat_responses
+            if response and response.get("ok")
+        )
+
+    sequential = n_messages * (api.latency + SLEEP_AFTER_EACH_MESSAGE)
+    print(f"messages: {n_messages} over {n_chats} chats")
+    print(f"delivered: {delivered}, 429 responses: {api.rate_limited}")
+    print(f"sequential with sleep(3): {sequential:.1f} s (estimated)")
+    print(f"rate limited sender: {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [40, 3][len(args) :]))
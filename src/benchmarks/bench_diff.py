@@ -0,0 +1,113 @@
+"""
+One poll against a bets database that already stores the previous poll, part of the bets re-priced
+
+Compares the previous id-only dedup (the recent cache, then the ids that are not stored yet are
+inserted), an upsert of every polled bet, and sync_bets which only writes the new and re-priced bets.
+The rows written are counted with SQLite's total_changes.
+
+Usage:
+    python -m src.benchmarks.bench_diff [n_bets] [repriced_fraction] [new_fraction]
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from ..bot_db import Database
+from ..bet_cache import RecentBetCache
+from ..utils import transform_bets, get_bet_prices, sync_bets
+from .payloads import OUTCOME_MAPPING, make_payload
+
+REPEAT = 5
+
+
+def make_polls(n_bets, repriced_fraction, new_fraction):
+    """Build the previous poll and the current one, with re-priced and new bets"""
+
+    n_new = int(n_bets * new_fraction)
+    payload = make_payload(n_bets + n_new)
+    previous = transform_bets(
+        payload["bets"][:n_bets],
+        payload["source"]["value_bets"][:n_bets],
+        OUTCOME_MAPPING,
+    )
+
+    bets = [dict(bet) for bet in payload["bets"][n_new:]]
+    for bet in bets[: int(n_bets * repriced_fraction)]:
+        bet["koef"] = round(bet["koef"] + 0.05, 3)
+        bet["koef_last_modified_at"] += 60_000
+    current = transform_bets(
+        bets, payload["source"]["value_bets"][n_new:], OUTCOME_MAPPING
+    )
+
+    return previous, current
+
+
+def id_only(db, bets_df, cache):
+    known, unknown_ids = cache.lookup(bets_df.id)
+    stored_ids = db.get_prices(unknown_ids)
+    unseen_bets_df = bets_df[
+        bets_df.id.isin(unknown_ids) & ~bets_df.id.isin(stored_ids)
+    ]
+    db.upsert_data(unseen_bets_df.to_dict("records"))
+    cache.update(get_bet_prices(bets_df[bets_df.id.isin(unknown_ids)]))
+
+    return unseen_bets_df, bets_df.iloc[0:0]
+
+
+def upsert_all(db, bets_df, cache):
+    db.upsert_data(bets_df.to_dict("records"))
+    return None
+
+
+def run(name, detect, previous, current, warm_cache):
+    timings, changes = [], None
+    for _ in range(REPEAT):
+        with tempfile.TemporaryDirectory() as directory:
+            with Database(os.path.join(directory, "bets.db")) as db:
+                db.upsert_data(previous.to_dict("records"))
+
+                cache = RecentBetCache()
+                if warm_cache:
+                    cache.warm(db)
+
+                changes_before = db.conn.total_changes
+                start = time.perf_counter()
+                result = detect(db, current, cache)
+                timings.append(time.perf_counter() - start)
+                changes = db.conn.total_changes - changes_before
+
+    new, repriced = (len(result[0]), len(result[1])) if result else ("-", "-")
+    return name, "warm" if warm_cache else "cold", min(timings), changes, new, repriced
+
+
+def main(n_bets, repriced_fraction, new_fraction):
+    previous, current = make_polls(n_bets, repriced_fraction, new_fraction)
+
+    results = []
+    for warm_cache in [False, True]:
+        for name, detect in [
+            ("id only", id_only),
+            ("upsert all", upsert_all),
+            ("sync_bets", sync_bets),
+        ]:
+            results.append(run(name, detect, previous, current, warm_cache))
+
+    print(
+        f"{len(current)} polled bets, {repriced_fraction:.0%} re-priced, {new_fraction:.0%} new"
+    )
+    print(
+        f"{'detection':<11} {'cache':<5} {'ms':>7} {'rows written':>12} {'new':>5} {'re-priced':>9}"
+    )
+    for name, cache, elapsed, changes, new, repriced in results:
+        print(
+            f"{name:<11} {cache:<5} {elapsed * 1000:>7.1f} {changes:>12} {new:>5} {repriced:>9}"
+        )
+
+
+if __name__ == "__main__":
+    n_bets = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    repriced_fraction = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    new_fraction = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    main(n_bets, repriced_fraction, new_fraction)
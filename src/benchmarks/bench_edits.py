@@ -0,0 +1,107 @@
+"""
+Telegram calls of a series of polls where part of the bets are re-priced every poll
+
+Runs send_new_bets of the poller against the Telegram stand-in: the first poll posts every group,
+the next ones re-price a share of the bets. The "post" variant ignores the tracked messages, so
+every re-priced group is posted again like before the messages table, the "edit" variant edits the
+posted message of the group in place.
+
+Usage:
+    python -m src.benchmarks.bench_edits [n_bets] [n_polls] [repriced_fraction]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+from .fixtures import use_temp_config
+from .fake_telegram import FakeTelegramAPI
+from .payloads import OUTCOME_MAPPING, make_payload
+
+CHAT_MAPPING = {"5": "-1005", "7": "-1007", "8": "-1008"}
+
+
+def make_polls(n_bets, n_polls, repriced_fraction):
+    payload = make_payload(n_bets)
+    rng = random.Random(0)
+
+    polls = [payload]
+    for poll in range(1, n_polls):
+        bets = [dict(bet) for bet in polls[-1]["bets"]]
+        for bet in rng.sample(bets, int(n_bets * repriced_fraction)):
+            bet["koef"] = round(bet["koef"] + 0.05, 3)
+            bet["koef_last_modified_at"] += poll * 60_000
+        polls.append({"bets": bets, "source": payload["source"]})
+
+    return polls
+
+
+def run(main, Database, polls, fake_telegram, directory):
+    from ..bet_cache import RecentBetCache
+    from ..utils import transform_bets
+
+    main.RECENT_BETS = RecentBetCache()
+    calls_before = len(fake_telegram.calls)
+
+    start = time.perf_counter()
+    with Database(os.path.join(directory, f"{Database.__name__}.db")) as db:
+        for payload in polls:
+            bets = transform_bets(
+                payload["bets"], payload["source"]["value_bets"], OUTCOME_MAPPING
+            )
+            main.send_new_bets(db, bets)
+    elapsed = time.perf_counter() - start
+
+    calls = fake_telegram.calls[calls_before:]
+    posted = sum(1 for method, _ in calls if method == "sendMessage")
+    edited = sum(1 for method, _ in calls if method == "editMessageText")
+    busiest_chat = max(
+        sum(1 for _, params in calls if str(params["chat_id"]) == chat_id)
+        for chat_id in CHAT_MAPPING.values()
+    )
+
+    return posted, edited, busiest_chat, elapsed
+
+
+def main(n_bets, n_polls, repriced_fraction):
+    polls = make_polls(n_bets, n_polls, repriced_fraction)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, FakeTelegramAPI() as fake_telegram:
+        use_temp_config(directory, TELEGRAM_CHAT_MAPPING=CHAT_MAPPING)
+
+        from .. import main as poller
+        from ..bot_db import Database
+        from ..config import TELEGRAM_PER_CHAT_RATE
+        from ..delivery import TelegramSender
+
+        class PostingDatabase(Database):
+            # No message is ever found, so every re-priced group is posted again
+            def get_message_ids(self, chat_id, groups, chunk_size=250):
+                return {}
+
+        poller.TELEGRAM_SENDER = TelegramSender(
+            "token", global_rate=10_000, per_chat_rate=10_000, api_url=fake_telegram.url
+        )
+        for name, database in [("post", PostingDatabase), ("edit", Database)]:
+            results[name] = run(poller, database, polls, fake_telegram, directory)
+
+    print(
+        f"{n_bets} bets, {n_polls} polls, {repriced_fraction:.0%} of the bets re-priced every poll after the first"
+    )
+    print(
+        f"{'variant':<8} {'posted':>7} {'edited':>7} {'busiest chat':>13} {'at Telegram rate s':>19} {'s':>6}"
+    )
+    for name, (posted, edited, busiest_chat, elapsed) in results.items():
+        print(
+            f"{name:<8} {posted:>7} {edited:>7} {busiest_chat:>13} {busiest_chat / TELEGRAM_PER_CHAT_RATE:>19.0f} {elapsed:>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    n_bets = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_polls = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    repriced_fraction = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    main(n_bets, n_polls, repriced_fraction)
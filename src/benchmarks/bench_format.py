@@ -0,0 +1,80 @@
+"""
+Micro-benchmark of the message formatting: one group at a time vs the batched formatter
+
+Usage:
+    python -m src.benchmarks.bench_format [n_bets] [n_events]
+"""
+
+import sys
+import pytz
+import pandas as pd
+
+from .payloads import OUTCOME_MAPPING, make_payload
+from .bench_transform import best_of
+from ..config import BASE_MESSAGE, TIME_ZONE
+from ..utils import transform_bets, format_messages, get_flag_by_name
+
+
+def group_format_messages(best_bets_df, base_message, time_zone, sport_emoji):
+    """The previous implementation, which formats the groups one at a time"""
+
+    messages_to_send = []
+    for i, df in best_bets_df.groupby(["bookmaker_event_id", "market_and_bet_type"]):
+        cur_msg = base_message
+        bet_group = df.to_dict(orient="records")
+
+        raw_time = pd.to_datetime(bet_group[0]["started_at"])
+        event_time = (
+            pytz.utc.localize(raw_time).astimezone(time_zone).strftime("%A %H:%M")
+        )
+
+        league_info = bet_group[0]["league"].split(".")
+        country_name, league_name = league_info[0], league_info[-1].strip()
+
+        # If the league name is not found, then there is no country name
+        if len(league_info) < 2:
+            country_name = ""
+
+        flag = get_flag_by_name(country_name)
+
+        messages_to_send.append(
+            cur_msg.format(
+                league_name=f"{flag} {league_name}",
+                sport_emoji=sport_emoji,
+                event_name=bet_group[0]["event_name"],
+                bets="\n\t".join([f"- {bet['bet_info']} (1u)" for bet in bet_group]),
+                min_odds=" & ".join(
+                    [str(round(min_odd["min_koef"], 1)) for min_odd in bet_group]
+                ),
+                match_time=event_time,
+                bet_url=bet_group[0]["bet_url"],
+            )
+        )
+
+    return messages_to_send
+
+
+def main(n_bets, n_events):
+    payload = make_payload(n_bets, n_events)
+    bets_df = transform_bets(
+        payload["bets"], payload["source"]["value_bets"], OUTCOME_MAPPING
+    )
+    args = (bets_df, BASE_MESSAGE, TIME_ZONE, "⚽")
+
+    group_time, expected = best_of(group_format_messages, *args)
+    batched_time, actual = best_of(format_messages, *args)
+
+    # Both implementations have to produce the same messages
+    assert expected == actual
+
+    print(f"{len(bets_df):,} bets, {n_events:,} events, {len(actual):,} messages")
+    print(f"{'formatter':<10} {'ms':>8}")
+    print(f"{'per group':<10} {group_time * 1000:>8.1f}")
+    print(f"{'batched':<10} {batched_time * 1000:>8.1f}")
+    print(f"speedup: {group_time / batched_time:.1f}x")
+
+
+if __name__ == "__main__":
+    n_bets = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    n_events = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    main(n_bets, n_events)
@@ -0,0 +1,63 @@
+"""
+Lookup time of Database.get_data for growing numbers of ids
+
+The previous version formatted the ids into the query with str(tuple(ids)), the current one binds
+them as parameters in fixed size chunks.
+
+Usage:
+    python -m src.benchmarks.bench_get_data [n_ids ...]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+from ..bot_db import Database
+from .bench_dedup import bet_id, fill
+
+STORED_ROWS = 200_000
+REPEAT = 5
+
+
+def formatted_get_data(db, ids):
+    ids = tuple(ids)
+    ids_str = str(ids) if len(ids) > 1 else f"('{ids[0]}')"
+    db.cursor.execute(f"SELECT * FROM bets WHERE id IN {ids_str}")
+    return db.cursor.fetchall()
+
+
+def best_of(func, *args):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        rows = func(*args)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), rows
+
+
+def main(sizes):
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with Database(os.path.join(directory, "bets.db")) as db:
+            fill(db.conn, STORED_ROWS)
+
+            print(f"{'ids':>8} {'formatted ms':>13} {'chunked ms':>11}")
+            for n_ids in sizes:
+                # Half of the ids are stored, the other half are not
+                ids = [bet_id(rng.randrange(STORED_ROWS * 2)) for _ in range(n_ids)]
+
+                formatted_time, expected = best_of(formatted_get_data, db, ids)
+                chunked_time, rows = best_of(db.get_data, ids)
+                assert sorted(rows) == sorted(expected)
+
+                print(
+                    f"{n_ids:>8,} {formatted_time * 1000:>13.2f} {chunked_time * 1000:>11.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [500, 5_000, 50_000])
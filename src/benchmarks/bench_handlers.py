@@ -0,0 +1,194 @@
+"""
+Latency of the /start and /endSubscription bot handlers on a catalog of 1k products and 100k subscriptions
+
+The previous handlers looked the price of every product up in the list of all the prices and loaded
+the product of every subscription with its own query. Pass --no-indexes to run without the indexes
+created by database.creator.create_indexes.
+
+Usage:
+    python -m src.benchmarks.bench_handlers [--no-indexes]
+"""
+
+import sys
+import time
+import random
+import asyncio
+import tempfile
+import statistics
+
+from .fixtures import (
+    FakeBot,
+    FakeObject,
+    use_temp_config,
+    use_temp_databases,
+)
+
+N_PRODUCTS = 1_000
+N_CUSTOMERS = 10_000
+N_SUBSCRIPTIONS = 100_000
+REPEAT = 20
+
+
+def fill(database):
+    rng = random.Random(0)
+
+    database.creator.create_tables()
+    database.selector.create_products(
+        [
+            {"name": f"product {i}", "stripe_product_id": f"prod_{i}", "quantity": 1}
+            for i in range(N_PRODUCTS)
+        ]
+    )
+    database.selector.create_prices(
+        [
+            {
+                "stripe_price_id": f"price_{i}",
+                "price": 399,
+                "currency": "sek",
+                "product_id": i + 1,
+            }
+            for i in range(N_PRODUCTS)
+        ]
+    )
+    database.selector.create_customers(
+        [
+            {
+                "name": f"customer {i}",
+                "telegram_user_id": str(i),
+                "telegram_chat_id": str(i),
+                "telegram_temp_payment_message_id": None,
+                "stripe_customer_id": f"cus_{i}",
+            }
+            for i in range(N_CUSTOMERS)
+        ]
+    )
+    database.selector.create_subscriptions(
+        [
+            {
+                "customer_id": rng.randrange(N_CUSTOMERS) + 1,
+                "product_id": rng.randrange(N_PRODUCTS) + 1,
+                "price_id": 1,
+                "stripe_subscription_id": f"sub_{i}",
+                "subscription_first_date": "2024-01-01 00:00:00",
+                "subscription_start_date": "2024-01-01 00:00:00",
+                "subscription_expiry_date": "2024-02-01 00:00:00",
+            }
+            for i in range(N_SUBSCRIPTIONS)
+        ]
+    )
+
+
+async def previous_start(database, update, context):
+    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+    products = database.selector.get_products()
+
+    options = []
+    prices = database.selector.get_prices()
+    for product in products:
+        price = next(filter(lambda price: product["id"] == price["product_id"], prices))
+        button = [
+            InlineKeyboardButton(
+                f"Subscribe to {product['name'].title()}",
+                callback_data=price["stripe_price_id"],
+            )
+        ]
+        options.append(button)
+
+    await context.bot.send_message(
+        chat_id=update.effective_chat.id,
+        text="",
+        reply_markup=InlineKeyboardMarkup(options),
+    )
+
+
+async def previous_cancel_subscription(database, update, context):
+    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+    customers = database.selector.get_customers(
+        telegram_user_id=update.effective_user.id
+    )
+    subscriptions = database.selector.get_subscriptions(customer_id=customers[0]["id"])
+
+    options = []
+    for subscription in subscriptions:
+        product = database.selector.get_products(product_id=subscription["product_id"])[
+            0
+        ]
+        button = [
+            InlineKeyboardButton(
+                f"Cancel {product['name'].title()} subscription",
+                callback_data=subscription["stripe_subscription_id"],
+            )
+        ]
+        options.append(button)
+
+    await context.bot.send_message(
+        chat_id=update.effective_chat.id,
+        text="",
+        reply_markup=InlineKeyboardMarkup(options),
+    )
+
+
+def measure(make_call):
+    latencies = []
+    for i in range(REPEAT):
+        start = time.perf_counter()
+        asyncio.run(make_call(i))
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(latencies)
+
+
+def make_update(user_id):
+    return FakeObject(
+        effective_chat=FakeObject(id=user_id), effective_user=FakeObject(id=user_id)
+    )
+
+
+def main(with_indexes=True):
+    with tempfile.TemporaryDirectory() as directory:
+        use_temp_config(directory)
+        use_temp_databases(directory)
+
+        from .. import database
+        from ..server import telegram_backend
+
+        fill(database)
+        if not with_indexes:
+            with database.connection.transaction() as cursor:
+                for (index_name,) in cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE '%_index'"
+                ).fetchall():
+                    cursor.execute(f"DROP INDEX {index_name}")
+
+        context = FakeObject(bot=FakeBot())
+        user_ids = [str(i * 97 % N_CUSTOMERS) for i in range(REPEAT)]
+
+        results = {
+            "/start": (
+                measure(lambda i: previous_start(database, make_update(i), context)),
+                measure(lambda i: telegram_backend.start(make_update(i), context)),
+            ),
+            "/endSubscription": (
+                measure(
+                    lambda i: previous_cancel_subscription(
+                        database, make_update(user_ids[i]), context
+                    )
+                ),
+                measure(
+                    lambda i: telegram_backend.cancel_subscription(
+                        make_update(user_ids[i]), context
+                    )
+                ),
+            ),
+        }
+
+    print(f"{N_PRODUCTS:,} products, {N_SUBSCRIPTIONS:,} subscriptions")
+    print(f"{'handler':<18} {'previous ms':>12} {'joined ms':>10}")
+    for handler, (previous, joined) in results.items():
+        print(f"{handler:<18} {previous:>12.2f} {joined:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(with_indexes="--no-indexes" not in sys.argv)
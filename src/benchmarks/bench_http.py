@@ -0,0 +1,107 @@
+"""
+Per-request latency against a local keep-alive stub server, with and without the pooled session
+
+The TLS run needs the openssl command line tool to create a self-signed certificate.
+
+Usage:
+    python -m src.benchmarks.bench_http [n_requests] [--tls]
+"""
+
+import os
+import ssl
+import sys
+import time
+import tempfile
+import subprocess
+import urllib3
+import threading
+import statistics
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .. import http_client
+
+RESPONSE_BODY = b'{"ok": true, "result": {}}'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 is needed for the server to keep the connections alive
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_tls_context(directory):
+    cert_file = os.path.join(directory, "cert.pem")
+    key_file = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1"]
+        + ["-subj", "/CN=127.0.0.1", "-keyout", key_file, "-out", cert_file],
+        check=True,
+        capture_output=True,
+    )
+
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+
+    return context
+
+
+def start_stub_server(handler=StubHandler, tls_context=None):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    scheme = "http"
+    if tls_context:
+        server.socket = tls_context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, f"{scheme}://127.0.0.1:{server.server_port}"
+
+
+def measure(send, url, n_requests):
+    latencies = []
+    for _ in range(n_requests):
+        start = time.perf_counter()
+        response = send("POST", url, data={"chat_id": 1, "text": "m"}, verify=False)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    return latencies
+
+
+def main(n_requests, tls=False):
+    # The stub certificate is self-signed
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    with tempfile.TemporaryDirectory() as directory:
+        tls_context = create_tls_context(directory) if tls else None
+        server, url = start_stub_server(tls_context=tls_context)
+
+    results = {
+        "requests.request (new connection)": measure(requests.request, url, n_requests),
+        "http_client.request (pooled)": measure(http_client.request, url, n_requests),
+    }
+    server.shutdown()
+
+    print(f"{'client':<36} {'mean ms':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, latencies in results.items():
+        p99 = statistics.quantiles(latencies, n=100)[98]
+        print(
+            f"{name:<36} {statistics.mean(latencies):>8.3f} "
+            f"{statistics.median(latencies):>8.3f} {p99:>8.3f}"
+        )
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--tls"]
+    main(int(args[0]) if args else 1000, tls="--tls" in sys.argv)
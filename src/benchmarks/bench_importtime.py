@@ -0,0 +1,88 @@
+"""
+Import-time profile of an entry point, from the -X importtime report of a new interpreter
+
+The entry point is profiled several times and the run with the median total is reported: the total
+import time, the modules that take the longest including their own imports, and whether the total
+is within the cold start budget of the poller.
+
+Usage:
+    python -m src.benchmarks.bench_importtime [module] [top] [runs]
+"""
+
+import re
+import sys
+import tempfile
+import subprocess
+
+from .fixtures import use_temp_config
+from .bench_startup import ROOT
+
+# Time the poller may spend importing before its first poll, measured with -X importtime. pandas
+# alone takes about half of it and is needed by the first poll
+COLD_START_BUDGET_MS = 600
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def profile(module):
+    """
+    Import the module in a new interpreter with -X importtime
+
+    Returns:
+        list[tuple[str, int, int, int]] - Name, self and cumulative microseconds and depth of every
+        imported module, in the order of the report
+    """
+
+    report = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+
+    modules = []
+    for line in report.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+
+    return modules
+
+
+def total_ms(modules):
+    return sum(cumulative for _, _, cumulative, depth in modules if depth == 0) / 1000
+
+
+def main(module, top, runs):
+    with tempfile.TemporaryDirectory() as directory:
+        use_temp_config(directory)
+
+        # The first run writes the bytecode, the profiled ones read it like a restart does
+        profile(module)
+        profiles = sorted((profile(module) for _ in range(runs)), key=total_ms)
+
+    modules = profiles[len(profiles) // 2]
+    totals = [total_ms(modules) for modules in profiles]
+
+    print(
+        f"{module}: {total_ms(modules):.1f} ms of imports (median of {runs} runs, "
+        f"{totals[0]:.1f} - {totals[-1]:.1f}), {len(modules)} modules"
+    )
+    print(f"{'module':<40} {'cumulative ms':>13} {'self ms':>8}")
+    for name, self_us, cumulative_us, _ in sorted(
+        modules, key=lambda module: module[2], reverse=True
+    )[:top]:
+        print(f"{name:<40} {cumulative_us / 1000:>13.1f} {self_us / 1000:>8.1f}")
+
+    if module == "src.main":
+        status = "within" if total_ms(modules) <= COLD_START_BUDGET_MS else "over"
+        print(f"{status} the cold start budget of {COLD_START_BUDGET_MS} ms")
+
+
+if __name__ == "__main__":
+    module = sys.argv[1] if len(sys.argv) > 1 else "src.main"
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 11
+    main(module, top, runs)
@@ -0,0 +1,75 @@
+"""
+Invite links of a product with many groups, one group at a time and through the invite link cache
+
+The first run creates the links of every group for a single buyer, the second one is a burst of
+buyers of the same product, where the previous loop created a link per group for every buyer.
+
+Usage:
+    python -m src.benchmarks.bench_invite_links [n_groups] [n_buyers] [telegram_latency_seconds]
+"""
+
+import sys
+import time
+import asyncio
+
+from .fake_telegram import FakeTelegramAPI
+
+
+async def previous_get_links(telegram_bot, groups):
+    links = []
+    for group in groups:
+        params = {
+            "chat_id": group["telegram_group_id"],
+            "expire_date": int(time.time() + 60 * 60),
+            "creates_join_request": True,
+        }
+        chat_link = await telegram_bot.create_chat_invite_link(**params)
+        links.append(chat_link.invite_link)
+
+    return links
+
+
+async def run(api_url, get_links, groups, n_buyers):
+    from telegram import Bot
+
+    async with Bot("123:bench", base_url=f"{api_url}/bot") as telegram_bot:
+        start = time.perf_counter()
+        buyer_links = await asyncio.gather(
+            *[get_links(telegram_bot, groups) for _ in range(n_buyers)]
+        )
+        elapsed = time.perf_counter() - start
+
+    assert all(len(links) == len(groups) for links in buyer_links)
+    assert "N/A" not in buyer_links[0]
+
+    return elapsed * 1000
+
+
+def main(n_groups, n_buyers, latency):
+    from ..server.invite_links import InviteLinkCache
+
+    groups = [{"telegram_group_id": f"-100{i}"} for i in range(n_groups)]
+
+    results = []
+    with FakeTelegramAPI(latency=latency) as fake_telegram:
+        for buyers in [1, n_buyers]:
+            for name, get_links in [
+                ("one at a time", previous_get_links),
+                ("cache", InviteLinkCache().get_links),
+            ]:
+                created_before = fake_telegram.count("createChatInviteLink")
+                elapsed = asyncio.run(run(fake_telegram.url, get_links, groups, buyers))
+                created = fake_telegram.count("createChatInviteLink") - created_before
+                results.append((buyers, name, elapsed, created))
+
+    print(f"{n_groups} groups, {latency * 1000:.0f} ms per Telegram call")
+    print(f"{'buyers':>6} {'links':<14} {'total ms':>9} {'links created':>14}")
+    for buyers, name, elapsed, created in results:
+        print(f"{buyers:>6} {name:<14} {elapsed:>9.0f} {created:>14}")
+
+
+if __name__ == "__main__":
+    n_groups = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    n_buyers = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    main(n_groups, n_buyers, latency)
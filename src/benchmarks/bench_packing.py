@@ -0,0 +1,92 @@
+"""
+Telegram messages per poll with and without packing the groups of an event or a league together
+
+Runs send_new_bets of the poller against the Telegram stand-in for every TELEGRAM_MESSAGE_PACKING
+mode: the first poll posts every bet, the next ones re-price a share of the bets, which edits the
+messages that show them. The delivery time is the number of messages of the busiest chat at
+Telegram's per chat rate.
+
+Usage:
+    python -m src.benchmarks.bench_packing [n_bets] [n_polls] [repriced_fraction]
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from .fixtures import use_temp_config
+from .fake_telegram import FakeTelegramAPI, RATE_LIMITED_METHODS
+from .payloads import OUTCOME_MAPPING
+from .bench_edits import CHAT_MAPPING, make_polls
+
+
+def run(main, packing, polls, fake_telegram, directory):
+    from ..bet_cache import RecentBetCache
+    from ..utils import transform_bets, get_message_length
+
+    main.RECENT_BETS = RecentBetCache()
+    main.TELEGRAM_MESSAGE_PACKING = packing
+
+    cycles = []
+    with main.Database(os.path.join(directory, f"{packing}.db")) as db:
+        for payload in polls:
+            bets = transform_bets(
+                payload["bets"], payload["source"]["value_bets"], OUTCOME_MAPPING
+            )
+
+            calls_before = len(fake_telegram.calls)
+            start = time.perf_counter()
+            main.send_new_bets(db, bets)
+            elapsed = time.perf_counter() - start
+
+            calls = [
+                (method, params)
+                for method, params in fake_telegram.calls[calls_before:]
+                if method in RATE_LIMITED_METHODS
+            ]
+            busiest_chat = max(
+                sum(1 for _, params in calls if str(params["chat_id"]) == chat_id)
+                for chat_id in CHAT_MAPPING.values()
+            )
+            longest = max(get_message_length(params["text"]) for _, params in calls)
+            cycles.append((len(calls), busiest_chat, longest, elapsed))
+
+    return cycles
+
+
+def main(n_bets, n_polls, repriced_fraction):
+    polls = make_polls(n_bets, n_polls, repriced_fraction)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, FakeTelegramAPI() as fake_telegram:
+        use_temp_config(directory, TELEGRAM_CHAT_MAPPING=CHAT_MAPPING)
+
+        from .. import main as poller
+        from ..config import TELEGRAM_PER_CHAT_RATE
+        from ..delivery import TelegramSender
+
+        poller.TELEGRAM_SENDER = TelegramSender(
+            "token", global_rate=10_000, per_chat_rate=10_000, api_url=fake_telegram.url
+        )
+        for packing in [None, "event", "league"]:
+            results[packing] = run(poller, packing, polls, fake_telegram, directory)
+
+    print(
+        f"{n_bets} bets, {n_polls} polls, {repriced_fraction:.0%} of the bets re-priced every poll after the first"
+    )
+    print(
+        f"{'packing':<8} {'poll':>4} {'messages':>9} {'busiest chat':>13} {'at Telegram rate s':>19} {'longest':>8} {'s':>6}"
+    )
+    for packing, cycles in results.items():
+        for poll, (messages, busiest_chat, longest, elapsed) in enumerate(cycles, 1):
+            print(
+                f"{str(packing):<8} {poll:>4} {messages:>9} {busiest_chat:>13} {busiest_chat / TELEGRAM_PER_CHAT_RATE:>19.0f} {longest:>8} {elapsed:>6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    n_bets = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    n_polls = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    repriced_fraction = float(sys.argv[3]) if len(sys.argv) > 3 else 0.1
+    main(n_bets, n_polls, repriced_fraction)
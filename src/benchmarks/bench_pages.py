@@ -0,0 +1,178 @@
+"""
+Paging through the BetBurger search against a local stand-in with a fixed latency per request
+
+Compares the previous single request (which dropped every bet past the first page), fetching the
+pages one after the other, and iter_bets which fetches the pages concurrently and yields each page as
+it arrives. The last run polls again with every bet already seen at the same price, which stops after
+the first page.
+
+Usage:
+    python -m src.benchmarks.bench_pages [latency_seconds]
+"""
+
+import sys
+import json
+import time
+import threading
+from urllib.parse import parse_qsl
+from http.server import BaseHTTPRequestHandler
+
+from .fake_telegram import StubServer
+from .payloads import OUTCOME_MAPPING, make_payload
+
+PER_PAGE = 500
+
+
+class FakeBetBurgerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        status, result = self.server.api.search(dict(parse_qsl(body.decode())))
+
+        body = json.dumps(result).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeBetBurgerAPI:
+    """
+    Local stand-in for the bot_pro_search endpoint, serving a payload a page at a time
+
+    Args:
+        payload: dict - The bets of the filter, as returned by make_payload
+        latency: float (Optional) - Seconds to wait before answering each request
+    """
+
+    def __init__(self, payload, latency=0.0):
+        self.payload = payload
+        self.latency = latency
+
+        self.requests = 0
+        self.lock = threading.Lock()
+
+        self.server = StubServer(("127.0.0.1", 0), FakeBetBurgerHandler)
+        self.server.api = self
+        self.url = f"http://127.0.0.1:{self.server.server_port}/bot_pro_search"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def search(self, params):
+        time.sleep(self.latency)
+        with self.lock:
+            self.requests += 1
+
+        per_page = int(params["per_page"])
+        start = (int(params.get("page", 1)) - 1) * per_page
+        end = start + per_page
+
+        return 200, {
+            "bets": self.payload["bets"][start:end],
+            "source": {"value_bets": self.payload["source"]["value_bets"][start:end]},
+            "total": len(self.payload["bets"]),
+        }
+
+
+def first_page_only(utils):
+    return [utils.process_bets("token", 1, PER_PAGE)]
+
+
+def page_by_page(utils):
+    import pandas as pd
+
+    pages, page = [], 1
+    while True:
+        response_json = utils.fetch_bets_page("token", 1, page, PER_PAGE)
+        pages.append(response_json)
+        if len(response_json["bets"]) < PER_PAGE:
+            break
+        page += 1
+
+    # Nothing can be sent before the last page, like the single DataFrame of the previous version
+    bets = [
+        utils.transform_bets(
+            response_json["bets"],
+            response_json["source"]["value_bets"],
+            OUTCOME_MAPPING,
+        )
+        for response_json in pages
+    ]
+    yield pd.concat(bets, ignore_index=True)
+
+
+def run(fetch, fake_betburger):
+    requests_before = fake_betburger.requests
+    start = time.perf_counter()
+    first = None
+    n_bets = 0
+    for bets in fetch():
+        first = first or time.perf_counter() - start
+        n_bets += len(bets)
+    elapsed = time.perf_counter() - start
+
+    return first or elapsed, elapsed, n_bets, fake_betburger.requests - requests_before
+
+
+def main(latency):
+    from .. import utils
+    from ..bet_cache import RecentBetCache
+    from ..bet_mapping import BETTING_MAPPING
+
+    # The outcome mapping is served from memory like after the first poll
+    BETTING_MAPPING.mappings = dict(OUTCOME_MAPPING)
+    BETTING_MAPPING.fetched_at = time.time()
+
+    results = []
+    for n_pages in [1, 5, 20]:
+        payload = make_payload(n_pages * PER_PAGE)
+
+        # A cache that already saw every bet at its current price
+        cache = RecentBetCache()
+        cache.update(
+            utils.get_bet_prices(
+                utils.transform_bets(
+                    payload["bets"], payload["source"]["value_bets"], OUTCOME_MAPPING
+                )
+            )
+        )
+
+        with FakeBetBurgerAPI(payload, latency) as fake_betburger:
+            utils.BET_BURGER_SEARCH_URL = fake_betburger.url
+
+            for name, fetch in [
+                ("first page only", lambda: first_page_only(utils)),
+                ("page by page", lambda: page_by_page(utils)),
+                ("iter_bets", lambda: utils.iter_bets("token", 1, per_page=PER_PAGE)),
+                (
+                    "iter_bets, all seen",
+                    lambda: utils.iter_bets("token", 1, cache, PER_PAGE),
+                ),
+            ]:
+                results.append((n_pages, name) + run(fetch, fake_betburger))
+
+    print(f"{latency * 1000:.0f} ms per request, {PER_PAGE} bets per page")
+    print(
+        f"{'pages':>5} {'fetch':<20} {'first bets ms':>13} {'total ms':>9} {'bets':>6} {'requests':>8}"
+    )
+    for n_pages, name, first, elapsed, n_bets, requests in results:
+        print(
+            f"{n_pages:>5} {name:<20} {first * 1000:>13.0f} {elapsed * 1000:>9.0f} {n_bets:>6} {requests:>8}"
+        )
+
+
+if __name__ == "__main__":
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.2
+    main(latency)
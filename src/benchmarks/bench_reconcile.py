@@ -0,0 +1,119 @@
+"""
+Telegram calls to remove the posts of the bets that left the feed between two polls
+
+The first poll posts every group through send_new_bets, the second one only returns part of the
+bets and delete_vanished_messages removes the posts of the groups that are gone. The "one by one"
+variant deletes a single message per call, like deleteMessage, the "batched" variant deletes up to
+TELEGRAM_DELETE_BATCH_SIZE messages per deleteMessages call. A third poll returns every bet at the
+same price, the groups whose message was deleted must be posted again.
+
+Usage:
+    python -m src.benchmarks.bench_reconcile [n_bets] [vanished_fraction]
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from .fixtures import use_temp_config
+from .fake_telegram import FakeTelegramAPI
+from .payloads import OUTCOME_MAPPING, make_payload
+
+CHAT_MAPPING = {"5": "-1005", "7": "-1007", "8": "-1008"}
+
+
+def run(main, delivery, batch_size, payload, n_kept, fake_telegram, directory):
+    from ..bet_cache import RecentBetCache
+    from ..utils import transform_bets
+
+    main.RECENT_BETS = RecentBetCache()
+    main.TELEGRAM_DELETE_BATCH_SIZE = delivery.TELEGRAM_DELETE_BATCH_SIZE = batch_size
+
+    all_bets = transform_bets(
+        payload["bets"], payload["source"]["value_bets"], OUTCOME_MAPPING
+    )
+
+    with main.Database(os.path.join(directory, f"{batch_size}.db")) as db:
+        main.send_new_bets(db, all_bets)
+        posted = len(db.get_messages())
+
+        kept = transform_bets(
+            payload["bets"][:n_kept],
+            payload["source"]["value_bets"][:n_kept],
+            OUTCOME_MAPPING,
+        )
+        polled_groups = set(zip(kept.bookmaker_event_id, kept.market_and_bet_type))
+
+        calls_before = len(fake_telegram.calls)
+        start = time.perf_counter()
+        main.delete_vanished_messages(db, polled_groups)
+        elapsed = time.perf_counter() - start
+
+        remaining = len(db.get_messages())
+        calls = fake_telegram.calls[calls_before:]
+
+        # Every bet comes back at the same price, the deleted groups are posted again
+        main.send_new_bets(db, all_bets)
+        returned = len(db.get_messages())
+        assert returned == posted, f"{posted - returned} groups were not posted again"
+
+    busiest_chat = max(
+        sum(1 for _, params in calls if str(params["chat_id"]) == chat_id)
+        for chat_id in CHAT_MAPPING.values()
+    )
+
+    return (
+        posted,
+        posted - remaining,
+        len(calls),
+        busiest_chat,
+        elapsed,
+        returned - remaining,
+    )
+
+
+def main(n_bets, vanished_fraction):
+    payload = make_payload(n_bets)
+    n_kept = n_bets - int(n_bets * vanished_fraction)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, FakeTelegramAPI() as fake_telegram:
+        use_temp_config(directory, TELEGRAM_CHAT_MAPPING=CHAT_MAPPING)
+
+        from .. import main as poller
+        from .. import delivery
+        from ..config import TELEGRAM_PER_CHAT_RATE, TELEGRAM_DELETE_BATCH_SIZE
+
+        poller.TELEGRAM_SENDER = delivery.TelegramSender(
+            "token", global_rate=10_000, per_chat_rate=10_000, api_url=fake_telegram.url
+        )
+        for name, batch_size in [
+            ("one by one", 1),
+            ("batched", TELEGRAM_DELETE_BATCH_SIZE),
+        ]:
+            results[name] = run(
+                poller, delivery, batch_size, payload, n_kept, fake_telegram, directory
+            )
+
+    print(f"{n_bets} bets, {vanished_fraction:.0%} of them gone at the second poll")
+    print(
+        f"{'variant':<11} {'posted':>7} {'deleted':>8} {'calls':>6} {'busiest chat':>13} {'at Telegram rate s':>19} {'s':>6} {'reposted':>9}"
+    )
+    for name, (
+        posted,
+        deleted,
+        calls,
+        busiest_chat,
+        elapsed,
+        reposted,
+    ) in results.items():
+        print(
+            f"{name:<11} {posted:>7} {deleted:>8} {calls:>6} {busiest_chat:>13} {busiest_chat / TELEGRAM_PER_CHAT_RATE:>19.0f} {elapsed:>6.2f} {reposted:>9}"
+        )
+
+
+if __name__ == "__main__":
+    n_bets = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    vanished_fraction = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    main(n_bets, vanished_fraction)
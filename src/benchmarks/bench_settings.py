@@ -0,0 +1,85 @@
+"""
+get_base_url() through a new connection, a query on the shared connection and the settings store
+
+Also checks that the store sends no statement to SQLite once loaded, and that it picks up a URL
+written by another connection (another process) and by update_ngrok_url in this process.
+
+Usage:
+    python -m src.benchmarks.bench_settings
+"""
+
+import time
+import sqlite3
+import tempfile
+
+from .fixtures import use_temp_config, use_temp_databases
+
+REPEAT = 10_000
+
+
+def connect_base_url(database):
+    # What get_base_url did before the shared connections, a new connection for every call
+    conn = sqlite3.connect(database.connection.BACKEND_DB_NAME)
+    try:
+        return conn.execute(
+            'SELECT value FROM settings WHERE name = "base_url"'
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def query_base_url(database):
+    with database.connection.transaction(database.connection.BACKEND_DB_NAME) as cursor:
+        cursor.execute('SELECT value FROM settings WHERE name = "base_url"')
+        return cursor.fetchone()[0]
+
+
+def measure(get_base_url):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        get_base_url()
+
+    return (time.perf_counter() - start) * 1_000_000 / REPEAT
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        use_temp_config(directory)
+        use_temp_databases(directory)
+
+        from .. import database
+
+        database.updater.update_ngrok_url("https://first.ngrok.app")
+
+        connect_us = measure(lambda: connect_base_url(database))
+        query_us = measure(lambda: query_base_url(database))
+        store_us = measure(database.selector.get_base_url)
+
+        # Count the statements sent to SQLite by the loaded store
+        statements = []
+        conn = database.connection.get_connection(database.connection.BACKEND_DB_NAME)
+        conn.set_trace_callback(statements.append)
+        measure(database.selector.get_base_url)
+        conn.set_trace_callback(None)
+        assert not statements, statements
+
+        other_process = sqlite3.connect(database.connection.BACKEND_DB_NAME)
+        with other_process:
+            other_process.execute(
+                "UPDATE settings SET value = 'https://second.ngrok.app' WHERE name = 'base_url'"
+            )
+        other_process.close()
+        assert database.selector.get_base_url() == "https://second.ngrok.app"
+
+        database.updater.update_ngrok_url("https://third.ngrok.app")
+        assert database.selector.get_base_url() == "https://third.ngrok.app"
+
+    print(f"{'source':<10} {'us/call':>8}")
+    print(f"{'connect':<10} {connect_us:>8.1f}")
+    print(f"{'query':<10} {query_us:>8.1f}")
+    print(f"{'store':<10} {store_us:>8.1f}")
+    print(f"SQLite statements once loaded: {len(statements)}")
+
+
+if __name__ == "__main__":
+    main()
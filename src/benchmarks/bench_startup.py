@@ -0,0 +1,86 @@
+"""
+Import time and memory of the entry points, every run in a new interpreter
+
+Each entry point is imported in a fresh process, which reports the seconds spent in the import and
+its peak RSS. The "flag lookup" row also looks up a country flag after importing src.utils, which is
+when the flags table is loaded.
+
+Usage:
+    python -m src.benchmarks.bench_startup [runs]
+"""
+
+import os
+import sys
+import json
+import tempfile
+import statistics
+import subprocess
+
+from .fixtures import use_temp_config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ENTRY_POINTS = {
+    "src.main": "import src.main",
+    "src.delivery": "import src.delivery",
+    "src.server.stripe_backend": "import src.server.stripe_backend",
+    "src.server.telegram_backend": "import src.server.telegram_backend",
+    "src.utils": "import src.utils",
+    "src.flags": "import src.flags",
+    "flag lookup": "import src.utils; src.utils.get_flag_by_name('Spain')",
+}
+
+MEASURE = """
+import json, time, resource
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss]))
+"""
+
+
+def measure(statement):
+    """
+    Run the statement in a new interpreter
+
+    Returns:
+        tuple[float, int] - Seconds spent in the statement and peak RSS in KiB
+    """
+
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE.format(statement=statement)],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    elapsed, max_rss = json.loads(output.splitlines()[-1])
+
+    return elapsed, max_rss
+
+
+def main(runs):
+    with tempfile.TemporaryDirectory() as directory:
+        use_temp_config(directory)
+
+        # The bytecode is written once so that every measured run reads the same cached files
+        for statement in ENTRY_POINTS.values():
+            measure(statement)
+
+        results = {}
+        for name, statement in ENTRY_POINTS.items():
+            samples = [measure(statement) for _ in range(runs)]
+            results[name] = (
+                statistics.median(elapsed for elapsed, _ in samples),
+                statistics.median(max_rss for _, max_rss in samples),
+            )
+
+    print(f"median of {runs} runs")
+    print(f"{'entry point':<28} {'import ms':>10} {'RSS MiB':>8}")
+    for name, (elapsed, max_rss) in results.items():
+        print(f"{name:<28} {elapsed * 1000:>10.1f} {max_rss / 1024:>8.1f}")
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    main(runs)
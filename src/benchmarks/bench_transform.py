@@ -0,0 +1,123 @@
+"""
+Micro-benchmark of the bet transform: the row-wise apply implementation vs the vectorized one
+
+Usage:
+    python -m src.benchmarks.bench_transform [n_rows ...]
+"""
+
+import sys
+import time
+import pandas as pd
+
+from .payloads import OUTCOME_MAPPING, make_payload
+from ..config import URL_MAPPING, MIN_ODDS_FACTOR
+from ..utils import transform_bets
+
+COLUMNS = [
+    "id",
+    "market_and_bet_type",
+    "market_and_bet_type_param",
+    "bookmaker_event_id",
+    "bookmaker_id",
+    "league",
+    "event_name",
+    "home",
+    "away",
+    "sport_id",
+    "swap_teams",
+    "started_at",
+    "koef_last_modified_at",
+    "bookmaker_event_direct_link",
+    "koef",
+]
+
+
+def apply_transform(outcomes, value_bets, outcome_mapping):
+    """The previous implementation, with one DataFrame.apply(axis=1) per derived column"""
+
+    value_bets_df = pd.DataFrame(value_bets)[["bet_id", "avg_koef", "percent"]]
+    best_bets_df = (
+        pd.DataFrame(outcomes)[COLUMNS]
+        .merge(value_bets_df, left_on="id", right_on="bet_id", how="left")
+        .astype(
+            {
+                "market_and_bet_type_param": str,
+                "started_at": "datetime64[s]",
+                "koef_last_modified_at": "datetime64[ms]",
+                "home": "str",
+                "away": "str",
+            }
+        )
+    )
+    best_bets_df = best_bets_df[~best_bets_df.avg_koef.isna()]
+    best_bets_df["min_koef"] = best_bets_df["koef"] * MIN_ODDS_FACTOR
+    best_bets_df["outcome_name"] = (
+        best_bets_df["market_and_bet_type"].map(outcome_mapping).fillna("Unknown")
+    )
+    best_bets_df["bet_url"] = (
+        best_bets_df["bookmaker_id"].map(URL_MAPPING).fillna("{bookmaker_event_link}")
+    )
+    best_bets_df["bet_url"] = best_bets_df.apply(
+        lambda row: row["bet_url"].replace(
+            "{bookmaker_event_link}",
+            (
+                row["bookmaker_event_direct_link"]
+                if not pd.isna(row["bookmaker_event_direct_link"])
+                else "null"
+            ),
+        ),
+        axis=1,
+    )
+    best_bets_df["outcome_name"] = best_bets_df.apply(
+        lambda row: (
+            row["outcome_name"]
+            .replace("Team1", row["home"])
+            .replace("Team2", row["away"])
+            .replace("%s", row["market_and_bet_type_param"])
+            if row["swap_teams"] == False
+            else row["outcome_name"]
+            .replace("Team1", row["away"])
+            .replace("Team2", row["home"])
+            .replace("%s", row["market_and_bet_type_param"])
+        ),
+        axis=1,
+    )
+    best_bets_df["bet_info"] = best_bets_df.apply(
+        lambda row: f"{row['outcome_name']} @ {round(row['koef'], 2)}", axis=1
+    )
+
+    return best_bets_df
+
+
+def best_of(func, *args, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), result
+
+
+def main(sizes):
+
+    print(f"{'rows':>8} {'apply rows/s':>14} {'vectorized rows/s':>18} {'speedup':>8}")
+    for n_rows in sizes:
+        payload = make_payload(n_rows)
+        args = (payload["bets"], payload["source"]["value_bets"], OUTCOME_MAPPING)
+
+        apply_time, expected = best_of(apply_transform, *args)
+        vectorized_time, actual = best_of(transform_bets, *args)
+
+        # Both implementations have to produce the same messages
+        for column in ["bet_url", "bet_info"]:
+            assert list(expected[column]) == list(actual[column]), column
+
+        print(
+            f"{n_rows:>8} {n_rows / apply_time:>14,.0f} "
+            f"{n_rows / vectorized_time:>18,.0f} {apply_time / vectorized_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [500, 5_000, 50_000])
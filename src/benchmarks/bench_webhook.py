@@ -0,0 +1,269 @@
+"""
+Latency of /payment_webhook under a burst of Stripe events, applied inline and through the outbox
+
+Every subscription gets a customer.subscription.created and an invoice.paid event, every event is
+delivered twice like Stripe does when it retries, and the deliveries are shuffled. The inline variant
+applies each event in the request and answers with a 500 when it can't be applied yet, the outbox variant stores it and lets the StripeEventWorker apply
+it. Both must end with the same subscriptions and apply every event once.
+
+Usage:
+    python -m src.benchmarks.bench_webhook [n_subscriptions] [concurrency]
+"""
+
+import os
+import sys
+import hmac
+import json
+import time
+import hashlib
+import random
+import asyncio
+import tempfile
+import statistics
+
+from .fixtures import use_temp_config, use_temp_databases
+from .fake_telegram import FakeTelegramAPI
+
+PERIOD = 30 * 24 * 60 * 60
+
+# The webhook only stores the events signed with this secret
+WEBHOOK_SECRET = "whsec_bench"
+
+# Seconds before the worker retries an invoice that arrived before its subscription
+RETRY_DELAY = 0.1
+
+
+def make_events(n_subscriptions):
+    now = int(time.time())
+    events = []
+    for i in range(n_subscriptions):
+        events.append(
+            {
+                "id": f"evt_created_{i}",
+                "type": "customer.subscription.created",
+                "created": now,
+                "data": {
+                    "object": {
+                        "id": f"sub_{i}",
+                        "object": "subscription",
+                        "customer": f"cus_{i}",
+                        "start_date": now,
+                        "current_period_start": now,
+                        "current_period_end": now + PERIOD,
+                        "items": {"data": [{"price": {"id": "price_0"}}]},
+                    }
+                },
+            }
+        )
+        events.append(
+            {
+                "id": f"evt_invoice_{i}",
+                "type": "invoice.paid",
+                "created": now + 1,
+                "data": {
+                    "object": {
+                        "id": f"in_{i}",
+                        "object": "invoice",
+                        "subscription": f"sub_{i}",
+                        "lines": {
+                            "data": [
+                                {
+                                    "period": {
+                                        "start": now + PERIOD,
+                                        "end": now + 2 * PERIOD,
+                                    }
+                                }
+                            ]
+                        },
+                    }
+                },
+            }
+        )
+
+    # Every event is delivered twice and in no particular order
+    deliveries = events + events
+    random.Random(0).shuffle(deliveries)
+
+    return deliveries
+
+
+def fill(database, n_subscriptions):
+    database.creator.create_tables()
+    database.selector.create_products(
+        [{"name": "product", "stripe_product_id": "prod_0", "quantity": 1}]
+    )
+    database.selector.create_prices(
+        [
+            {
+                "stripe_price_id": "price_0",
+                "price": 399,
+                "currency": "sek",
+                "product_id": 1,
+            }
+        ]
+    )
+    database.selector.create_customers(
+        [
+            {
+                "name": f"customer {i}",
+                "telegram_user_id": str(i),
+                "telegram_chat_id": str(i),
+                "telegram_temp_payment_message_id": None,
+                "stripe_customer_id": f"cus_{i}",
+            }
+            for i in range(n_subscriptions)
+        ]
+    )
+
+
+def create_inline_app(database):
+    from fastapi import FastAPI, Request
+    from fastapi.responses import JSONResponse
+
+    inline_app = FastAPI()
+
+    @inline_app.post("/payment_webhook")
+    async def stripe_webhook(request: Request):
+        event = json.loads(await request.body())
+        database.stripe_events.create_stripe_event(event)
+
+        stored_event = {**event, "payload": json.dumps(event)}
+        if not database.stripe_events.process_stripe_event(stored_event):
+            return JSONResponse({"error": "Event not applied"}, status_code=500)
+
+        return JSONResponse(content={}, status_code=200)
+
+    return inline_app
+
+
+def sign(payload):
+    """Stripe-Signature header of a payload, signed like Stripe does"""
+
+    timestamp = int(time.time())
+    signature = hmac.new(
+        WEBHOOK_SECRET.encode(), f"{timestamp}.{payload}".encode(), hashlib.sha256
+    ).hexdigest()
+
+    return f"t={timestamp},v1={signature}"
+
+
+async def deliver(client, event, semaphore):
+    """Deliver an event until it is acknowledged, like Stripe, and return the latency of every request"""
+
+    payload = json.dumps(event)
+
+    latencies = []
+    while True:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                "/payment_webhook",
+                content=payload,
+                headers={"Stripe-Signature": sign(payload)},
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        if response.status_code == 200:
+            return latencies
+
+        await asyncio.sleep(RETRY_DELAY)
+
+
+async def run(database, app, deliveries, concurrency):
+    import httpx
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # The lifespan is entered by hand because httpx.ASGITransport doesn't run it
+    async with app.router.lifespan_context(app):
+        worker = getattr(app.state, "stripe_event_worker", None)
+        if worker:
+            worker.poll_interval = worker.retry_delay = RETRY_DELAY
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            start = time.perf_counter()
+            latencies = await asyncio.gather(
+                *[deliver(client, event, semaphore) for event in deliveries]
+            )
+            latencies = [latency for retries in latencies for latency in retries]
+            acknowledged = time.perf_counter() - start
+
+            # Wait for the worker to empty the outbox, including the invoices retried after their subscription
+            while database.stripe_events.get_pending_stripe_events(1, retry_delay=0):
+                await asyncio.sleep(0.01)
+            applied = time.perf_counter() - start
+
+    return latencies, acknowledged, applied
+
+
+def check(database, n_subscriptions):
+    with database.connection.transaction() as cursor:
+        subscriptions, expiries = cursor.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT subscription_expiry_date) FROM subscriptions"
+        ).fetchone()
+        processed, retried = cursor.execute(
+            "SELECT COUNT(*), SUM(attempts > 1) FROM stripe_events WHERE processed_at IS NOT NULL"
+        ).fetchone()
+
+    assert subscriptions == n_subscriptions, subscriptions
+    assert processed == 2 * n_subscriptions, processed
+
+    # Every subscription ends on the period paid by its invoice
+    assert expiries == 1, expiries
+
+    return retried
+
+
+def main(n_subscriptions, concurrency):
+    deliveries = make_events(n_subscriptions)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory, FakeTelegramAPI() as fake_telegram:
+        use_temp_config(directory)
+        os.environ["STRIPE_WEBHOOK_SECRET"] = WEBHOOK_SECRET
+        os.environ["STATIC_DIR"] = os.path.join(
+            os.path.dirname(os.path.dirname(__file__)), "client"
+        )
+
+        from .. import database
+        from ..server import stripe_backend
+
+        stripe_backend.TELEGRAM_API_URL = fake_telegram.url
+
+        for name, create_app in [
+            ("inline", create_inline_app),
+            ("outbox", lambda database: stripe_backend.app),
+        ]:
+            run_directory = os.path.join(directory, name)
+            os.mkdir(run_directory)
+            use_temp_databases(run_directory)
+            fill(database, n_subscriptions)
+
+            results[name] = asyncio.run(
+                run(database, create_app(database), deliveries, concurrency)
+            ) + (
+                check(database, n_subscriptions),
+            )
+
+    print(
+        f"{len(deliveries)} deliveries of {len(deliveries) // 2} events, {concurrency} at a time"
+    )
+    print(
+        f"{'webhook':<8} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7} {'acked s':>8} {'applied s':>10} {'retried':>8}"
+    )
+    for name, (latencies, acknowledged, applied, retried) in results.items():
+        latencies = sorted(latencies)
+        p50 = statistics.median(latencies)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"{name:<8} {p50:>7.2f} {p95:>7.2f} {latencies[-1]:>7.2f} {acknowledged:>8.2f} {applied:>10.2f} {retried:>8}"
+        )
+
+
+if __name__ == "__main__":
+    n_subscriptions = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    main(n_subscriptions, concurrency)
@@ -0,0 +1,127 @@
+import json
+import time
+import threading
+from urllib.parse import urlsplit, parse_qsl
+from http.server import BaseHTTPRequestHandler
+
+from .fake_telegram import StubServer
+
+
+class FakeStripeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.handle_api_call()
+
+    def do_POST(self):
+        self.handle_api_call()
+
+    def handle_api_call(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        params = dict(parse_qsl(body.decode()))
+        status, result = self.server.api.call(
+            self.command, urlsplit(self.path).path, params
+        )
+
+        body = json.dumps(result).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeStripeAPI:
+    """
+    Local stand-in for the parts of the Stripe API used by the backend
+
+    Checkout session "cs_<n>" belongs to customer "cus_<n>" and subscription "sub_<n>", and every
+    subscription is on the price given to the constructor. Point stripe.api_base at .url to use it.
+
+    Args:
+        latency: float (Optional) - Seconds to wait before answering each call
+        price_id: str (Optional) - Stripe price id of the subscriptions
+    """
+
+    def __init__(self, latency=0.0, price_id="price_0"):
+        self.latency = latency
+        self.price_id = price_id
+
+        self.calls = []
+        self.next_session = 0
+        self.lock = threading.Lock()
+
+        self.server = StubServer(("127.0.0.1", 0), FakeStripeHandler)
+        self.server.api = self
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def call(self, method, path, params):
+        time.sleep(self.latency)
+
+        with self.lock:
+            self.calls.append((method, path, params))
+
+            parts = path.strip("/").split("/")[1:]
+            if parts == ["checkout", "sessions"]:
+                session_id = f"cs_{self.next_session}"
+                self.next_session += 1
+                return 200, self.session(session_id)
+
+            if parts[:2] == ["checkout", "sessions"]:
+                session = self.session(parts[2])
+                if parts[3:] == ["expire"]:
+                    session["status"] = "expired"
+                return 200, session
+
+            if parts[0] == "subscriptions":
+                return 200, self.subscription(parts[1])
+
+            if parts[0] == "customers":
+                number = parts[1].split("_")[-1]
+                return 200, {
+                    "id": parts[1],
+                    "object": "customer",
+                    "name": f"customer {number}",
+                }
+
+        return 404, {"error": {"message": f"Unknown path {path}"}}
+
+    def session(self, session_id):
+        number = session_id.split("_")[-1]
+        return {
+            "id": session_id,
+            "object": "checkout.session",
+            "status": "complete",
+            "customer": f"cus_{number}",
+            "subscription": f"sub_{number}",
+        }
+
+    def subscription(self, subscription_id):
+        now = int(time.time())
+        return {
+            "id": subscription_id,
+            "object": "subscription",
+            "start_date": now,
+            "current_period_start": now,
+            "current_period_end": now + 30 * 24 * 60 * 60,
+            "plan": {"id": self.price_id, "object": "plan"},
+        }
+
+    def count(self, method, path_prefix):
+        return sum(
+            1
+            for called_method, path, _ in self.calls
+            if called_method == method and path.startswith(path_prefix)
+        )
@@ -0,0 +1,165 @@
+import json
+import time
+import threading
+from urllib.parse import urlsplit, parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BOT_USER = {"id": 1, "is_bot": True, "first_name": "Bench", "username": "bench_bot"}
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    # Many clients connect at the same time, the default backlog of 5 makes the others fail
+    request_queue_size = 128
+
+
+class FakeTelegramHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.handle_api_call()
+
+    def do_POST(self):
+        self.handle_api_call()
+
+    def read_params(self):
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if body:
+            if self.headers.get("Content-Type", "").startswith("application/json"):
+                params.update(json.loads(body))
+            else:
+                params.update(parse_qsl(body.decode()))
+
+        return url.path.rsplit("/", 1)[-1], params
+
+    def handle_api_call(self):
+        method, params = self.read_params()
+        status, result = self.server.api.call(method, params)
+
+        body = json.dumps(result).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Methods that count against the per chat rate limit
+RATE_LIMITED_METHODS = (
+    "sendMessage",
+    "editMessageText",
+    "deleteMessage",
+    "deleteMessages",
+)
+
+
+class FakeTelegramAPI:
+    """
+    Local stand-in for the Telegram Bot API
+
+    It records every call and answers with a 429 when a chat receives messages, edits or deletions
+    faster than min_chat_interval, like Telegram does.
+
+    Args:
+        latency: float (Optional) - Seconds to wait before answering each call
+        min_chat_interval: float (Optional) - Minimum number of seconds between two messages in a chat
+        retry_after: int (Optional) - retry_after returned with the 429 responses
+    """
+
+    def __init__(self, latency=0.0, min_chat_interval=0.0, retry_after=1):
+        self.latency = latency
+        self.min_chat_interval = min_chat_interval
+        self.retry_after = retry_after
+
+        self.calls = []
+        self.rate_limited = 0
+        self.last_message_at = {}
+        self.next_message_id = 1
+        self.lock = threading.Lock()
+
+        # Results of the methods that don't just answer True
+        self.results = {
+            "getMe": lambda params: BOT_USER,
+            "answerWebAppQuery": lambda params: {},
+            "createChatInviteLink": lambda params: {
+                "invite_link": f"https://t.me/+{params['chat_id']}_{len(self.calls)}",
+                "creator": BOT_USER,
+                "creates_join_request": True,
+                "is_primary": False,
+                "is_revoked": False,
+                "expire_date": int(params.get("expire_date", 0)) or None,
+            },
+        }
+
+        self.server = StubServer(("127.0.0.1", 0), FakeTelegramHandler)
+        self.server.api = self
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def call(self, method, params):
+        time.sleep(self.latency)
+
+        with self.lock:
+            self.calls.append((method, params))
+
+            if method in RATE_LIMITED_METHODS:
+                chat_id = str(params["chat_id"])
+                now = time.monotonic()
+                last_message_at = self.last_message_at.get(chat_id)
+                if last_message_at and now - last_message_at < self.min_chat_interval:
+                    self.rate_limited += 1
+                    return 429, {
+                        "ok": False,
+                        "error_code": 429,
+                        "description": f"Too Many Requests: retry after {self.retry_after}",
+                        "parameters": {"retry_after": self.retry_after},
+                    }
+
+                self.last_message_at[chat_id] = now
+                if method in ("deleteMessage", "deleteMessages"):
+                    return 200, {"ok": True, "result": True}
+
+                if method == "editMessageText":
+                    message_id = int(params["message_id"])
+                    if message_id >= self.next_message_id:
+                        return 400, {
+                            "ok": False,
+                            "error_code": 400,
+                            "description": "Bad Request: message to edit not found",
+                        }
+                else:
+                    message_id = self.next_message_id
+                    self.next_message_id += 1
+
+                return 200, {
+                    "ok": True,
+                    "result": {
+                        "message_id": message_id,
+                        "date": int(time.time()),
+                        "chat": {"id": int(chat_id), "type": "supergroup"},
+                        "text": params.get("text"),
+                    },
+                }
+
+            if method in self.results:
+                return 200, {"ok": True, "result": self.results[method](params)}
+
+        return 200, {"ok": True, "result": True}
+
+    def count(self, method):
+        return sum(1 for called_method, _ in self.calls if called_method == method)
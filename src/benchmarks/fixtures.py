@@ -0,0 +1,52 @@
+import os
+import json
+
+
+def use_temp_config(directory, **creds):
+    """
+    Point src.credentials at a config file in the directory, must be called before it is imported
+
+    Args:
+        directory: str - Directory to write the config file to
+        creds: dict - Values to put in the config file
+
+    Returns:
+        str - Path of the config file
+    """
+
+    config_file = os.path.join(directory, "bench_config.json")
+    with open(config_file, "w") as f:
+        json.dump({"TELEGRAM_AUTH_TOKEN": "123:bench", **creds}, f)
+
+    # An absolute path replaces the src directory when it is joined in src.credentials
+    os.environ["CONFIG_FILENAME"] = config_file
+
+    return config_file
+
+
+def use_temp_databases(directory):
+    """Point the payments and backend databases at files in the directory"""
+
+    from ..database import connection
+
+    connection.close_connections()
+    connection.PAYMENTS_DB_NAME = os.path.join(directory, "payments.db")
+    connection.BACKEND_DB_NAME = os.path.join(directory, "backend.db")
+
+
+class FakeBot:
+    """Stand-in for telegram.Bot that records the calls the handlers make"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        async def call(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+
+        return call
+
+
+class FakeObject:
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
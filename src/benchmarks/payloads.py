@@ -0,0 +1,78 @@
+import random
+import datetime
+
+OUTCOME_MAPPING = {
+    1: "Team1 Win",
+    2: "Team2 Win",
+    3: "Draw",
+    4: "Total Over(%s)",
+    5: "Total Under(%s)",
+    6: "Team1 Total Over(%s)",
+    7: "Team2 Asian Handicap(%s)",
+    8: "Both Teams To Score",
+}
+
+LEAGUES = [
+    "Sweden. Allsvenskan",
+    "England. Premier League",
+    "Spain. LaLiga",
+    "Germany. Bundesliga",
+    "USA. MLS",
+    "Korea Republic. K League 1",
+    "UEFA Champions League",
+]
+
+
+def make_payload(n_rows, n_events=None, seed=0):
+    """
+    Build a synthetic bot_pro_search response shaped like the BetBurger API
+
+    Args:
+        n_rows: int - Number of outcomes in the payload
+        n_events: int (Optional) - Number of distinct events the outcomes are spread over
+        seed: int (Optional) - Seed for the random generator
+
+    Returns:
+        dict - The response JSON with the "bets" and "source.value_bets" keys
+    """
+
+    rng = random.Random(seed)
+    n_events = n_events or max(n_rows // 5, 1)
+    now = datetime.datetime(2024, 3, 1, 12, 0, 0)
+
+    outcomes, value_bets = [], []
+    for i in range(n_rows):
+        event_id = i % n_events
+        koef = round(rng.uniform(1.2, 6.0), 3)
+        outcomes.append(
+            {
+                "id": f"bet{i:08d}",
+                "market_and_bet_type": rng.choice(list(OUTCOME_MAPPING)),
+                "market_and_bet_type_param": rng.choice([0.5, 1.5, 2.5, -1.0, 3.0]),
+                "bookmaker_event_id": 1_000_000 + event_id,
+                "bookmaker_id": 19,
+                "league": LEAGUES[event_id % len(LEAGUES)],
+                "event_name": f"Home {event_id} - Away {event_id}",
+                "home": f"Home {event_id}",
+                "away": f"Away {event_id}",
+                "sport_id": rng.choice([5, 7, 8]),
+                "swap_teams": rng.random() < 0.3,
+                "started_at": int(
+                    (now + datetime.timedelta(hours=event_id % 72)).timestamp()
+                ),
+                "koef_last_modified_at": int(now.timestamp() * 1000),
+                "bookmaker_event_direct_link": (
+                    f"{event_id}" if rng.random() < 0.95 else None
+                ),
+                "koef": koef,
+            }
+        )
+        value_bets.append(
+            {
+                "bet_id": f"bet{i:08d}",
+                "avg_koef": round(koef * 0.95, 3),
+                "percent": round(rng.uniform(1, 10), 2),
+            }
+        )
+
+    return {"bets": outcomes, "source": {"value_bets": value_bets}}
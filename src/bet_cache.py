@@ -0,0 +1,116 @@
+import logging
+from collections import OrderedDict
+
+from .config import RECENT_BET_CACHE_SIZE
+
+
+class RecentBetCache:
+    """
+    Bounded LRU map of the recently seen bet ids to their price, kept in front of the bets database
+
+    The price of a bet is its (koef, koef_last_modified_at) pair. Most of the bets of a poll were
+    already returned by the previous poll, so they can be classified as unchanged or re-priced without
+    touching SQLite. Only the misses have to be checked against the database.
+
+    Args:
+        max_size: int (Optional) - Maximum number of bet ids kept in memory
+    """
+
+    def __init__(self, max_size=RECENT_BET_CACHE_SIZE):
+        self.max_size = max_size
+        self.prices = OrderedDict()
+        self.warmed = False
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __contains__(self, id):
+        return id in self.prices
+
+    def update(self, prices):
+        """
+        Store the latest price of the bets, they become the most recently seen ones
+
+        Args:
+            prices: dict - The (koef, koef_last_modified_at) pair of every bet id
+        """
+
+        for id, price in prices.items():
+            self.prices[id] = price
+            self.prices.move_to_end(id)
+
+        # Evict the least recently seen ids
+        while len(self.prices) > self.max_size:
+            self.prices.popitem(last=False)
+
+    def discard(self, ids):
+        """Forget the bets, e.g. the ones that left the feed, so that they count as new if they come back"""
+
+        for id in ids:
+            self.prices.pop(id, None)
+
+    def lookup(self, ids):
+        """
+        Split the ids into cache hits and misses, the hits are marked as recently seen
+
+        Args:
+            ids: iterable - Bet ids to check
+
+        Returns:
+            tuple[dict, list] - The cached price of the hits and the ids that are not in the cache
+        """
+
+        known, unknown = {}, []
+        for id in ids:
+            if id in self.prices:
+                self.prices.move_to_end(id)
+                known[id] = self.prices[id]
+                self.hits += 1
+            else:
+                unknown.append(id)
+                self.misses += 1
+
+        return known, unknown
+
+    def is_unchanged(self, prices):
+        """
+        Check whether all the bets were already seen at the same price
+
+        Args:
+            prices: dict - The (koef, koef_last_modified_at) pair of every bet id
+
+        Returns:
+            bool - True if every bet is cached with the same price
+        """
+
+        return all(self.prices.get(id) == price for id, price in prices.items())
+
+    def warm(self, db):
+        """Load the most recently stored bets from the database, only done once"""
+
+        if self.warmed:
+            return
+
+        # The bets come newest first, so they are added oldest first to keep the LRU order
+        self.update(
+            {
+                id: (koef, koef_last_modified_at)
+                for id, koef, koef_last_modified_at in reversed(
+                    db.get_recent_prices(self.max_size)
+                )
+            }
+        )
+        self.warmed = True
+        logging.info(f"Recent bet cache warmed with {len(self)} bets")
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,226 @@
+import os
+import json
+import time
+import logging
+import threading
+import requests
+
+from . import http_client
+from .config import (
+    BETTING_MAPPING_URL,
+    BETTING_MAPPING_TTL_SECONDS,
+    BETTING_MAPPING_RETRY_SECONDS,
+    BETTING_MAPPING_CACHE_FILE,
+)
+
+
+def parse_betting_mapping(html):
+    """
+    Parse the BetBurger entity_ids page into a {market_and_bet_type: name} mapping
+
+    Args:
+        html: str - HTML content of the entity_ids page
+
+    Returns:
+        dict - Mapping between the outcome ids and the outcome names
+    """
+
+    # Only needed when the page has changed, so it isn't imported at startup
+    from bs4 import BeautifulSoup
+
+    bet_mappings = {}
+
+    # Parse the HTML content with BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Find the h2 tag with the specified title
+    target_h2 = soup.find("span", {"title": "translation missing: en.bet.Variation"})
+
+    # Check if the h2 tag is found
+    if not target_h2:
+        logging.warning("h2 tag not found.")
+        return bet_mappings
+
+    # Find the table element following the target h2 tag
+    target_table = target_h2.find_next("table")
+    if not target_table:
+        logging.warning("Table not found.")
+        return bet_mappings
+
+    # Find the tbody element within the table
+    tbody = target_table.find("tbody")
+    if not tbody:
+        logging.warning("tbody not found.")
+        return bet_mappings
+
+    # Extract the data from each row of the table body
+    for row in tbody.find_all("tr"):
+        row_data = [cell.text.strip() for cell in row.find_all("td")]
+        id, name = int(row_data[0]), row_data[1]
+        bet_mappings[id] = name
+
+    return bet_mappings
+
+
+class BetMappingCache:
+    """
+    Two level cache of the BetBurger outcome mapping
+
+    The mapping is kept in memory for the poll loop and persisted on disk together with the
+    ETag/Last-Modified validators, so that a restart only needs a conditional request to revalidate it.
+    A failed refresh is not tried again before retry_seconds, the polls meanwhile use what is cached.
+    """
+
+    def __init__(
+        self,
+        cache_file=BETTING_MAPPING_CACHE_FILE,
+        ttl_seconds=BETTING_MAPPING_TTL_SECONDS,
+        url=BETTING_MAPPING_URL,
+        retry_seconds=BETTING_MAPPING_RETRY_SECONDS,
+    ):
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+        self.url = url
+        self.retry_seconds = retry_seconds
+
+        self.mappings = None
+        self.etag = None
+        self.last_modified = None
+        self.fetched_at = 0
+        self.failed_at = 0
+
+        self._lock = threading.Lock()
+        self._refresh_thread = None
+
+    def is_stale(self):
+        return time.time() - self.fetched_at >= self.ttl_seconds
+
+    def is_backing_off(self):
+        return time.time() - self.failed_at < self.retry_seconds
+
+    def load_snapshot(self):
+        """Load the mapping from the on-disk snapshot, if there is one"""
+
+        # A snapshot with the wrong shape is treated like a missing one, so the mapping is fetched again
+        try:
+            with open(self.cache_file, "r") as f:
+                snapshot = json.load(f)
+
+            # JSON object keys are always strings so they need to be converted back to the outcome ids
+            mappings = {int(id): str(name) for id, name in snapshot["mappings"].items()}
+            etag = snapshot.get("etag")
+            last_modified = snapshot.get("last_modified")
+            fetched_at = float(snapshot.get("fetched_at", 0))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logging.info(f"No usable betting mapping snapshot found: {e}")
+            return False
+
+        if not mappings:
+            logging.info("The betting mapping snapshot is empty...ignoring it")
+            return False
+
+        self.mappings = mappings
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+        return True
+
+    def save_snapshot(self):
+        """Atomically write the current mapping and its validators to disk"""
+
+        snapshot = {
+            "mappings": self.mappings,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fetched_at": self.fetched_at,
+        }
+
+        tmp_file = f"{self.cache_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logging.error(f"Failed to save the betting mapping snapshot: {e}")
+
+    def refresh(self):
+        """Revalidate the mapping against BetBurger, only parsing the page when it has changed"""
+
+        headers = {}
+        if self.mappings:
+            if self.etag:
+                headers["If-None-Match"] = self.etag
+            if self.last_modified:
+                headers["If-Modified-Since"] = self.last_modified
+
+        try:
+            response = http_client.request("GET", self.url, headers=headers)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logging.error(
+                f"Failed to refresh the betting mapping: {e}...retrying in {self.retry_seconds} seconds"
+            )
+            self.failed_at = time.time()
+            return
+
+        if response.status_code == 304:
+            logging.info("Betting mapping has not changed since the last refresh")
+        else:
+            mappings = parse_betting_mapping(response.text)
+
+            # Keep serving the previous mapping rather than replacing it with an empty one
+            if not mappings:
+                logging.warning(
+                    "Betting mapping page could not be parsed...keeping the cached mapping"
+                )
+                self.failed_at = time.time()
+                return
+
+            self.mappings = mappings
+            self.etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
+            logging.info(f"Betting mapping refreshed with {len(mappings)} outcomes")
+
+        self.fetched_at = time.time()
+        self.save_snapshot()
+
+    def refresh_in_background(self):
+        """Start a refresh in a daemon thread unless one is already running"""
+
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+
+        self._refresh_thread = threading.Thread(target=self.refresh, daemon=True)
+        self._refresh_thread.start()
+
+    def get(self):
+        """
+        Get the outcome mapping without blocking on BetBurger, unless nothing has ever been cached
+
+        Returns:
+            dict - Mapping between the outcome ids and the outcome names
+        """
+
+        with self._lock:
+            # Every page would wait for BetBurger again while it is failing
+            if self.is_backing_off():
+                pass
+            elif self.mappings is None:
+                # Cold start: serve the snapshot and revalidate it in the background
+                if self.load_snapshot():
+                    self.refresh_in_background()
+                else:
+                    self.refresh()
+            elif self.is_stale():
+                self.refresh_in_background()
+
+        return self.mappings or {}
+
+
+BETTING_MAPPING = BetMappingCache()
+
+
+def get_betting_mapping():
+    return BETTING_MAPPING.get()
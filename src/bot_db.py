@@ -1,6 +1,17 @@
 import os
 import sqlite3
 
+# Columns that change when BetBurger re-prices a bet
+PRICE_COLUMNS = [
+    "koef",
+    "koef_last_modified_at",
+    "avg_koef",
+    "percent",
+    "min_koef",
+    "bet_info",
+    "receive_date",
+]
+
 
 class Database:
     def __init__(self, db_file="bets.db"):
@@ -12,6 +23,7 @@ class Database:
         self.conn = sqlite3.connect(self.db_file)
         self.cursor = self.conn.cursor()
         self.create_table()
+        self.migrate()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -22,7 +34,7 @@ class Database:
         self.cursor.execute(
             """
             CREATE TABLE IF NOT EXISTS bets (
-                id TEXT,
+                id TEXT PRIMARY KEY,
                 market_and_bet_type INTEGER,
                 bookmaker_event_id INTEGER,
                 bookmaker_id INTEGER,
@@ -45,24 +57,55 @@ class Database:
             )
         """
         )
-        self.conn.commit()
-
-    def insert_data(self, data):
-        self.cursor.executemany(
+        self.cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS bets_group_index
+            ON bets (bookmaker_event_id, market_and_bet_type)
+        """
+        )
+        self.cursor.execute(
             """
-            INSERT INTO bets (
-                id, market_and_bet_type, bookmaker_event_id, bookmaker_id, league, event_name, home, away,
-                swap_teams, started_at, koef_last_modified_at, bookmaker_event_direct_link, koef, avg_koef,
-                percent, min_koef, bet_url, bet_info, receive_date, sport_id
+            CREATE TABLE IF NOT EXISTS messages (
+                chat_id TEXT,
+                bookmaker_event_id INTEGER,
+                market_and_bet_type INTEGER,
+                message_id INTEGER,
+                sent_at TEXT,
+                PRIMARY KEY (chat_id, bookmaker_event_id, market_and_bet_type)
             )
-            VALUES (:id, :market_and_bet_type, :bookmaker_event_id, :bookmaker_id, :league, :event_name, :home, :away,
-                :swap_teams, :started_at, :koef_last_modified_at, :bookmaker_event_direct_link, :koef, :avg_koef,
-                :percent, :min_koef, :bet_url, :bet_info, :receive_date, :sport_id)
-        """,
-            data,
+        """
         )
         self.conn.commit()
 
+    def migrate(self):
+        """Bring databases created by older versions up to the current schema"""
+
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+
+        if version < 1:
+            # The bets table used to be created without a primary key, so the id has to be made unique
+            # before the duplicate checks and the upserts can rely on it
+            id_is_primary_key = any(
+                name == "id" and pk
+                for _, name, _, _, _, pk in self.cursor.execute(
+                    "PRAGMA table_info(bets)"
+                )
+            )
+            if not id_is_primary_key:
+                self.cursor.execute(
+                    """
+                    DELETE FROM bets
+                    WHERE rowid NOT IN (SELECT MIN(rowid) FROM bets GROUP BY id)
+                """
+                )
+                self.cursor.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS bets_id_index ON bets (id)"
+                )
+
+            self.cursor.execute("PRAGMA user_version = 1")
+
+        self.conn.commit()
+
     def add_columns(self, column_name, data_type):
         self.cursor.execute(
             """
@@ -73,15 +116,80 @@ class Database:
         )
         self.conn.commit()
 
+    def upsert_data(self, data):
+        """
+        Insert the new bets and update the price of the re-priced ones, in a single transaction
+
+        Args:
+            data: list[dict] - The bets to write
+
+        Returns:
+            int - Number of bets that were inserted or updated
+        """
+
+        try:
+            # A bet is only rewritten when its price changed, the unchanged ones are left untouched
+            self.cursor.executemany(
+                """
+                INSERT INTO bets (
+                    id, market_and_bet_type, bookmaker_event_id, bookmaker_id, league, event_name, home, away,
+                    swap_teams, started_at, koef_last_modified_at, bookmaker_event_direct_link, koef, avg_koef,
+                    percent, min_koef, bet_url, bet_info, receive_date, sport_id
+                )
+                VALUES (:id, :market_and_bet_type, :bookmaker_event_id, :bookmaker_id, :league, :event_name, :home, :away,
+                    :swap_teams, :started_at, :koef_last_modified_at, :bookmaker_event_direct_link, :koef, :avg_koef,
+                    :percent, :min_koef, :bet_url, :bet_info, :receive_date, :sport_id)
+                ON CONFLICT (id) DO UPDATE SET
+                    {assignments}
+                WHERE bets.koef IS NOT excluded.koef
+                OR bets.koef_last_modified_at IS NOT excluded.koef_last_modified_at
+            """.format(
+                    assignments=", ".join(
+                        f"{column} = excluded.{column}" for column in PRICE_COLUMNS
+                    )
+                ),
+                data,
+            )
+            written = self.cursor.rowcount
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+        self.conn.commit()
+
+        return written
+
     def update_data(self, id, koef_last_modified_at, new_data):
+        """
+        Update the price of a stored bet
+
+        Args:
+            id: str - Id of the bet
+            koef_last_modified_at: str - When BetBurger last changed the odds of the bet
+            new_data: dict - The new values, only the PRICE_COLUMNS are updated
+        """
+
+        columns = [
+            column
+            for column in PRICE_COLUMNS
+            if column in new_data and column != "koef_last_modified_at"
+        ]
         self.cursor.execute(
             """
             UPDATE bets
-            SET koef_last_modified_at = ?,
-                -- Update other columns here
-            WHERE id = ?
-        """,
-            (koef_last_modified_at, id),
+            SET {assignments}
+            WHERE id = :id
+        """.format(
+                assignments=", ".join(
+                    f"{column} = :{column}"
+                    for column in ["koef_last_modified_at", *columns]
+                )
+            ),
+            {
+                **{column: new_data[column] for column in columns},
+                "id": id,
+                "koef_last_modified_at": koef_last_modified_at,
+            },
         )
         self.conn.commit()
 
@@ -95,18 +203,258 @@ class Database:
         )
         self.conn.commit()
 
-    def get_data(self, ids):
+    def get_data(self, ids, chunk_size=500, columns="*"):
+        """
+        Get the stored bets with the given ids
+
+        The ids are bound as parameters in fixed size chunks, which keeps every query under the SQLite
+        variable limit and lets the same prepared statement be reused for all the chunks.
+
+        Args:
+            ids: iterable - Bet ids to look up
+            chunk_size: int (Optional) - Number of ids bound per query
+            columns: str (Optional) - Columns to select
+
+        Returns:
+            list[tuple] - The stored rows
+        """
+
+        # Duplicate ids in different chunks would return the same row twice
+        ids = list(dict.fromkeys(ids))
+        query = """
+            SELECT {columns} FROM bets
+            WHERE id IN ({placeholders})
+        """.format(
+            columns=columns, placeholders=", ".join("?" * chunk_size)
+        )
+
+        rows = []
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            # Pad the last chunk with NULLs, which never match, so that it uses the same statement
+            chunk += [None] * (chunk_size - len(chunk))
+            self.cursor.execute(query, chunk)
+            rows.extend(self.cursor.fetchall())
+
+        return rows
+
+    def get_prices(self, ids):
+        """
+        Get the stored price of the bets with the given ids, looked up on the primary key
+
+        Args:
+            ids: iterable - Bet ids to look up
+
+        Returns:
+            dict - The (koef, koef_last_modified_at) pair of every stored bet id
+        """
+
+        return {
+            id: (koef, koef_last_modified_at)
+            for id, koef, koef_last_modified_at in self.get_data(
+                ids, columns="id, koef, koef_last_modified_at"
+            )
+        }
+
+    def get_recent_prices(self, limit):
         self.cursor.execute(
             """
-            SELECT * FROM bets
-            WHERE id IN {ids}
+            SELECT id, koef, koef_last_modified_at FROM bets
+            ORDER BY rowid DESC
+            LIMIT ?
+        """,
+            (limit,),
+        )
+        return self.cursor.fetchall()
 
-        """.format(
-                ids=ids
+    def get_group_bets(self, groups, chunk_size=250):
+        """
+        Get the stored bets of the given (bookmaker_event_id, market_and_bet_type) groups
+
+        Args:
+            groups: iterable - The (bookmaker_event_id, market_and_bet_type) pairs to look up
+            chunk_size: int (Optional) - Number of groups bound per query
+
+        Returns:
+            list[dict] - The stored bets, in the order they were stored
+        """
+
+        groups = list(dict.fromkeys(groups))
+
+        bets = []
+        for start in range(0, len(groups), chunk_size):
+            chunk = groups[start : start + chunk_size]
+            self.cursor.execute(
+                """
+                SELECT * FROM bets
+                WHERE (bookmaker_event_id, market_and_bet_type) IN ({placeholders})
+                ORDER BY rowid
+            """.format(
+                    placeholders=", ".join(["(?, ?)"] * len(chunk))
+                ),
+                [value for group in chunk for value in group],
+            )
+            column_names = [column[0] for column in self.cursor.description]
+            bets.extend(dict(zip(column_names, row)) for row in self.cursor.fetchall())
+
+        return bets
+
+    def delete_group_bets(self, groups, chunk_size=250):
+        """
+        Delete the stored bets of the given groups, e.g. once they left the feed and their message was deleted
+
+        Args:
+            groups: iterable - The (bookmaker_event_id, market_and_bet_type) pairs to delete
+            chunk_size: int (Optional) - Number of groups bound per query
+
+        Returns:
+            list[str] - The ids of the deleted bets
+        """
+
+        groups = list(dict.fromkeys(groups))
+
+        deleted_ids = []
+        try:
+            for start in range(0, len(groups), chunk_size):
+                chunk = groups[start : start + chunk_size]
+                self.cursor.execute(
+                    """
+                    DELETE FROM bets
+                    WHERE (bookmaker_event_id, market_and_bet_type) IN ({placeholders})
+                    RETURNING id
+                """.format(
+                        placeholders=", ".join(["(?, ?)"] * len(chunk))
+                    ),
+                    [value for group in chunk for value in group],
+                )
+                deleted_ids.extend(id for (id,) in self.cursor.fetchall())
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+        self.conn.commit()
+
+        return deleted_ids
+
+    def get_message_ids(self, chat_id, groups, chunk_size=250):
+        """
+        Get the ids of the messages posted in a chat for the given groups
+
+        Args:
+            chat_id: str - Telegram chat id
+            groups: iterable - The (bookmaker_event_id, market_and_bet_type) pairs to look up
+            chunk_size: int (Optional) - Number of groups bound per query
+
+        Returns:
+            dict - The message id of every group that has a posted message
+        """
+
+        groups = list(dict.fromkeys(groups))
+
+        message_ids = {}
+        for start in range(0, len(groups), chunk_size):
+            chunk = groups[start : start + chunk_size]
+            self.cursor.execute(
+                """
+                SELECT bookmaker_event_id, market_and_bet_type, message_id FROM messages
+                WHERE chat_id = ? AND (bookmaker_event_id, market_and_bet_type) IN ({placeholders})
+            """.format(
+                    placeholders=", ".join(["(?, ?)"] * len(chunk))
+                ),
+                [str(chat_id), *(value for group in chunk for value in group)],
+            )
+            for bookmaker_event_id, market_and_bet_type, message_id in self.cursor.fetchall():
+                message_ids[(bookmaker_event_id, market_and_bet_type)] = message_id
+
+        return message_ids
+
+    def get_message_groups(self, chat_id, message_ids, chunk_size=250):
+        """
+        Get all the groups shown by the given messages of a chat, several groups share a packed message
+
+        Args:
+            chat_id: str - Telegram chat id
+            message_ids: iterable - Ids of the messages to look up
+            chunk_size: int (Optional) - Number of message ids bound per query
+
+        Returns:
+            dict - The message id of every (bookmaker_event_id, market_and_bet_type) pair on the messages
+        """
+
+        message_ids = list(dict.fromkeys(message_ids))
+
+        message_groups = {}
+        for start in range(0, len(message_ids), chunk_size):
+            chunk = message_ids[start : start + chunk_size]
+            self.cursor.execute(
+                """
+                SELECT bookmaker_event_id, market_and_bet_type, message_id FROM messages
+                WHERE chat_id = ? AND message_id IN ({placeholders})
+                ORDER BY rowid
+            """.format(
+                    placeholders=", ".join(["?"] * len(chunk))
+                ),
+                [str(chat_id), *chunk],
             )
+            for bookmaker_event_id, market_and_bet_type, message_id in self.cursor.fetchall():
+                message_groups[(bookmaker_event_id, market_and_bet_type)] = message_id
+
+        return message_groups
+
+    def save_message_ids(self, chat_id, message_ids):
+        """
+        Store the id of the latest message posted in a chat for every group
+
+        Args:
+            chat_id: str - Telegram chat id
+            message_ids: dict - The message id of every (bookmaker_event_id, market_and_bet_type) pair
+        """
+
+        self.cursor.executemany(
+            """
+            INSERT INTO messages (chat_id, bookmaker_event_id, market_and_bet_type, message_id, sent_at)
+            VALUES (?, ?, ?, ?, datetime('now'))
+            ON CONFLICT (chat_id, bookmaker_event_id, market_and_bet_type) DO UPDATE SET
+                message_id = excluded.message_id,
+                sent_at = excluded.sent_at
+        """,
+            [
+                (str(chat_id), bookmaker_event_id, market_and_bet_type, message_id)
+                for (bookmaker_event_id, market_and_bet_type), message_id in message_ids.items()
+            ],
+        )
+        self.conn.commit()
+
+    def get_messages(self):
+        """
+        Get all the tracked messages
+
+        Returns:
+            list[tuple] - The chat_id, bookmaker_event_id, market_and_bet_type and message_id of every message
+        """
+
+        self.cursor.execute(
+            """
+            SELECT chat_id, bookmaker_event_id, market_and_bet_type, message_id FROM messages
+        """
         )
         return self.cursor.fetchall()
 
+    def delete_message_ids(self, chat_id, message_ids):
+        """
+        Stop tracking messages of a chat, e.g. once they were deleted from Telegram
+
+        Args:
+            chat_id: str - Telegram chat id
+            message_ids: list[int] - Ids of the messages
+        """
+
+        self.cursor.executemany(
+            "DELETE FROM messages WHERE chat_id = ? AND message_id = ?",
+            [(str(chat_id), message_id) for message_id in message_ids],
+        )
+        self.conn.commit()
+
     def get_all_data(self):
         self.cursor.execute(
             """
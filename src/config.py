@@ -1,3 +1,4 @@
+import os
 import pytz
 import logging
 import numpy as np
@@ -12,6 +13,77 @@ URL_MAPPING = {19: "https://www.unibet.com/betting/sports/event/{bookmaker_event
 MIN_ODDS_FACTOR = 0.9
 FREQUENCY_SECONDS = 100
 
+# Number of recently seen bet ids kept in memory to skip the database lookups for repeated bets
+RECENT_BET_CACHE_SIZE = 20_000
+
+# Maximum number of BetBurger filters that are polled at the same time
+FILTER_POLL_MAX_WORKERS = 8
+
+# The search returns the bets of a filter a page at a time, the pages after the first one are
+# fetched concurrently (on the filter poll workers) once the first page tells how many bets there are.
+# A filter stops being paged as soon as a page only contains bets that were already seen
+BET_BURGER_SEARCH_URL = (
+    "https://rest-api-pr.betburger.com/api/v1/valuebets/bot_pro_search"
+)
+BET_BURGER_PER_PAGE = 500
+BET_BURGER_MAX_PAGES = 20
+
+# The outcome mapping rarely changes so it is cached on disk, in the user cache directory rather than
+# in the source tree, and only revalidated once the TTL expires. A failed refresh is retried after a delay
+BETTING_MAPPING_URL = "https://www.betburger.com/api/entity_ids"
+BETTING_MAPPING_TTL_SECONDS = 24 * 60 * 60
+BETTING_MAPPING_RETRY_SECONDS = 5 * 60
+BETTING_MAPPING_CACHE_FILE = os.getenv(
+    "BETTING_MAPPING_CACHE_FILE",
+    os.path.join(
+        os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "betburger-notification-service",
+        "entity_ids.json",
+    ),
+)
+
+# Connection pool used for all the outgoing HTTP calls, the timeout is (connect, read) in seconds
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+HTTP_TIMEOUT = (5, 30)
+
+# Telegram allows about 1 message per second in a chat and 30 messages per second overall,
+# any 429 response is retried after the retry_after it asks for
+TELEGRAM_API_URL = "https://api.telegram.org"
+TELEGRAM_GLOBAL_RATE = 30
+TELEGRAM_PER_CHAT_RATE = 1
+TELEGRAM_SEND_RETRIES = 3
+
+# deleteMessages takes at most 100 message ids per call
+TELEGRAM_DELETE_BATCH_SIZE = 100
+
+# The messages of a chat can be packed together up to Telegram's limit of 4096 characters: None sends
+# one message per event and bet type, "event" packs the bet types of an event and "league" packs the
+# events of a league
+TELEGRAM_MESSAGE_PACKING = None
+TELEGRAM_MESSAGE_MAX_LENGTH = 4096
+
+# The Stripe SDK is blocking, so the FastAPI handlers run its calls on a bounded thread pool
+STRIPE_MAX_WORKERS = 16
+
+# Stripe webhook events are stored in an outbox and applied by a background worker, which is woken up
+# by the webhook and also polls for the events left over by a restart. Failed events, e.g. an invoice
+# that arrived before its subscription, are retried a few times after a delay
+STRIPE_EVENT_POLL_SECONDS = 30
+STRIPE_EVENT_BATCH_SIZE = 100
+STRIPE_EVENT_MAX_ATTEMPTS = 5
+STRIPE_EVENT_RETRY_SECONDS = 10
+
+# Invite links sent after a payment are created for an hour and handed to the next buyers of the
+# group as long as they stay valid for at least 30 more minutes
+INVITE_LINK_VALIDITY_SECONDS = 60 * 60
+INVITE_LINK_MIN_REMAINING_SECONDS = 30 * 60
+INVITE_LINK_MAX_CONCURRENCY = 5
+
+# The product/price/group catalog is served from memory, its version counter in payments.db is
+# checked at most once per interval to pick up products created by another process
+CATALOG_VERSION_CHECK_SECONDS = 30
+
 # NOTE: The 2nd number in the range is exclusive
 # i.e. its not included so e.g. range(1, 5) = [1, 2, 3, 4]
 BET_TYPES_TO_FILTER_OUT = {
@@ -42,6 +114,21 @@ Nytt Spel!
 {bets}
 
 
+{league_name}
+🔐 Lägsta spelbara odds {min_odds}
+🕰️  {match_time}
+🌐 {bet_url}
+"""
+
+# Sent for the bets whose odds changed since they were sent
+REPRICED_BET_MESSAGE = """
+Nya odds!
+
+{sport_emoji} {event_name}
+🎲 Bets
+{bets}
+
+
 {league_name}
 🔐 Lägsta spelbara odds {min_odds}
 🕰️  {match_time}
@@ -93,6 +180,6 @@ GOODS_DELIVERY_MESSAGE = """
 
     {links}
 
-    The links will expire after an hour and are only 1 time use.
+    The links will stay valid for at least {valid_minutes} minutes.
 """
 PAYMENT_CANCELLATION_MESSAGE_TEXT = "The payment was cancelled by the user..."
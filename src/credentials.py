@@ -22,10 +22,12 @@ TELEGRAM_CHAT_MAPPING = CREDS.get("TELEGRAM_CHAT_MAPPING", {})
 # Load the credentials for betburger
 BET_BURGER_TOKEN = CREDS.get("BET_BURGER_TOKEN")
 BET_BURGER_FILTER_ID = CREDS.get("BET_BURGER_FILTER_ID")
+BET_BURGER_FILTER_IDS = CREDS.get("BET_BURGER_FILTER_IDS", [BET_BURGER_FILTER_ID])
 
 # Load the credentials for stripe
 STRIPE_AUTH_TOKEN = os.getenv("STRIPE_AUTH_TOKEN")
 STRIPE_PUBLISHABLE_TOKEN = os.getenv("STRIPE_PUBLISHABLE_TOKEN")
+STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
 
 # Load credentials for ngrok
 NGROK_AUTH_TOKEN = os.getenv("NGROK_AUTHTOKEN")
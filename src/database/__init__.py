@@ -1 +1 @@
-from . import selector, creator, deleter, updater
+from . import selector, creator, deleter, updater, catalog, settings, stripe_events
@@ -1,5 +1,5 @@
 import stripe
-from . import selector, creator
+from . import selector, creator, catalog
 from ..credentials import STRIPE_AUTH_TOKEN
 
 
@@ -83,6 +83,9 @@ def create_product(
         ]
         selector.create_groups(group)
 
+    # The triggers also bump the catalog version for the other processes
+    catalog.invalidate()
+
 
 if __name__ == "__main__":
 
@@ -0,0 +1,205 @@
+import time
+import sqlite3
+import logging
+import threading
+
+from .connection import transaction
+from ..config import CATALOG_VERSION_CHECK_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class Catalog:
+    """
+    Read-through in-memory cache of the products, prices and groups
+
+    The catalog only changes when a product is created, so the bot and the backend answer their lookups
+    from memory. The cache is marked stale by invalidate() when the current process writes to the catalog, and
+    reloaded when the version counter kept by the triggers of the catalog_version table has moved, which
+    covers the writes of other processes. The counter is read at most once per check interval.
+
+    The returned dictionaries are shared between the callers and must not be modified.
+
+    Args:
+        check_interval: float (Optional) - Minimum number of seconds between two reads of the version counter
+    """
+
+    def __init__(self, check_interval=CATALOG_VERSION_CHECK_SECONDS):
+        self.check_interval = check_interval
+
+        self.products = None
+        self.prices = None
+        self.groups = None
+        self.version = None
+        self.checked_at = 0
+        self.stale = True
+        self.indexes = {}
+
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Mark the cached catalog as stale so that the next lookup reloads it"""
+
+        with self._lock:
+            self.stale = True
+
+    def read_version(self):
+        """
+        Read the version counter of the catalog
+
+        Returns:
+            int | None - The version or None if the catalog_version table does not exist yet
+        """
+
+        try:
+            with transaction() as cursor:
+                row = cursor.execute(
+                    "SELECT version FROM catalog_version WHERE id = 1"
+                ).fetchone()
+        except sqlite3.OperationalError as error:
+            logger.warning(f"[-] Catalog version unavailable: {error}")
+            return None
+
+        return row[0] if row else None
+
+    def load(self):
+        """Load the whole catalog from the database"""
+
+        # The version is read first, a write made while loading moves it and triggers another reload
+        version = self.read_version()
+
+        with transaction() as cursor:
+            tables = {}
+            for table_name in ["products", "price", "groups"]:
+                cursor.execute(f"SELECT * FROM {table_name} ORDER BY id")
+                column_names = [column[0] for column in cursor.description]
+                tables[table_name] = [
+                    dict(zip(column_names, row)) for row in cursor.fetchall()
+                ]
+
+        self.products = tables["products"]
+        self.prices = tables["price"]
+        self.groups = tables["groups"]
+        self.version = version
+        self.checked_at = time.monotonic()
+        self.stale = False
+        self.indexes = {}
+
+        logger.info(
+            f"[+] Catalog loaded with {len(self.products)} products at version {version}"
+        )
+
+    def refresh(self):
+        """Load the catalog if it is not cached or if the version counter has moved since it was loaded"""
+
+        with self._lock:
+            if self.stale:
+                self.load()
+                return
+
+            now = time.monotonic()
+            if now - self.checked_at < self.check_interval:
+                return
+
+            self.checked_at = now
+            if self.read_version() != self.version:
+                self.load()
+
+    def get_index(self, rows_name, column):
+        """Mapping between each value of the column and its rows, built on first use after every load"""
+
+        key = (rows_name, column)
+        if key not in self.indexes:
+            index = {}
+            for row in getattr(self, rows_name):
+                index.setdefault(str(row[column]), []).append(row)
+            self.indexes[key] = index
+
+        return self.indexes[key]
+
+    def lookup(self, rows_name, column=None, value=None):
+        try:
+            self.refresh()
+        except (Exception, sqlite3.DatabaseError) as error:
+            logger.error(f"[-] {error}")
+
+            # Keep serving the previous catalog if the database could not be read
+            if self.products is None:
+                return False
+
+        if not value:
+            return getattr(self, rows_name)
+
+        return self.get_index(rows_name, column).get(str(value), [])
+
+    def get_products(
+        self, product_id: int = None, stripe_product_id: str = None
+    ) -> list[dict] | bool:
+        """
+        Get products from the catalog, same as selector.get_products
+
+        Args:
+            product_id: int (Optional) - Product ID
+            stripe_product_id: str (Optional) - Stripe product ID
+
+        Returns:
+            list[dict] | bool - List of dictionaries containing product data or False if an error occurs
+        """
+
+        if product_id:
+            return self.lookup("products", "id", product_id)
+
+        return self.lookup("products", "stripe_product_id", stripe_product_id)
+
+    def get_prices(
+        self, product_id: int = None, stripe_price_id: str = None
+    ) -> list[dict] | bool:
+        """
+        Get prices from the catalog, same as selector.get_prices
+
+        Args:
+            product_id: int (Optional) - Product ID
+            stripe_price_id: str (Optional) - Stripe price ID
+
+        Returns:
+            list[dict] | bool - List of dictionaries containing price data or False if an error occurs
+        """
+
+        if product_id:
+            return self.lookup("prices", "product_id", product_id)
+
+        return self.lookup("prices", "stripe_price_id", stripe_price_id)
+
+    def get_groups(self, product_id: int = None) -> list[dict] | bool:
+        """
+        Get groups from the catalog, same as selector.get_groups
+
+        Args:
+            product_id: int (Optional) - Product ID
+
+        Returns:
+            list[dict] | bool - List of dictionaries containing group data or False if an error occurs
+        """
+
+        return self.lookup("groups", "product_id", product_id)
+
+
+CATALOG = Catalog()
+
+
+def invalidate():
+    CATALOG.invalidate()
+
+
+def get_products(product_id: int = None, stripe_product_id: str = None):
+    return CATALOG.get_products(
+        product_id=product_id, stripe_product_id=stripe_product_id
+    )
+
+
+def get_prices(product_id: int = None, stripe_price_id: str = None):
+    return CATALOG.get_prices(product_id=product_id, stripe_price_id=stripe_price_id)
+
+
+def get_groups(product_id: int = None):
+    return CATALOG.get_groups(product_id=product_id)
@@ -0,0 +1,71 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+PAYMENTS_DB_NAME = os.path.join(os.path.dirname(__file__), "payments.db")
+BACKEND_DB_NAME = os.path.join(os.path.dirname(__file__), "backend.db")
+
+# Milliseconds a connection waits for a lock held by another connection before giving up
+BUSY_TIMEOUT_MS = 5000
+
+_local = threading.local()
+
+
+def get_connection(db_name: str = None) -> sqlite3.Connection:
+    """
+    Get the connection of the current thread to a database, opening it on first use
+
+    The FastAPI backend and the bot use the databases at the same time, so the connections are opened in
+    WAL mode where readers don't block the writer, and wait for locks instead of failing straight away.
+
+    Args:
+        db_name: str (Optional) - Path of the database, defaults to the payments database
+
+    Returns:
+        sqlite3.Connection - The connection, which is reused by later calls from the same thread
+    """
+
+    db_name = db_name or PAYMENTS_DB_NAME
+    if not hasattr(_local, "connections"):
+        _local.connections = {}
+
+    conn = _local.connections.get(db_name)
+    if conn is None:
+        conn = sqlite3.connect(db_name, timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        _local.connections[db_name] = conn
+
+    return conn
+
+
+@contextmanager
+def transaction(db_name: str = None):
+    """
+    Cursor on the thread's connection that commits when the block succeeds and rolls back when it raises
+
+    Args:
+        db_name: str (Optional) - Path of the database, defaults to the payments database
+
+    Yields:
+        sqlite3.Cursor - The cursor, closed when the block exits
+    """
+
+    conn = get_connection(db_name)
+    with conn:
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+
+def close_connections() -> None:
+    """Close all the connections opened by the current thread"""
+
+    for conn in getattr(_local, "connections", {}).values():
+        conn.close()
+
+    _local.connections = {}
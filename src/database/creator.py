@@ -1,37 +1,33 @@
-import os
 import sqlite3
 import logging
 
+from .connection import transaction
+
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
 )
 logger = logging.getLogger(__name__)
 
 
-DB_NAME = os.path.join(os.path.dirname(__file__), "payments.db")
-
-
 def create_table_customers() -> None:
     table_name = "customers"
     f"""Create table {table_name} in database bets"""
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(
-            f"""--sql
-            CREATE TABLE IF NOT EXISTS {table_name} (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            telegram_user_id TEXT,
-            telegram_chat_id TEXT,
-            telegram_temp_payment_message_id TEXT,
-            stripe_customer_id TEXT
-            );
-            """
-        )
-        conn.commit()
-        logger.info(f"[+] Table {table_name} created successfully")
+        with transaction() as cursor:
+            cursor.execute(
+                f"""--sql
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                telegram_user_id TEXT,
+                telegram_chat_id TEXT,
+                telegram_temp_payment_message_id TEXT,
+                stripe_customer_id TEXT
+                );
+                """
+            )
+            logger.info(f"[+] Table {table_name} created successfully")
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
@@ -42,20 +38,18 @@ def create_table_products() -> None:
     f"""Create table {table_name} in database bets"""
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(
-            f"""--sql
-            CREATE TABLE IF NOT EXISTS {table_name} (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            stripe_product_id TEXT,
-            quantity INTEGER
-            );
-            """
-        )
-        conn.commit()
-        logger.info(f"[+] Table {table_name} created successfully")
+        with transaction() as cursor:
+            cursor.execute(
+                f"""--sql
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                stripe_product_id TEXT,
+                quantity INTEGER
+                );
+                """
+            )
+            logger.info(f"[+] Table {table_name} created successfully")
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
@@ -66,20 +60,18 @@ def create_table_groups() -> None:
     f"""Create table {table_name} in database bets"""
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(
-            f"""--sql
-            CREATE TABLE IF NOT EXISTS {table_name} (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            telegram_group_id TEXT,
-            product_id REFERENCES products(id) ON UPDATE CASCADE ON DELETE CASCADE
-            );
-            """
-        )
-        conn.commit()
-        logger.info(f"[+] Table {table_name} created successfully")
+        with transaction() as cursor:
+            cursor.execute(
+                f"""--sql
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                telegram_group_id TEXT,
+                product_id REFERENCES products(id) ON UPDATE CASCADE ON DELETE CASCADE
+                );
+                """
+            )
+            logger.info(f"[+] Table {table_name} created successfully")
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
@@ -90,22 +82,20 @@ def create_table_price() -> None:
     f"""Create table {table_name} in database bets"""
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(
-            f"""--sql
-            CREATE TABLE IF NOT EXISTS {table_name} (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,
-            stripe_price_id TEXT,
-            price REAL,
-            currency TEXT,
-            product_id REFERENCES products(id) ON UPDATE CASCADE ON DELETE CASCADE
-            );
-            """
-        )
-        conn.commit()
-        logger.info(f"[+] Table {table_name} created successfully")
+        with transaction() as cursor:
+            cursor.execute(
+                f"""--sql
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT,
+                stripe_price_id TEXT,
+                price REAL,
+                currency TEXT,
+                product_id REFERENCES products(id) ON UPDATE CASCADE ON DELETE CASCADE
+                );
+                """
+            )
+            logger.info(f"[+] Table {table_name} created successfully")
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
@@ -116,24 +106,174 @@ def create_table_subscriptions() -> None:
     f"""Create table {table_name} in database bets"""
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(
-            f"""--sql
-            CREATE TABLE IF NOT EXISTS {table_name} (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            subscription_first_date TEXT,
-            subscription_start_date TEXT,
-            subscription_expiry_date TEXT,
-            stripe_subscription_id TEXT,
-            customer_id REFERENCES customers(id) ON UPDATE CASCADE ON DELETE CASCADE,
-            product_id REFERENCES products(id) ON UPDATE CASCADE ON DELETE CASCADE,
-            price_id REFERENCES price(id) ON UPDATE CASCADE ON DELETE CASCADE
-            );
-            """
+        with transaction() as cursor:
+            cursor.execute(
+                f"""--sql
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                subscription_first_date TEXT,
+                subscription_start_date TEXT,
+                subscription_expiry_date TEXT,
+                stripe_subscription_id TEXT,
+                customer_id REFERENCES customers(id) ON UPDATE CASCADE ON DELETE CASCADE,
+                product_id REFERENCES products(id) ON UPDATE CASCADE ON DELETE CASCADE,
+                price_id REFERENCES price(id) ON UPDATE CASCADE ON DELETE CASCADE
+                );
+                """
+            )
+            logger.info(f"[+] Table {table_name} created successfully")
+
+    except (Exception, sqlite3.DatabaseError) as error:
+        logger.error(f"[-] {error}")
+
+
+def create_table_catalog_version() -> None:
+    table_name = "catalog_version"
+    f"""Create table {table_name} in database bets, bumped by triggers whenever the catalog changes"""
+
+    try:
+        with transaction() as cursor:
+            cursor.execute(
+                f"""--sql
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                version INTEGER NOT NULL
+                );
+                """
+            )
+            cursor.execute(
+                f"INSERT OR IGNORE INTO {table_name} (id, version) VALUES (1, 0)"
+            )
+
+            # Any write to the products, prices or groups invalidates the in-memory catalogs
+            for catalog_table in ["products", "price", "groups"]:
+                for event in ["INSERT", "UPDATE", "DELETE"]:
+                    cursor.execute(
+                        f"""--sql
+                        CREATE TRIGGER IF NOT EXISTS {catalog_table}_{event.lower()}_catalog_version
+                        AFTER {event} ON {catalog_table}
+                        BEGIN
+                            UPDATE {table_name} SET version = version + 1 WHERE id = 1;
+                        END;
+                        """
+                    )
+            logger.info(f"[+] Table {table_name} created successfully")
+
+    except (Exception, sqlite3.DatabaseError) as error:
+        logger.error(f"[-] {error}")
+
+
+def create_table_stripe_events() -> None:
+    table_name = "stripe_events"
+    f"""Create table {table_name} in database bets, the outbox of the Stripe webhook events"""
+
+    try:
+        with transaction() as cursor:
+            cursor.execute(
+                f"""--sql
+                CREATE TABLE IF NOT EXISTS {table_name} (
+                id TEXT PRIMARY KEY,
+                type TEXT,
+                created INTEGER,
+                payload TEXT,
+                received_at TEXT,
+                processed_at TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                attempted_at REAL,
+                error TEXT
+                );
+                """
+            )
+            cursor.execute(
+                f"""--sql
+                CREATE INDEX IF NOT EXISTS {table_name}_pending_index
+                ON {table_name} (created, received_at) WHERE processed_at IS NULL
+                """
+            )
+
+            # The created time of the last event applied to every subscription, the events that
+            # arrive after a newer one are skipped
+            cursor.execute(
+                """--sql
+                CREATE TABLE IF NOT EXISTS stripe_subscription_events (
+                stripe_subscription_id TEXT PRIMARY KEY,
+                created INTEGER NOT NULL,
+                deleted INTEGER NOT NULL DEFAULT 0
+                );
+                """
+            )
+            logger.info(f"[+] Table {table_name} created successfully")
+
+    except (Exception, sqlite3.DatabaseError) as error:
+        logger.error(f"[-] {error}")
+
+
+def create_unique_subscription_index(cursor) -> None:
+    """
+    Make stripe_subscription_id unique, so that /successful_payment and the webhook events can't both
+    create the same subscription
+
+    The older databases have a plain index on the column, the duplicates it allowed are removed first.
+    The row with the latest expiry date of every subscription is kept.
+    """
+
+    index_name = "subscriptions_stripe_subscription_id_index"
+
+    cursor.execute(
+        """
+        SELECT "unique" FROM pragma_index_list('subscriptions') WHERE name = :index_name
+        """,
+        {"index_name": index_name},
+    )
+    row = cursor.fetchone()
+    if row and row[0]:
+        return
+
+    cursor.execute(
+        """
+        DELETE FROM subscriptions
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT
+                    id,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY stripe_subscription_id
+                        ORDER BY subscription_expiry_date DESC, id
+                    ) AS position
+                FROM subscriptions
+                WHERE stripe_subscription_id IS NOT NULL
+            )
+            WHERE position > 1
         )
-        conn.commit()
-        logger.info(f"[+] Table {table_name} created successfully")
+        """
+    )
+    if cursor.rowcount:
+        logger.info(f"[+] Removed {cursor.rowcount} duplicate subscriptions")
+
+    cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+    cursor.execute(
+        f"CREATE UNIQUE INDEX {index_name} ON subscriptions (stripe_subscription_id)"
+    )
+
+
+def create_indexes() -> None:
+    """Create the indexes used by the lookups of the bot and the backend"""
+
+    indexes = {
+        "customers_telegram_user_id_index": "customers (telegram_user_id)",
+        "customers_stripe_customer_id_index": "customers (stripe_customer_id)",
+        "price_product_id_index": "price (product_id)",
+        "price_stripe_price_id_index": "price (stripe_price_id)",
+        "groups_product_id_index": "groups (product_id)",
+        "subscriptions_customer_id_index": "subscriptions (customer_id, product_id)",
+    }
+
+    try:
+        with transaction() as cursor:
+            for index_name, columns in indexes.items():
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {columns}")
+            create_unique_subscription_index(cursor)
+            logger.info("[+] Indexes created successfully")
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
@@ -149,3 +289,9 @@ def create_tables():
     create_table_price()
 
     create_table_subscriptions()
+
+    create_table_catalog_version()
+
+    create_table_stripe_events()
+
+    create_indexes()
@@ -1,14 +1,13 @@
-import os
 import sqlite3
 import logging
 
+from .connection import transaction
+
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
 )
 logger = logging.getLogger(__name__)
 
-DB_NAME = os.path.join(os.path.dirname(__file__), "payments.db")
-
 
 def delete_subscription(stripe_subscription_id: str):
     """
@@ -27,14 +26,9 @@ def delete_subscription(stripe_subscription_id: str):
     """
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        conn.commit()
+        with transaction() as cursor:
+            cursor.execute(query)
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
@@ -1,14 +1,14 @@
-import os
 import sqlite3
 import logging
 
+from . import settings
+from .connection import transaction
+
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
 )
 logger = logging.getLogger(__name__)
 
-DB_NAME = os.path.join(os.path.dirname(__file__), "payments.db")
-
 
 def create_customers(customers: list[dict]) -> None:
     """
@@ -21,35 +21,30 @@ def create_customers(customers: list[dict]) -> None:
         None
     """
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.executemany(
-            """
-            INSERT INTO customers (
-                name,
-                telegram_user_id,
-                telegram_chat_id,
-                telegram_temp_payment_message_id,
-                stripe_customer_id
+        with transaction() as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO customers (
+                    name,
+                    telegram_user_id,
+                    telegram_chat_id,
+                    telegram_temp_payment_message_id,
+                    stripe_customer_id
+                )
+                VALUES (
+                    :name,
+                    :telegram_user_id,
+                    :telegram_chat_id,
+                    :telegram_temp_payment_message_id,
+                    :stripe_customer_id
+                )
+                """,
+                customers,
             )
-            VALUES (
-                :name,
-                :telegram_user_id,
-                :telegram_chat_id,
-                :telegram_temp_payment_message_id,
-                :stripe_customer_id
-            )
-            """,
-            customers,
-        )
-        conn.commit()
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def create_products(products: list[dict]) -> None:
@@ -63,31 +58,26 @@ def create_products(products: list[dict]) -> None:
         None
     """
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.executemany(
-            """
-            INSERT INTO products (
-                name,
-                stripe_product_id,
-                quantity
-            )
-            VALUES (
-                :name,
-                :stripe_product_id,
-                :quantity
+        with transaction() as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO products (
+                    name,
+                    stripe_product_id,
+                    quantity
+                )
+                VALUES (
+                    :name,
+                    :stripe_product_id,
+                    :quantity
+                )
+                """,
+                products,
             )
-            """,
-            products,
-        )
-        conn.commit()
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def create_prices(prices: list[dict]) -> None:
@@ -101,39 +91,37 @@ def create_prices(prices: list[dict]) -> None:
         None
     """
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.executemany(
-            """
-            INSERT INTO price (
-                stripe_price_id,
-                price,
-                currency,
-                product_id
+        with transaction() as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO price (
+                    stripe_price_id,
+                    price,
+                    currency,
+                    product_id
+                )
+                VALUES (
+                    :stripe_price_id,
+                    :price,
+                    :currency,
+                    :product_id
+                )
+                """,
+                prices,
             )
-            VALUES (
-                :stripe_price_id,
-                :price,
-                :currency,
-                :product_id
-            )
-            """,
-            prices,
-        )
-        conn.commit()
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def create_subscriptions(subscriptions: list[dict]) -> None:
     """
     Create new subscriptions using an array of dictionaries
 
+    A subscription that already exists, e.g. created from its webhook event, is only extended when the
+    new period ends later.
+
     Args:
         subscriptions: list[dict] - List of dictionaries containing subscription data
 
@@ -141,39 +129,38 @@ def create_subscriptions(subscriptions: list[dict]) -> None:
         None
     """
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.executemany(
-            """
-            INSERT INTO subscriptions (
-                customer_id,
-                product_id,
-                price_id,
-                stripe_subscription_id,
-                subscription_first_date,
-                subscription_start_date,
-                subscription_expiry_date
-            )
-            VALUES (
-                :customer_id,
-                :product_id,
-                :price_id,
-                :stripe_subscription_id,
-                :subscription_first_date,
-                :subscription_start_date,
-                :subscription_expiry_date
+        with transaction() as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO subscriptions (
+                    customer_id,
+                    product_id,
+                    price_id,
+                    stripe_subscription_id,
+                    subscription_first_date,
+                    subscription_start_date,
+                    subscription_expiry_date
+                )
+                VALUES (
+                    :customer_id,
+                    :product_id,
+                    :price_id,
+                    :stripe_subscription_id,
+                    :subscription_first_date,
+                    :subscription_start_date,
+                    :subscription_expiry_date
+                )
+                ON CONFLICT (stripe_subscription_id) DO UPDATE SET
+                    subscription_start_date = excluded.subscription_start_date,
+                    subscription_expiry_date = excluded.subscription_expiry_date
+                WHERE subscriptions.subscription_expiry_date <= excluded.subscription_expiry_date
+                """,
+                subscriptions,
             )
-            """,
-            subscriptions,
-        )
-        conn.commit()
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def create_groups(groups: list[dict]) -> None:
@@ -187,31 +174,26 @@ def create_groups(groups: list[dict]) -> None:
         None
     """
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.executemany(
-            """
-            INSERT INTO groups (
-                name,
-                telegram_group_id,
-                product_id
+        with transaction() as cursor:
+            cursor.executemany(
+                """
+                INSERT INTO groups (
+                    name,
+                    telegram_group_id,
+                    product_id
+                )
+                VALUES (
+                    :name,
+                    :telegram_group_id,
+                    :product_id
+                )
+                """,
+                groups,
             )
-            VALUES (
-                :name,
-                :telegram_group_id,
-                :product_id
-            )
-            """,
-            groups,
-        )
-        conn.commit()
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def get_customers(
@@ -239,13 +221,12 @@ def get_customers(
         query += f" WHERE stripe_customer_id = '{stripe_customer_id}' "
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        column_names = [column[0] for column in cursor.description]
-        fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        with transaction() as cursor:
+            cursor.execute(query)
+            column_names = [column[0] for column in cursor.description]
+            fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
 
-        return fetched_data
+            return fetched_data
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
@@ -276,19 +257,15 @@ def get_products(
         query += f" WHERE stripe_product_id = '{stripe_product_id}'"
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        column_names = [column[0] for column in cursor.description]
-        fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        with transaction() as cursor:
+            cursor.execute(query)
+            column_names = [column[0] for column in cursor.description]
+            fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
 
-        return fetched_data
+            return fetched_data
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def get_prices(
@@ -316,19 +293,15 @@ def get_prices(
         query += f" WHERE stripe_price_id = '{stripe_price_id}'"
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        column_names = [column[0] for column in cursor.description]
-        fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        with transaction() as cursor:
+            cursor.execute(query)
+            column_names = [column[0] for column in cursor.description]
+            fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
 
-        return fetched_data
+            return fetched_data
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def get_subscriptions(
@@ -360,19 +333,15 @@ def get_subscriptions(
         query += f" WHERE stripe_subscription_id = '{stripe_subscription_id}'"
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        column_names = [column[0] for column in cursor.description]
-        fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        with transaction() as cursor:
+            cursor.execute(query)
+            column_names = [column[0] for column in cursor.description]
+            fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
 
-        return fetched_data
+            return fetched_data
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def get_groups(product_id: int = None) -> list[dict] | bool:
@@ -394,36 +363,67 @@ def get_groups(product_id: int = None) -> list[dict] | bool:
         query += f" WHERE product_id = {product_id}"
 
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        column_names = [column[0] for column in cursor.description]
-        fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
+        with transaction() as cursor:
+            cursor.execute(query)
+            column_names = [column[0] for column in cursor.description]
+            fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
 
-        return fetched_data
+            return fetched_data
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
-def get_base_url():
+def get_subscriptions_with_products(
+    customer_id: int = None, stripe_subscription_id: str = None
+) -> list[dict] | bool:
+    """
+    Get subscriptions joined with their product in a single query
+
+    Args:
+        customer_id: int (Optional) - Customer ID
+        stripe_subscription_id: str (Optional) - Stripe subscription ID
+
+    Returns:
+        list[dict] | bool - List of dictionaries containing the subscription data, with the product columns
+        prefixed with "product_", or False if an error occurs
+    """
 
-    settings_db = os.path.join(os.path.dirname(__file__), "backend.db")
     query = """--sql
-    SELECT value FROM settings WHERE name = "base_url"
+    SELECT
+        subscriptions.*,
+        products.name AS product_name,
+        products.stripe_product_id AS product_stripe_product_id
+    FROM subscriptions
+    JOIN products ON products.id = subscriptions.product_id
     """
+    params = {}
+
+    if customer_id:
+        query += " WHERE subscriptions.customer_id = :customer_id"
+        params["customer_id"] = customer_id
+    elif stripe_subscription_id:
+        query += " WHERE subscriptions.stripe_subscription_id = :stripe_subscription_id"
+        params["stripe_subscription_id"] = stripe_subscription_id
 
     try:
-        conn = sqlite3.connect(settings_db)
-        cursor = conn.cursor()
-        cursor.execute(query)
-        return cursor.fetchone()[0]
+        with transaction() as cursor:
+            cursor.execute(query, params)
+            column_names = [column[0] for column in cursor.description]
+            fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
+
+            return fetched_data
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
+
+
+def get_base_url():
+    """
+    Get the public URL of the backend, served from memory by the settings store
+
+    Returns:
+        str | bool - The base URL or False if it can't be read
+    """
+
+    return settings.get("base_url", False)
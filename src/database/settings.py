@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import logging
+import threading
+
+from . import connection
+from .connection import transaction
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsStore:
+    """
+    In-memory copy of the settings table of the backend database
+
+    The settings are loaded once and served from memory. update() is called by the writer in the same
+    process, and the other processes notice a write through the modification time and size of the database
+    and its WAL file, which only costs a stat call per lookup instead of a query.
+
+    Args:
+        db_name: str (Optional) - Path of the database, defaults to the backend database
+    """
+
+    def __init__(self, db_name=None):
+        self.db_name = db_name
+
+        self.values = None
+        self.signature = None
+
+        self._lock = threading.Lock()
+
+    def get_db_name(self):
+        return self.db_name or connection.BACKEND_DB_NAME
+
+    def file_signature(self):
+        """Modification time and size of the database files, None for the files that don't exist"""
+
+        db_name = self.get_db_name()
+        signature = []
+        for path in [db_name, f"{db_name}-wal"]:
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+
+        return tuple(signature)
+
+    def load(self):
+        """Load all the settings from the database"""
+
+        # The signature is taken first, a write made while loading changes it and triggers another reload
+        signature = self.file_signature()
+
+        with transaction(self.get_db_name()) as cursor:
+            cursor.execute("SELECT name, value FROM settings")
+            self.values = dict(cursor.fetchall())
+
+        self.signature = signature
+
+    def get(self, name, default=None):
+        """
+        Get a setting, only reading the database when it has changed since the settings were loaded
+
+        Args:
+            name: str - Name of the setting
+            default: Any (Optional) - Value returned when the setting is missing or can't be read
+
+        Returns:
+            Any - The value of the setting
+        """
+
+        with self._lock:
+            try:
+                if self.values is None or self.file_signature() != self.signature:
+                    self.load()
+            except (Exception, sqlite3.DatabaseError) as error:
+                logger.error(f"[-] {error}")
+                return default
+
+            return self.values.get(name, default)
+
+    def update(self, values):
+        """
+        Apply settings that were just written to the database by this process
+
+        Args:
+            values: dict - Mapping between the names and the new values of the settings
+        """
+
+        with self._lock:
+            if self.values is None:
+                return
+
+            self.values.update(values)
+            self.signature = self.file_signature()
+
+
+SETTINGS = SettingsStore()
+
+
+def get(name, default=None):
+    return SETTINGS.get(name, default)
+
+
+def update(values):
+    SETTINGS.update(values)
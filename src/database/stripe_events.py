@@ -0,0 +1,342 @@
+import json
+import time
+import sqlite3
+import logging
+import datetime
+
+from .connection import transaction
+from ..config import STRIPE_EVENT_MAX_ATTEMPTS, STRIPE_EVENT_RETRY_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def create_stripe_event(event: dict) -> bool:
+    """
+    Store a Stripe webhook event in the outbox, the events that are already stored are ignored
+
+    Args:
+        event: dict - The Stripe event, as sent to the webhook
+
+    Returns:
+        bool - True if the event is stored (now or by an earlier delivery) or False if an error occurs
+    """
+
+    try:
+        with transaction() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO stripe_events (id, type, created, payload, received_at)
+                VALUES (:id, :type, :created, :payload, :received_at)
+                ON CONFLICT (id) DO NOTHING
+                """,
+                {
+                    "id": event["id"],
+                    "type": event["type"],
+                    "created": event.get("created"),
+                    "payload": json.dumps(event),
+                    "received_at": datetime.datetime.now(datetime.UTC).strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    ),
+                },
+            )
+            if cursor.rowcount == 0:
+                logger.info(f"[+] Stripe event {event['id']} was already received")
+
+            return True
+    except (Exception, sqlite3.DatabaseError) as error:
+        logger.error(f"[-] {error}")
+        return False
+
+
+def get_pending_stripe_events(
+    limit: int = 100, retry_delay: float = STRIPE_EVENT_RETRY_SECONDS
+) -> list[dict] | bool:
+    """
+    Get the events of the outbox that still have to be applied, oldest first
+
+    Args:
+        limit: int (Optional) - Maximum number of events to return
+        retry_delay: float (Optional) - Number of seconds before a failed event is returned again
+
+    Returns:
+        list[dict] | bool - List of dictionaries containing the event data or False if an error occurs
+    """
+
+    try:
+        with transaction() as cursor:
+            cursor.execute(
+                """
+                SELECT * FROM stripe_events
+                WHERE processed_at IS NULL AND attempts < :max_attempts
+                AND (attempted_at IS NULL OR attempted_at <= :retry_before)
+                ORDER BY created, received_at
+                LIMIT :limit
+                """,
+                {
+                    "max_attempts": STRIPE_EVENT_MAX_ATTEMPTS,
+                    "retry_before": time.time() - retry_delay,
+                    "limit": limit,
+                },
+            )
+            column_names = [column[0] for column in cursor.description]
+            fetched_data = [dict(zip(column_names, row)) for row in cursor.fetchall()]
+
+            return fetched_data
+    except (Exception, sqlite3.DatabaseError) as error:
+        logger.error(f"[-] {error}")
+        return False
+
+
+def to_date(timestamp):
+    return datetime.datetime.fromtimestamp(timestamp, datetime.UTC).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+
+
+# The subscriptions in these statuses give access, their period is saved
+ACTIVE_SUBSCRIPTION_STATUSES = {"active", "trialing"}
+
+# The subscriptions in these statuses won't give access again, they are removed. The other ones, e.g.
+# past_due or incomplete, can still be paid and are left as they are
+TERMINAL_SUBSCRIPTION_STATUSES = {"canceled", "unpaid", "incomplete_expired"}
+
+
+def is_stale_subscription_event(
+    cursor, subscription: dict, created: int, deleted: bool
+) -> bool:
+    """
+    Record the event as the last one applied to its subscription, unless a newer one was already applied
+
+    A deletion wins over the other events created in the same second, so that a late
+    customer.subscription.updated event never brings a deleted subscription back.
+
+    Args:
+        cursor: sqlite3.Cursor - Cursor of the transaction that applies the event
+        subscription: dict - The subscription object of the event
+        created: int - Unix timestamp the event was created at
+        deleted: bool - Whether the event deletes the subscription
+
+    Returns:
+        bool - True if the event is older than the last one applied and must be skipped
+    """
+
+    cursor.execute(
+        """
+        INSERT INTO stripe_subscription_events (stripe_subscription_id, created, deleted)
+        VALUES (:stripe_subscription_id, :created, :deleted)
+        ON CONFLICT (stripe_subscription_id) DO UPDATE SET
+            created = excluded.created,
+            deleted = excluded.deleted
+        WHERE excluded.created > stripe_subscription_events.created
+        OR (
+            excluded.created = stripe_subscription_events.created
+            AND NOT stripe_subscription_events.deleted
+        )
+        """,
+        {
+            "stripe_subscription_id": subscription["id"],
+            "created": created or 0,
+            "deleted": int(deleted),
+        },
+    )
+
+    if cursor.rowcount == 0:
+        logger.info(
+            f"[+] Stripe event of subscription {subscription['id']} is older than the last one applied...skipping it"
+        )
+        return True
+
+    return False
+
+
+def apply_subscription(cursor, subscription: dict, created: int) -> None:
+    """Create or extend a subscription from a customer.subscription.created/updated event"""
+
+    if is_stale_subscription_event(cursor, subscription, created, deleted=False):
+        return
+
+    status = subscription.get("status", "active")
+
+    # A subscription that doesn't give access anymore is removed like a deleted one
+    if status in TERMINAL_SUBSCRIPTION_STATUSES:
+        logger.info(f"[+] Subscription {subscription['id']} is {status}...removing it")
+        delete_subscription(cursor, subscription)
+        return
+
+    if status not in ACTIVE_SUBSCRIPTION_STATUSES:
+        logger.info(
+            f"[+] Subscription {subscription['id']} is {status}...leaving it unchanged"
+        )
+        return
+
+    items = subscription.get("items", {}).get("data")
+    price = items[0]["price"] if items else subscription["plan"]
+    params = {
+        "stripe_subscription_id": subscription["id"],
+        "stripe_customer_id": subscription["customer"],
+        "stripe_price_id": price["id"],
+        "subscription_first_date": to_date(subscription["start_date"]),
+        "subscription_start_date": to_date(subscription["current_period_start"]),
+        "subscription_expiry_date": to_date(subscription["current_period_end"]),
+    }
+
+    # The subscription can only be created for a customer that is already known, the other ones are
+    # created by /successful_payment which knows their Telegram user. Events can arrive out of order,
+    # so an older period never replaces a newer one
+    cursor.execute(
+        """
+        INSERT INTO subscriptions (
+            customer_id,
+            product_id,
+            price_id,
+            stripe_subscription_id,
+            subscription_first_date,
+            subscription_start_date,
+            subscription_expiry_date
+        )
+        SELECT
+            customers.id,
+            price.product_id,
+            price.id,
+            :stripe_subscription_id,
+            :subscription_first_date,
+            :subscription_start_date,
+            :subscription_expiry_date
+        FROM customers, price
+        WHERE customers.stripe_customer_id = :stripe_customer_id
+        AND price.stripe_price_id = :stripe_price_id
+        LIMIT 1
+        ON CONFLICT (stripe_subscription_id) DO UPDATE SET
+            subscription_start_date = excluded.subscription_start_date,
+            subscription_expiry_date = excluded.subscription_expiry_date
+        WHERE subscriptions.subscription_expiry_date <= excluded.subscription_expiry_date
+        """,
+        params,
+    )
+
+
+def apply_invoice(cursor, invoice: dict, created: int) -> None:
+    """Extend a subscription to the period paid by an invoice.paid/payment_succeeded event"""
+
+    lines = invoice.get("lines", {}).get("data")
+    if not invoice.get("subscription") or not lines:
+        return
+
+    period = lines[0]["period"]
+    cursor.execute(
+        """
+        UPDATE subscriptions
+        SET subscription_start_date = :subscription_start_date,
+            subscription_expiry_date = :subscription_expiry_date
+        WHERE stripe_subscription_id = :stripe_subscription_id
+        AND subscription_expiry_date <= :subscription_expiry_date
+        """,
+        {
+            "stripe_subscription_id": invoice["subscription"],
+            "subscription_start_date": to_date(period["start"]),
+            "subscription_expiry_date": to_date(period["end"]),
+        },
+    )
+
+    # Retried later, the invoice can arrive before the event that creates the subscription
+    if cursor.rowcount == 0:
+        cursor.execute(
+            "SELECT 1 FROM subscriptions WHERE stripe_subscription_id = :stripe_subscription_id",
+            {"stripe_subscription_id": invoice["subscription"]},
+        )
+        if not cursor.fetchone():
+            raise LookupError(
+                f"Subscription {invoice['subscription']} is not in the database yet"
+            )
+
+
+def delete_subscription(cursor, subscription: dict) -> None:
+    cursor.execute(
+        "DELETE FROM subscriptions WHERE stripe_subscription_id = :stripe_subscription_id",
+        {"stripe_subscription_id": subscription["id"]},
+    )
+
+
+def apply_subscription_deleted(cursor, subscription: dict, created: int) -> None:
+    """Remove a subscription from a customer.subscription.deleted event"""
+
+    if is_stale_subscription_event(cursor, subscription, created, deleted=True):
+        return
+
+    delete_subscription(cursor, subscription)
+
+
+EVENT_HANDLERS = {
+    "customer.subscription.created": apply_subscription,
+    "customer.subscription.updated": apply_subscription,
+    "customer.subscription.deleted": apply_subscription_deleted,
+    "invoice.paid": apply_invoice,
+    "invoice.payment_succeeded": apply_invoice,
+}
+
+
+def process_stripe_event(stripe_event: dict) -> bool:
+    """
+    Apply an event of the outbox to the database and mark it as processed in the same transaction
+
+    A failed event is rolled back and its attempt is recorded, it is retried until it reaches
+    STRIPE_EVENT_MAX_ATTEMPTS. Event types without a handler are marked as processed without changes.
+
+    Args:
+        stripe_event: dict - The event, as returned by get_pending_stripe_events
+
+    Returns:
+        bool - True if the event was applied or False if an error occurs
+    """
+
+    event_id, event_type = stripe_event["id"], stripe_event["type"]
+
+    try:
+        with transaction() as cursor:
+            # Another worker may have processed the event in the meantime
+            cursor.execute(
+                """
+                UPDATE stripe_events
+                SET processed_at = :processed_at,
+                    attempts = attempts + 1,
+                    attempted_at = :attempted_at,
+                    error = NULL
+                WHERE id = :id AND processed_at IS NULL
+                """,
+                {
+                    "id": event_id,
+                    "attempted_at": time.time(),
+                    "processed_at": datetime.datetime.now(datetime.UTC).strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    ),
+                },
+            )
+            if cursor.rowcount == 0:
+                return True
+
+            handler = EVENT_HANDLERS.get(event_type)
+            if handler:
+                payload = json.loads(stripe_event["payload"])
+                handler(cursor, payload["data"]["object"], payload.get("created"))
+            else:
+                logger.info(f"[+] Unhandled Stripe event type {event_type}")
+
+            return True
+    except (Exception, sqlite3.DatabaseError) as error:
+        logger.error(f"[-] Failed to apply Stripe event {event_id}: {error}")
+        failure = str(error)
+
+    try:
+        with transaction() as cursor:
+            cursor.execute(
+                """
+                UPDATE stripe_events
+                SET attempts = attempts + 1, attempted_at = :attempted_at, error = :error
+                WHERE id = :id
+                """,
+                {"id": event_id, "attempted_at": time.time(), "error": failure},
+            )
+    except (Exception, sqlite3.DatabaseError) as error:
+        logger.error(f"[-] {error}")
+
+    return False
@@ -1,14 +1,14 @@
-import os
 import sqlite3
 import logging
 
+from . import connection, settings
+from .connection import transaction
+
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
 )
 logger = logging.getLogger(__name__)
 
-DB_NAME = os.path.join(os.path.dirname(__file__), "payments.db")
-
 
 def update_temp_payment_message_id(
     telegram_user_id: str, temp_payment_message_id: str
@@ -24,58 +24,52 @@ def update_temp_payment_message_id(
         None
     """
     try:
-        conn = sqlite3.connect(DB_NAME)
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            UPDATE customers
-            SET telegram_temp_payment_message_id = :temp_payment_message_id
-            WHERE telegram_user_id = :telegram_user_id
-            """,
-            {
-                "telegram_user_id": telegram_user_id,
-                "temp_payment_message_id": temp_payment_message_id,
-            },
-        )
-        conn.commit()
+        with transaction() as cursor:
+            cursor.execute(
+                """
+                UPDATE customers
+                SET telegram_temp_payment_message_id = :temp_payment_message_id
+                WHERE telegram_user_id = :telegram_user_id
+                """,
+                {
+                    "telegram_user_id": telegram_user_id,
+                    "temp_payment_message_id": temp_payment_message_id,
+                },
+            )
 
     except (Exception, sqlite3.DatabaseError) as error:
         logger.error(f"[-] {error}")
         return False
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def update_ngrok_url(base_url: str) -> None:
-    settings_db_path = os.path.join(os.path.dirname(__file__), "backend.db")
-    conn = sqlite3.connect(settings_db_path)
-    cursor = conn.cursor()
-
-    cursor.execute(
-        """
-        CREATE TABLE IF NOT EXISTS settings (
-            id PRIMARY KEY,
-            name TEXT,
-            value TEXT
-            )
-        """
-    )
+    with transaction(connection.BACKEND_DB_NAME) as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS settings (
+                id PRIMARY KEY,
+                name TEXT,
+                value TEXT
+                )
+            """
+        )
 
-    cursor.execute(
-        """
-        UPDATE settings
-        SET value = :ngrok_url
-        WHERE name = "base_url"
-        """,
-        {"ngrok_url": base_url},
-    )
-    if cursor.rowcount == 0:
         cursor.execute(
             """
-            INSERT INTO settings (name, value)
-            VALUES ("base_url", :ngrok_url)
+            UPDATE settings
+            SET value = :ngrok_url
+            WHERE name = "base_url"
             """,
             {"ngrok_url": base_url},
         )
-    conn.commit()
+        if cursor.rowcount == 0:
+            cursor.execute(
+                """
+                INSERT INTO settings (name, value)
+                VALUES ("base_url", :ngrok_url)
+                """,
+                {"ngrok_url": base_url},
+            )
+
+    # Let the settings store of this process know about the new URL, the others notice the file change
+    settings.update({"base_url": base_url})
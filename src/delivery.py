@@ -0,0 +1,291 @@
+import time
+import asyncio
+import logging
+import requests
+
+from .config import (
+    TELEGRAM_API_URL,
+    TELEGRAM_GLOBAL_RATE,
+    TELEGRAM_PER_CHAT_RATE,
+    TELEGRAM_SEND_RETRIES,
+    TELEGRAM_DELETE_BATCH_SIZE,
+)
+from .utils import send_message, edit_message, delete_messages
+
+
+class TokenBucket:
+    """
+    Asynchronous token bucket rate limiter
+
+    The bucket can be shared by several asyncio.run calls, it keeps its tokens and pauses between them.
+
+    Args:
+        rate: float - Number of tokens added per second
+        capacity: float (Optional) - Maximum number of tokens that can be saved up for a burst
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0
+
+        # An asyncio lock only works in the event loop it was first used in
+        self.lock = None
+        self.lock_loop = None
+
+    def get_lock(self):
+        loop = asyncio.get_running_loop()
+        if self.lock_loop is not loop:
+            self.lock, self.lock_loop = asyncio.Lock(), loop
+
+        return self.lock
+
+    def pause(self, seconds):
+        """Stop handing out tokens for the given number of seconds (e.g. after a 429)"""
+
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+    async def acquire(self):
+        async with self.get_lock():
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) * self.rate
+                )
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class TelegramSender:
+    """
+    Sends messages to several Telegram chats in parallel while staying under the Telegram rate limits
+
+    The messages of a chat are sent one after the other so that they arrive in order, each chat has
+    its own token bucket and all the chats share a global one. A message given with the id of a
+    message that was already posted replaces its text instead. The edits and the deletions count
+    against the same limits, so a single sender is shared by all the calls of the poller.
+
+    Args:
+        token: str - Telegram bot token
+        global_rate: float (Optional) - Maximum messages per second over all the chats
+        per_chat_rate: float (Optional) - Maximum messages per second in a single chat
+        retries: int (Optional) - Number of attempts for each message
+        api_url: str (Optional) - Base URL of the Telegram Bot API
+    """
+
+    def __init__(
+        self,
+        token,
+        global_rate=TELEGRAM_GLOBAL_RATE,
+        per_chat_rate=TELEGRAM_PER_CHAT_RATE,
+        retries=TELEGRAM_SEND_RETRIES,
+        api_url=TELEGRAM_API_URL,
+    ):
+        self.token = token
+        self.per_chat_rate = per_chat_rate
+        self.retries = retries
+        self.api_url = api_url
+
+        self.global_bucket = TokenBucket(global_rate)
+        self.chat_buckets = {}
+
+    def get_chat_bucket(self, chat_id):
+        if chat_id not in self.chat_buckets:
+            self.chat_buckets[chat_id] = TokenBucket(self.per_chat_rate, capacity=1)
+
+        return self.chat_buckets[chat_id]
+
+    async def call(self, chat_id, function, *args):
+        """
+        Call the Telegram API for a chat, waiting for the rate limiters and retrying on 429s and network errors
+
+        Args:
+            chat_id: str - Telegram chat id
+            function: callable - Function of utils that makes the call, e.g. send_message
+            args: tuple - Arguments of the function after the token and the chat id
+
+        Returns:
+            dict | None - The Telegram response, which can be a refusal, or None if every attempt failed
+        """
+
+        chat_bucket = self.get_chat_bucket(chat_id)
+        backoff_delay = 1
+
+        for _ in range(self.retries):
+            await chat_bucket.acquire()
+            await self.global_bucket.acquire()
+
+            try:
+                response = await asyncio.to_thread(
+                    function, self.token, chat_id, *args, self.api_url
+                )
+            except (requests.RequestException, ValueError) as e:
+                logging.warning(
+                    f"Failed to call {function.__name__} in {chat_id}: {e}...retrying in {backoff_delay} seconds"
+                )
+                await asyncio.sleep(backoff_delay)
+                backoff_delay *= 2
+                continue
+
+            # Telegram tells us how long to wait when we are being rate limited
+            retry_after = response.get("parameters", {}).get("retry_after")
+            if not response.get("ok") and retry_after:
+                logging.warning(
+                    f"Rate limited by Telegram in chat {chat_id}...retrying in {retry_after} seconds"
+                )
+                chat_bucket.pause(retry_after)
+                continue
+
+            return response
+
+        logging.error(
+            f"Failed to call {function.__name__} in {chat_id} after {self.retries} attempts"
+        )
+        return None
+
+    async def send(self, chat_id, message, message_id=None):
+        """
+        Send a single message, or replace the text of a posted message
+
+        Args:
+            chat_id: str - Telegram chat id
+            message: str - HTML formatted message
+            message_id: int (Optional) - Id of a posted message to edit instead of sending a new one
+
+        Returns:
+            dict | None - The Telegram response or None if every attempt failed
+        """
+
+        if message_id:
+            response = await self.call(chat_id, edit_message, message_id, message)
+            if not response or response.get("ok"):
+                return response
+
+            description = response.get("description", "")
+
+            # The message already shows these odds
+            if "message is not modified" in description:
+                return {"ok": True, "result": {"message_id": message_id}}
+
+            # The message was deleted or is too old to be edited, so it is posted again
+            if "message to edit not found" not in description and (
+                "message can't be edited" not in description
+            ):
+                logging.error(f"Telegram refused the edit in {chat_id}: {response}")
+                return response
+
+            logging.info(
+                f"Message {message_id} in {chat_id} can't be edited...sending a new one"
+            )
+
+        response = await self.call(chat_id, send_message, message)
+        if response and not response.get("ok"):
+            logging.error(f"Telegram refused the message to {chat_id}: {response}")
+
+        return response
+
+    async def delete_chat(self, chat_id, message_ids):
+        """
+        Delete messages of a chat with deleteMessages, up to TELEGRAM_DELETE_BATCH_SIZE messages per call
+
+        Args:
+            chat_id: str - Telegram chat id
+            message_ids: list[int] - Ids of the messages to delete
+
+        Returns:
+            list - The Telegram response of every batch, in the order of the message ids
+        """
+
+        responses = []
+        for start in range(0, len(message_ids), TELEGRAM_DELETE_BATCH_SIZE):
+            batch = message_ids[start : start + TELEGRAM_DELETE_BATCH_SIZE]
+            response = await self.call(chat_id, delete_messages, batch)
+            if response and not response.get("ok"):
+                logging.error(f"Telegram refused the deletion in {chat_id}: {response}")
+            responses.append(response)
+
+        return responses
+
+    async def delete_all(self, message_ids_by_chat):
+        """
+        Delete the messages of every chat, the chats are handled in parallel
+
+        Args:
+            message_ids_by_chat: dict - Mapping between each chat id and the ids of the messages to delete
+
+        Returns:
+            dict - Mapping between each chat id and the Telegram responses of its batches
+        """
+
+        chat_ids = list(message_ids_by_chat)
+        responses = await asyncio.gather(
+            *[
+                self.delete_chat(chat_id, message_ids_by_chat[chat_id])
+                for chat_id in chat_ids
+            ]
+        )
+
+        return dict(zip(chat_ids, responses))
+
+    async def send_chat(self, chat_id, messages):
+        """
+        Send the messages of a chat in order
+
+        Args:
+            chat_id: str - Telegram chat id
+            messages: list - The messages, either a text or a (text, message_id) pair to edit a message
+
+        Returns:
+            list - The Telegram response of every message
+        """
+
+        responses = []
+        for message in messages:
+            text, message_id = (message, None) if isinstance(message, str) else message
+            responses.append(await self.send(chat_id, text, message_id))
+
+        return responses
+
+    async def send_all(self, messages_by_chat):
+        """
+        Send the messages of every chat, the chats are handled in parallel
+
+        Args:
+            messages_by_chat: dict - Mapping between each chat id and the list of messages to send to it,
+                see send_chat
+
+        Returns:
+            dict - Mapping between each chat id and the list of Telegram responses
+        """
+
+        chat_ids = list(messages_by_chat)
+        responses = await asyncio.gather(
+            *[
+                self.send_chat(chat_id, messages_by_chat[chat_id])
+                for chat_id in chat_ids
+            ]
+        )
+
+        return dict(zip(chat_ids, responses))
+
+
+async def send_messages_with_retry(token, messages_by_chat, sender=None, **kwargs):
+    sender = sender or TelegramSender(token, **kwargs)
+    return await sender.send_all(messages_by_chat)
+
+
+async def delete_messages_with_retry(token, message_ids_by_chat, sender=None, **kwargs):
+    sender = sender or TelegramSender(token, **kwargs)
+    return await sender.delete_all(message_ids_by_chat)
@@ -0,0 +1,47 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_TIMEOUT
+
+
+def create_session(
+    pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE
+):
+    """
+    Create a requests session that keeps its connections alive in a pool
+
+    Args:
+        pool_connections: int (Optional) - Number of hosts to keep connection pools for
+        pool_maxsize: int (Optional) - Maximum number of connections kept alive per host
+
+    Returns:
+        requests.Session - The pooled session
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+# Shared by the BetBurger polling and the Telegram delivery so that connections are reused between calls
+SESSION = create_session()
+
+
+def request(method, url, timeout=HTTP_TIMEOUT, **kwargs):
+    """
+    Send a request through the shared session, always with a timeout so a hung socket can't stall the scheduler
+
+    Args:
+        method: str - HTTP method
+        url: str - URL to send the request to
+        timeout: float | tuple (Optional) - Connect and read timeouts in seconds
+        kwargs: dict - Any other arguments accepted by requests
+
+    Returns:
+        requests.Response - The response
+    """
+
+    return SESSION.request(method, url, timeout=timeout, **kwargs)
@@ -1,84 +1,333 @@
 import time
+import asyncio
 import logging
 import schedule
+import pandas as pd
 
 from .bot_db import Database
-from .config import BASE_MESSAGE, SPORT_EMOJI_MAPPING, TIME_ZONE, FREQUENCY_SECONDS
+from .bet_cache import RecentBetCache
+from .bet_mapping import get_betting_mapping
+from .config import (
+    BASE_MESSAGE,
+    REPRICED_BET_MESSAGE,
+    SPORT_EMOJI_MAPPING,
+    TIME_ZONE,
+    FREQUENCY_SECONDS,
+    TELEGRAM_DELETE_BATCH_SIZE,
+    TELEGRAM_MESSAGE_PACKING,
+)
 from .utils import (
-    process_bets_with_retry,
-    format_messages,
-    load_duplicate_records,
-    insert_new_bets,
-    send_message,
+    iter_bets,
+    format_message_groups,
+    pack_messages,
+    get_group_bets,
+    sync_bets,
+)
+from .delivery import (
+    TelegramSender,
+    send_messages_with_retry,
+    delete_messages_with_retry,
 )
 
 
 from .credentials import (
     BET_BURGER_TOKEN,
-    BET_BURGER_FILTER_ID,
+    BET_BURGER_FILTER_IDS,
     TELEGRAM_AUTH_TOKEN,
     TELEGRAM_CHAT_MAPPING,
 )
 
+# Recently seen bets and their price, kept between the scheduled runs
+RECENT_BETS = RecentBetCache()
 
-def main():
+# The groups every filter had at the last poll, they stand in for the pages skipped at the next one
+POLL_STATE = {}
 
-    # Connect to the database
-    with Database() as db:
+# The rate limits of Telegram cover the sends, edits and deletions of every page and every poll
+TELEGRAM_SENDER = TelegramSender(TELEGRAM_AUTH_TOKEN)
 
-        bets = process_bets_with_retry(BET_BURGER_TOKEN, BET_BURGER_FILTER_ID)
 
-        # Check if there are any bets retrieved from the API
-        if not bets.empty:
-            print(list(bets.id))
-            logging.info(f"{len(bets)} Bets retrieved from the API")
+def pack_chat_messages(bets_df, messages, message_ids):
+    """
+    Pack the formatted messages of a chat as configured by TELEGRAM_MESSAGE_PACKING
 
-            # Retrieve duplicate records, if they exist, from the database
-            new_bets_df = load_duplicate_records(bets, db)
+    The groups of a posted message are packed again into that message, the ones that don't fit in it
+    anymore are posted as new messages. The other groups are packed by event or by league.
 
-            # Only if there are new bets, insert them into the database and send the messages to the Telegram channel
-            if not new_bets_df.empty:
-                # Define the mapping between pandas dtypes and SQLite3 dtypes
+    Args:
+        bets_df: pd.DataFrame - The bets the messages were formatted from
+        messages: list[tuple[tuple, str]] - The groups and messages, as returned by format_message_groups
+        message_ids: dict - The id of the posted message of every group that has one
 
-                logging.info("New bets found")
-                new_bets = new_bets_df.to_dict("records")
+    Returns:
+        list[tuple[list, str, int | None]] - The groups, text and id of the message to edit of every message
+    """
 
-                # Insert the new bets into the database
-                insert_new_bets(db, new_bets_df, new_bets)
-                logging.info(f"{len(new_bets)} New bets inserted into the database")
+    if TELEGRAM_MESSAGE_PACKING == "league":
+        leagues = dict(zip(bets_df["bookmaker_event_id"], bets_df["league"]))
+        get_pack_key = lambda group: leagues.get(group[0])
+    elif TELEGRAM_MESSAGE_PACKING == "event":
+        get_pack_key = lambda group: group[0]
+    else:
+        get_pack_key = lambda group: group
 
-                for sport_id, sport_bets_df in new_bets_df.groupby("sport_id"):
+    pack_keys = [
+        ("message", message_ids[group]) if group in message_ids else get_pack_key(group)
+        for group, _ in messages
+    ]
 
-                    sport_id_str = str(sport_id)
-                    sport_emoji = SPORT_EMOJI_MAPPING.get(sport_id_str, "")
-                    chat_id = TELEGRAM_CHAT_MAPPING.get(sport_id_str)
+    # The messages of a pack key are made consecutive, in the order the keys first appear
+    key_order = {}
+    for pack_key in pack_keys:
+        key_order.setdefault(pack_key, len(key_order))
+    order = sorted(range(len(messages)), key=lambda index: key_order[pack_keys[index]])
 
-                    # If the chat_id is not found, don't send the bet
-                    if not chat_id:
-                        continue
+    packed_messages = []
+    edited_message_ids = set()
+    for groups, text in pack_messages(
+        [messages[index] for index in order], [pack_keys[index] for index in order]
+    ):
+        message_id = message_ids.get(groups[0])
+        if message_id in edited_message_ids:
+            message_id = None
+        edited_message_ids.add(message_id)
+        packed_messages.append((groups, text, message_id))
 
-                    # Format the bets into messages
-                    messages = format_messages(sport_bets_df, BASE_MESSAGE, TIME_ZONE, sport_emoji)
-                    logging.info(f"Formatted about {len(messages)} messages for sport id {sport_id}")
+    return packed_messages
 
-                    # Send the messages to the Telegram channel
-                    for message in messages:
 
-                        send_message(TELEGRAM_AUTH_TOKEN, chat_id, message)
-                        time.sleep(3)
+def format_messages_by_chat(db, bets_df, repriced, messages_by_chat, live_bet_ids=None):
+    """
+    Format the bets of every sport into messages for the Telegram channel of the sport
 
-                    logging.info(f"Sent {len(messages)} messages to the Telegram channel with id {chat_id}")
-            else:
-                logging.warning("Duplicate records retrieved from the database...skipping the process")
-        else:
+    The groups that were not posted yet are posted. The groups that already have a message, because
+    one of their bets was re-priced or a new bet joined them, are formatted again from all their stored
+    bets and replace that message.
+
+    Args:
+        db: Database - The bets database
+        bets_df: pd.DataFrame - The new or the re-priced bets
+        repriced: bool - Whether the bets are re-priced
+        messages_by_chat: dict - The (groups, text, message_id) to send to every chat, filled in place
+        live_bet_ids: set (Optional) - Ids of the bets that are still in the feed, the other stored bets
+            of a group are left out of its message
+    """
+
+    for sport_id, sport_bets_df in bets_df.groupby("sport_id"):
+
+        sport_id_str = str(sport_id)
+        sport_emoji = SPORT_EMOJI_MAPPING.get(sport_id_str, "")
+        chat_id = TELEGRAM_CHAT_MAPPING.get(sport_id_str)
+
+        # If the chat_id is not found, don't send the bet
+        if not chat_id:
+            continue
+
+        groups = list(
+            zip(
+                sport_bets_df["bookmaker_event_id"].tolist(),
+                sport_bets_df["market_and_bet_type"].tolist(),
+            )
+        )
+        message_ids = db.get_message_ids(chat_id, groups)
+
+        # A packed message is formatted again with all the groups it shows
+        message_ids.update(db.get_message_groups(chat_id, message_ids.values()))
+        if repriced or message_ids:
+            sport_bets_df = get_group_bets(db, groups + list(message_ids))
+            sport_bets_df = sport_bets_df[sport_bets_df["sport_id"] == sport_id]
+            if live_bet_ids is not None:
+                sport_bets_df = sport_bets_df[sport_bets_df["id"].isin(live_bet_ids)]
+
+        base_message = REPRICED_BET_MESSAGE if repriced else BASE_MESSAGE
+
+        # Format the bets into messages
+        messages = format_message_groups(sport_bets_df, base_message, TIME_ZONE, sport_emoji)
+        logging.info(f"Formatted about {len(messages)} messages for sport id {sport_id}")
+
+        messages_by_chat.setdefault(chat_id, []).extend(
+            pack_chat_messages(sport_bets_df, messages, message_ids)
+        )
+
+
+def send_new_bets(db, bets, live_bet_ids=None):
+    """
+    Store the new and re-priced bets, post the new ones and update the messages of the re-priced ones
+
+    Args:
+        db: Database - The bets database
+        bets: pd.DataFrame - The bets of a page
+        live_bet_ids: set (Optional) - Ids of the bets that are still in the feed, see format_messages_by_chat
+    """
+
+    print(list(bets.id))
+    logging.info(f"{len(bets)} Bets retrieved from the API")
+
+    # Only the new and re-priced bets are written, the unchanged ones are skipped
+    new_bets_df, repriced_bets_df = sync_bets(db, bets, RECENT_BETS)
+    logging.info(f"Recent bet cache: {RECENT_BETS.stats()}")
+
+    # Only if there are new or re-priced bets, send the messages to the Telegram channel
+    if new_bets_df.empty and repriced_bets_df.empty:
+        logging.warning("Duplicate records retrieved from the database...skipping the process")
+        return
+
+    logging.info(
+        f"{len(new_bets_df)} New bets and {len(repriced_bets_df)} re-priced bets stored in the database"
+    )
+
+    # A group with both new and re-priced bets is only formatted once, with all its bets
+    if not new_bets_df.empty and not repriced_bets_df.empty:
+        group_columns = ["bookmaker_event_id", "market_and_bet_type"]
+        is_repriced_group = pd.MultiIndex.from_frame(new_bets_df[group_columns]).isin(
+            pd.MultiIndex.from_frame(repriced_bets_df[group_columns])
+        )
+        new_bets_df = new_bets_df[~is_repriced_group]
+
+    messages_by_chat = {}
+    format_messages_by_chat(db, new_bets_df, False, messages_by_chat, live_bet_ids)
+    format_messages_by_chat(db, repriced_bets_df, True, messages_by_chat, live_bet_ids)
+
+    # Send the messages to the Telegram channels, the channels are sent to in parallel
+    responses_by_chat = asyncio.run(
+        send_messages_with_retry(
+            TELEGRAM_AUTH_TOKEN,
+            {
+                chat_id: [(message, message_id) for _, message, message_id in messages]
+                for chat_id, messages in messages_by_chat.items()
+            },
+            sender=TELEGRAM_SENDER,
+        )
+    )
+
+    for chat_id, responses in responses_by_chat.items():
+        # Remember the posted messages so that they can be edited when their odds move
+        message_ids = {
+            group: response["result"]["message_id"]
+            for (groups, _, _), response in zip(messages_by_chat[chat_id], responses)
+            if response and response.get("ok")
+            for group in groups
+        }
+        db.save_message_ids(chat_id, message_ids)
+
+        sent = sum(1 for response in responses if response and response.get("ok"))
+        edited = sum(1 for _, _, message_id in messages_by_chat[chat_id] if message_id)
+        logging.info(
+            f"Sent {sent} messages ({edited} edits) for {len(message_ids)} groups to the Telegram channel with id {chat_id}"
+        )
+
+
+def delete_vanished_messages(db, polled_groups):
+    """
+    Delete the posted messages of the groups that are not in the BetBurger response anymore
+
+    Args:
+        db: Database - The bets database
+        polled_groups: set - The (bookmaker_event_id, market_and_bet_type) pairs of all the polled bets
+    """
+
+    # A packed message is only deleted once none of its groups is polled anymore
+    vanished = {}
+    message_groups = {}
+    for chat_id, bookmaker_event_id, market_and_bet_type, message_id in db.get_messages():
+        group = (bookmaker_event_id, market_and_bet_type)
+        is_vanished = group not in polled_groups
+        vanished[(chat_id, message_id)] = vanished.get((chat_id, message_id), True) and is_vanished
+        message_groups.setdefault((chat_id, message_id), []).append(group)
+
+    message_ids_by_chat = {}
+    for (chat_id, message_id), is_vanished in vanished.items():
+        if is_vanished:
+            message_ids_by_chat.setdefault(chat_id, []).append(message_id)
+
+    if not message_ids_by_chat:
+        return
+
+    responses_by_chat = asyncio.run(
+        delete_messages_with_retry(
+            TELEGRAM_AUTH_TOKEN, message_ids_by_chat, sender=TELEGRAM_SENDER
+        )
+    )
+
+    deleted_groups = []
+    for chat_id, responses in responses_by_chat.items():
+        message_ids = message_ids_by_chat[chat_id]
+
+        # A refused batch is not retried either, only the batches that never reached Telegram are
+        answered_ids = [
+            message_id
+            for start, response in zip(
+                range(0, len(message_ids), TELEGRAM_DELETE_BATCH_SIZE), responses
+            )
+            if response
+            for message_id in message_ids[start : start + TELEGRAM_DELETE_BATCH_SIZE]
+        ]
+        db.delete_message_ids(chat_id, answered_ids)
+        deleted_groups.extend(
+            group
+            for message_id in answered_ids
+            for group in message_groups[(chat_id, message_id)]
+        )
+        logging.info(
+            f"Deleted {len(answered_ids)} messages of vanished bets in {len(responses)} calls from the Telegram channel with id {chat_id}"
+        )
+
+    # The bets of a deleted message are forgotten, so that they are posted again if they come back
+    # to the feed, even at the same price
+    forgotten_ids = db.delete_group_bets(deleted_groups)
+    RECENT_BETS.discard(forgotten_ids)
+    logging.info(f"Forgot {len(forgotten_ids)} bets that left the feed")
+
+
+def main():
+
+    # Connect to the database
+    with Database() as db:
+
+        # The cache also tells which pages only contain bets that were already seen at the same price
+        RECENT_BETS.warm(db)
+
+        # Every page is sent as soon as it arrives, the next pages are fetched meanwhile
+        # The bets of the last complete poll are live until this poll is over, the ones of an
+        # incomplete poll or of a restart aren't known, so every stored bet is shown then
+        live_bet_ids = set(POLL_STATE["bet_ids"]) if POLL_STATE.get("complete") else None
+
+        retrieved = 0
+        for bets in iter_bets(
+            BET_BURGER_TOKEN, BET_BURGER_FILTER_IDS, cache=RECENT_BETS, poll_state=POLL_STATE
+        ):
+            retrieved += len(bets)
+            if live_bet_ids is not None:
+                live_bet_ids.update(bets.id)
+            send_new_bets(db, bets, live_bet_ids)
+
+        # Check if there are any bets retrieved from the API
+        if not retrieved:
             logging.warning("No bets retrieved from the API...skipping the process")
 
+        # A bet missing from a failed or partial poll may still be live, so its message is kept
+        if not POLL_STATE["complete"]:
+            logging.warning("The poll was incomplete...skipping the removal of the vanished bets")
+
+        # An empty poll only removes every message when BetBurger confirms that there are no bets
+        elif not POLL_STATE["groups"] and not POLL_STATE["confirmed_empty"]:
+            logging.warning("The poll is empty...skipping the removal of the vanished bets")
+
+        else:
+            delete_vanished_messages(db, POLL_STATE["groups"])
+
 
 if __name__ == "__main__":
 
+    # Load the outcome mapping up front so that the polls never have to wait for it
+    get_betting_mapping()
+
     # Schedule the task to run every FREQUENCY_MINUTES
     schedule.every(FREQUENCY_SECONDS).seconds.do(main)
 
+    # Poll right away rather than after the first FREQUENCY_SECONDS, a restart doesn't skip a poll
+    schedule.run_all()
+
     # Run the scheduler in the background
     while True:
         schedule.run_pending()
@@ -0,0 +1,111 @@
+import time
+import asyncio
+import logging
+
+from ..config import (
+    INVITE_LINK_VALIDITY_SECONDS,
+    INVITE_LINK_MIN_REMAINING_SECONDS,
+    INVITE_LINK_MAX_CONCURRENCY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InviteLinkCache:
+    """
+    Invite links of the Telegram groups, shared by the buyers while they are still valid long enough
+
+    The links create join requests that the admin approves, so the same link can be handed to several
+    buyers. A new link is only created once the cached one has less than min_remaining seconds left.
+
+    Args:
+        validity: int (Optional) - Number of seconds a new link stays valid
+        min_remaining: int (Optional) - Minimum number of seconds a link must still be valid to be handed out
+        max_concurrency: int (Optional) - Maximum number of links created at the same time
+    """
+
+    def __init__(
+        self,
+        validity=INVITE_LINK_VALIDITY_SECONDS,
+        min_remaining=INVITE_LINK_MIN_REMAINING_SECONDS,
+        max_concurrency=INVITE_LINK_MAX_CONCURRENCY,
+    ):
+        self.validity = validity
+        self.min_remaining = min_remaining
+
+        # group id -> (invite link, expiry timestamp)
+        self.links = {}
+        self.group_locks = {}
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    def get_cached_link(self, group_id):
+        cached = self.links.get(group_id)
+        if cached and cached[1] - time.time() >= self.min_remaining:
+            return cached[0]
+
+        return None
+
+    async def get_link(self, telegram_bot, group_id):
+        """
+        Get a valid invite link for a group, creating one if needed
+
+        Args:
+            telegram_bot: telegram.Bot - Bot that is an admin of the group
+            group_id: str - Telegram group id
+
+        Returns:
+            str - The invite link or "N/A" if it couldn't be created
+        """
+
+        link = self.get_cached_link(group_id)
+        if link:
+            return link
+
+        # Buyers arriving at the same time wait for the link created by the first one
+        group_lock = self.group_locks.setdefault(group_id, asyncio.Lock())
+        async with group_lock:
+            link = self.get_cached_link(group_id)
+            if link:
+                return link
+
+            expiry_time = int(time.time() + self.validity)
+            params = {
+                "chat_id": group_id,
+                "expire_date": expiry_time,
+                "creates_join_request": True,
+            }
+
+            try:
+                async with self.semaphore:
+                    chat_link = await telegram_bot.create_chat_invite_link(**params)
+                link = chat_link.invite_link
+            except Exception as e:
+                logger.error(
+                    f"Error creating invite link for group {group_id}...the bot must exist in the group: {e}"
+                )
+                return "N/A"
+
+            self.links[group_id] = (link, expiry_time)
+            return link
+
+    async def get_links(self, telegram_bot, groups):
+        """
+        Get the invite links of several groups concurrently
+
+        Args:
+            telegram_bot: telegram.Bot - Bot that is an admin of the groups
+            groups: list[dict] - The groups, as returned by database.catalog.get_groups
+
+        Returns:
+            list[str] - The invite links, in the order of the groups
+        """
+
+        return await asyncio.gather(
+            *[
+                self.get_link(telegram_bot, group["telegram_group_id"])
+                for group in groups
+            ]
+        )
+
+
+INVITE_LINKS = InviteLinkCache()
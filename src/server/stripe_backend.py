@@ -1,11 +1,14 @@
 import sys
 import json
 import stripe
-import datetime
 import uuid
+import asyncio
 import uvicorn
 import logging
+import functools
 import pandas as pd
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from telegram import Bot
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse, HTMLResponse
@@ -16,6 +19,7 @@ from ..credentials import (
     NGROK_AUTH_TOKEN,
     STRIPE_AUTH_TOKEN,
     STRIPE_PUBLISHABLE_TOKEN,
+    STRIPE_WEBHOOK_SECRET,
     TELEGRAM_AUTH_TOKEN,
     STATIC_DIR,
 )
@@ -23,7 +27,12 @@ from ..config import (
     ALREADY_ACTIVE_SUBSCRIPTION,
     GOODS_DELIVERY_MESSAGE,
     PAYMENT_CANCELLATION_MESSAGE_TEXT,
+    STRIPE_MAX_WORKERS,
+    TELEGRAM_API_URL,
+    INVITE_LINK_MIN_REMAINING_SECONDS,
 )
+from .invite_links import INVITE_LINKS
+from .stripe_events_worker import StripeEventWorker
 
 # Set up logging
 logging.basicConfig(
@@ -34,10 +43,60 @@ logger = logging.getLogger(__name__)
 
 stripe.api_key = STRIPE_AUTH_TOKEN
 
+# The Stripe SDK only has blocking calls, they run here so that they don't block the event loop
+STRIPE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=STRIPE_MAX_WORKERS, thread_name_prefix="stripe"
+)
+
+
+async def run_stripe(function, *args, **kwargs):
+    """
+    Run a blocking Stripe SDK call on the Stripe thread pool
+
+    Args:
+        function: Callable - The Stripe SDK function, e.g. stripe.Customer.retrieve
+        args: tuple - Positional arguments of the call
+        kwargs: dict - Keyword arguments of the call
+
+    Returns:
+        Any - The result of the call
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        STRIPE_EXECUTOR, functools.partial(function, *args, **kwargs)
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Share a single Telegram bot, and so a single connection pool, between all the requests
+
+    The bot is initialized on startup, which opens the first connection to Telegram with a getMe
+    call, and shut down with the app so that its connections are closed cleanly. The worker that
+    applies the Stripe webhook events runs for as long as the app.
+    """
+
+    telegram_bot = Bot(TELEGRAM_AUTH_TOKEN, base_url=f"{TELEGRAM_API_URL}/bot")
+    await telegram_bot.initialize()
+    app.state.telegram_bot = telegram_bot
+
+    database.creator.create_table_stripe_events()
+    stripe_event_worker = StripeEventWorker()
+    stripe_event_worker.start()
+    app.state.stripe_event_worker = stripe_event_worker
+
+    try:
+        yield
+    finally:
+        await stripe_event_worker.stop()
+        await telegram_bot.shutdown()
+
 
 # Initialize the FastAPI app for a simple web server
 templates = Jinja2Templates(directory=STATIC_DIR)
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/stripe_config")
@@ -47,29 +106,41 @@ def secret():
 
 @app.post("/payment_webhook")
 async def stripe_webhook(request: Request):
+    """
+    Store the Stripe event in the outbox and acknowledge it straight away
+
+    Only the events signed with the endpoint secret are stored, anyone can POST to the webhook. The
+    event is applied to the database by the StripeEventWorker, the retries of Stripe are ignored by
+    the outbox since it is keyed on the event id.
+    """
+
+    # Without the secret no event can be verified, Stripe keeps retrying them until it is set
+    if not STRIPE_WEBHOOK_SECRET:
+        logger.error("STRIPE_WEBHOOK_SECRET is not set...refusing the Stripe event")
+        return JSONResponse({"error": "Webhook secret not configured"}, status_code=500)
+
     payload = await request.body()
-    event = None
 
     try:
-        event = stripe.Event.construct_from(json.loads(payload), stripe.api_key)
-    except ValueError as e:
-        # Invalid payload
-        return JSONResponse(status_code=400)
-
-    if event.type == "payment_intent.succeeded":
-        payment_intent = event.data.object
+        stripe.Webhook.construct_event(
+            payload, request.headers.get("Stripe-Signature"), STRIPE_WEBHOOK_SECRET
+        )
+        event = json.loads(payload)
+    except stripe.error.SignatureVerificationError:
+        logger.warning("Stripe event with an invalid signature...skipping it")
+        return JSONResponse({"error": "Invalid signature"}, status_code=400)
+    except ValueError:
+        event = None
 
-        print("PaymentIntent was successful!")
+    # Invalid payload
+    if not isinstance(event, dict) or "id" not in event or "type" not in event:
+        return JSONResponse({"error": "Invalid payload"}, status_code=400)
 
-    elif event.type == "payment_intent.failed":
-        pass
+    # Stripe retries the events that are not acknowledged with a 2xx
+    if not database.stripe_events.create_stripe_event(event):
+        return JSONResponse({"error": "Event could not be stored"}, status_code=500)
 
-    elif event.type == "payment_method.attached":
-        payment_method = event.data.object  # contains a stripe.PaymentMethod
-        print("PaymentMethod was attached to a Customer!")
-    # ... handle other event types
-    else:
-        print("Unhandled event type {}".format(event.type))
+    request.app.state.stripe_event_worker.notify()
 
     return JSONResponse(content={}, status_code=200)
 
@@ -89,6 +160,7 @@ def payment_link(
 
 @app.get("/create_checkout_session")
 async def create_checkout_session(
+    request: Request,
     price_id: str,
     web_app_query_id: str,
     temp_message_id: str,
@@ -96,14 +168,14 @@ async def create_checkout_session(
     customer_id: str = None,
 ):
 
-    telegram_bot = Bot(TELEGRAM_AUTH_TOKEN)
+    telegram_bot = request.app.state.telegram_bot
 
     # Remove the temp message and tell the user that they already have an active subscription
     if customer_id:
         existing_customer = database.selector.get_customers(
             stripe_customer_id=customer_id
         )[0]
-        existing_price = database.selector.get_prices(stripe_price_id=price_id)[0]
+        existing_price = database.catalog.get_prices(stripe_price_id=price_id)[0]
         subscriptions = database.selector.get_subscriptions(
             customer_id=existing_customer["id"], product_id=existing_price["product_id"]
         )
@@ -145,7 +217,9 @@ async def create_checkout_session(
 
     try:
 
-        checkout_session = stripe.checkout.Session.create(**session_object)
+        checkout_session = await run_stripe(
+            stripe.checkout.Session.create, **session_object
+        )
 
         return JSONResponse({"session_id": checkout_session.id})
     except Exception as e:
@@ -160,13 +234,16 @@ async def successful_payment(
     telegram_user_id: str,
     session_id: str,
 ):
-    telegram_bot = Bot(TELEGRAM_AUTH_TOKEN)
-
-    session = stripe.checkout.Session.retrieve(session_id)
-    subscription = stripe.Subscription.retrieve(session.get("subscription"))
+    telegram_bot = request.app.state.telegram_bot
 
+    session = await run_stripe(stripe.checkout.Session.retrieve, session_id)
     customer_id = session.get("customer")
-    customer = stripe.Customer.retrieve(customer_id)
+
+    # The subscription and the customer don't depend on each other
+    subscription, customer = await asyncio.gather(
+        run_stripe(stripe.Subscription.retrieve, session.get("subscription")),
+        run_stripe(stripe.Customer.retrieve, customer_id),
+    )
 
     # Need to get the plan from the subscription
     plan = subscription.get("plan")
@@ -174,11 +251,11 @@ async def successful_payment(
         plan = subscription.get("items").data[0].price
 
     stripe_price_id = plan.get("id")
-    selected_price = database.selector.get_prices(stripe_price_id=stripe_price_id)[0]
-    selected_product = database.selector.get_products(
+    selected_price = database.catalog.get_prices(stripe_price_id=stripe_price_id)[0]
+    selected_product = database.catalog.get_products(
         product_id=selected_price.get("product_id")
     )[0]
-    groups = database.selector.get_groups(product_id=selected_product.get("id"))
+    groups = database.catalog.get_groups(product_id=selected_product.get("id"))
 
     # Only create a customer if they don't exist in the database
     customers = database.selector.get_customers(stripe_customer_id=customer_id)
@@ -217,6 +294,8 @@ async def successful_payment(
         ),
     )
 
+    # The subscription may already have been created from its customer.subscription.created webhook,
+    # the insert is then a no-op or extends its period
     database.selector.create_subscriptions(
         [
             {
@@ -236,33 +315,12 @@ async def successful_payment(
         chat_id=telegram_user_id, message_id=temp_message_id
     )
 
-    # Craft the message to be sent to the user
-    links = []
-    for group in groups:
-
-        group_id = group["telegram_group_id"]
-        expiry_time = int(
-            (
-                datetime.datetime.now(datetime.UTC) + datetime.timedelta(hours=1)
-            ).timestamp()
-        )  # TODO: Make this editable in the config.py file
-        params = {
-            "chat_id": group_id,
-            "expire_date": expiry_time,
-            "creates_join_request": True,
-        }
-
-        try:
-            chat_link = await telegram_bot.create_chat_invite_link(**params)
-            links.append(chat_link.invite_link)
-        except Exception as e:
-            logger.error(
-                f"Error creating invite link for group {group_id}...the bot must exist in the group: {e}"
-            )
-            links.append("N/A")
+    # Craft the message to be sent to the user, the links of the groups are created concurrently
+    links = await INVITE_LINKS.get_links(telegram_bot, groups)
 
     message_to_send = GOODS_DELIVERY_MESSAGE.format(
         links=", \n".join(links),
+        valid_minutes=INVITE_LINK_MIN_REMAINING_SECONDS // 60,
     )
 
     # Call the telegram API to send the message to the user
@@ -281,8 +339,8 @@ async def successful_payment(
 @app.get("/cancel_payment", response_class=HTMLResponse)
 async def cancel_payment(request: Request, session_id: str, web_app_query_id: str):
 
-    telegram_bot = Bot(TELEGRAM_AUTH_TOKEN)
-    stripe.checkout.Session.expire(session_id)
+    telegram_bot = request.app.state.telegram_bot
+    await run_stripe(stripe.checkout.Session.expire, session_id)
 
     result = {
         "message_text": PAYMENT_CANCELLATION_MESSAGE_TEXT,
@@ -0,0 +1,89 @@
+import asyncio
+import logging
+
+from .. import database
+from ..config import (
+    STRIPE_EVENT_POLL_SECONDS,
+    STRIPE_EVENT_BATCH_SIZE,
+    STRIPE_EVENT_RETRY_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StripeEventWorker:
+    """
+    Background task that applies the Stripe events stored in the outbox by the webhook
+
+    The webhook wakes the worker up after storing an event, and the worker also polls the outbox
+    so that the events stored before a restart, or whose processing failed, are picked up.
+
+    Args:
+        poll_interval: float (Optional) - Maximum number of seconds between two reads of the outbox
+        batch_size: int (Optional) - Maximum number of events read from the outbox at once
+        retry_delay: float (Optional) - Number of seconds before a failed event is applied again
+    """
+
+    def __init__(
+        self,
+        poll_interval=STRIPE_EVENT_POLL_SECONDS,
+        batch_size=STRIPE_EVENT_BATCH_SIZE,
+        retry_delay=STRIPE_EVENT_RETRY_SECONDS,
+    ):
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.retry_delay = retry_delay
+
+        self.wake_up = asyncio.Event()
+        self.task = None
+
+    def notify(self):
+        """Tell the worker that new events are waiting in the outbox"""
+
+        self.wake_up.set()
+
+    def process_pending(self):
+        """
+        Apply a batch of pending events, one after the other
+
+        Returns:
+            int - Number of events that were applied
+        """
+
+        stripe_events = database.stripe_events.get_pending_stripe_events(
+            self.batch_size, self.retry_delay
+        )
+        if not stripe_events:
+            return 0
+
+        return sum(
+            database.stripe_events.process_stripe_event(stripe_event)
+            for stripe_event in stripe_events
+        )
+
+    async def run(self):
+        while True:
+            # Cleared before reading the outbox so that the events stored meanwhile wake the worker up again
+            self.wake_up.clear()
+
+            # The database calls are blocking so they run in a thread, the batches never overlap
+            if await asyncio.to_thread(self.process_pending):
+                continue
+
+            try:
+                await asyncio.wait_for(self.wake_up.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if not self.task:
+            return
+
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
@@ -53,28 +53,29 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         None
     """
 
-    products = database.selector.get_products()
-
-    # If there are no products, tell the user that there are no products available
-    if not products:
-        await context.bot.send_message(
-            chat_id=update.effective_chat.id,
-            text=NO_PRODUCTS_AVAILABLE,
-        )
-        return
-
+    # A product is offered at its first price, the products without a price are not offered
     options = []
-    prices = database.selector.get_prices()
-    for product in products:
-        price = next(filter(lambda price: product["id"] == price["product_id"], prices))
+    for product in database.catalog.get_products() or []:
+        prices = database.catalog.get_prices(product_id=product["id"])
+        if not prices:
+            continue
+
         button = [
             InlineKeyboardButton(
                 f"Subscribe to {product['name'].title()}",
-                callback_data=price["stripe_price_id"],
+                callback_data=prices[0]["stripe_price_id"],
             )
         ]
         options.append(button)
 
+    # If there are no products, tell the user that there are no products available
+    if not options:
+        await context.bot.send_message(
+            chat_id=update.effective_chat.id,
+            text=NO_PRODUCTS_AVAILABLE,
+        )
+        return
+
     await context.bot.send_message(
         chat_id=update.effective_chat.id,
         text=BOT_START_MESSAGE,
@@ -101,8 +102,8 @@ async def handle_start_subscription(
     stripe_price_id = query.data
     message_id = query.message.message_id
 
-    selected_price = database.selector.get_prices(stripe_price_id=stripe_price_id)[0]
-    selected_product = database.selector.get_products(
+    selected_price = database.catalog.get_prices(stripe_price_id=stripe_price_id)[0]
+    selected_product = database.catalog.get_products(
         product_id=selected_price["product_id"]
     )[0]
     customers = database.selector.get_customers(telegram_user_id=user_id)
@@ -190,7 +191,9 @@ async def cancel_subscription(
         return
 
     customer = customers[0]
-    subscriptions = database.selector.get_subscriptions(customer_id=customer["id"])
+    subscriptions = database.selector.get_subscriptions_with_products(
+        customer_id=customer["id"]
+    )
     if not subscriptions:
         await context.bot.send_message(
             chat_id=update.effective_chat.id,
@@ -200,12 +203,9 @@ async def cancel_subscription(
 
     options = []
     for subscription in subscriptions:
-        product = database.selector.get_products(product_id=subscription["product_id"])[
-            0
-        ]
         button = [
             InlineKeyboardButton(
-                f"Cancel {product['name'].title()} subscription",
+                f"Cancel {subscription['product_name'].title()} subscription",
                 callback_data=subscription["stripe_subscription_id"],
             )
         ]
@@ -235,15 +235,12 @@ async def confirm_subscription_cancellation(
     query = update.callback_query
     stripe_subscription_id = query.data
 
-    existing_subscription = database.selector.get_subscriptions(
+    existing_subscription = database.selector.get_subscriptions_with_products(
         stripe_subscription_id=stripe_subscription_id
     )[0]
-    existing_product = database.selector.get_products(
-        product_id=existing_subscription["product_id"]
-    )[0]
 
     cancel_confirmation_message_text = CANCEL_CONFIRMATION_MESSAGE_TEXT.format(
-        product_name=existing_product["name"].title()
+        product_name=existing_subscription["product_name"].title()
     )
 
     # Confirm the subscription cancellation
@@ -284,12 +281,9 @@ async def handle_end_subscription(
     query = update.callback_query
     stripe_subscription_id = query.data.replace("confirm_", "")
 
-    existing_subscription = database.selector.get_subscriptions(
+    existing_subscription = database.selector.get_subscriptions_with_products(
         stripe_subscription_id=stripe_subscription_id
     )[0]
-    existing_product = database.selector.get_products(
-        product_id=existing_subscription["product_id"]
-    )[0]
 
     # Cancel the subscription from stripe and remove it from the database
     stripe.Subscription.delete(stripe_subscription_id)
@@ -297,7 +291,7 @@ async def handle_end_subscription(
 
     successful_subscription_cancellation_message_text = (
         SUCCESSFUL_SUBSCRIPTION_CANCELLATION_MESSAGE_TEXT.format(
-            product_name=existing_product["name"].title()
+            product_name=existing_subscription["product_name"].title()
         )
     )
 
@@ -325,16 +319,13 @@ async def cancel_subscription_cancellation(
     query = update.callback_query
     stripe_subscription_id = query.data.replace("cancel_", "")
 
-    existing_subscription = database.selector.get_subscriptions(
+    existing_subscription = database.selector.get_subscriptions_with_products(
         stripe_subscription_id=stripe_subscription_id
     )[0]
-    existing_product = database.selector.get_products(
-        product_id=existing_subscription["product_id"]
-    )[0]
 
     denied_subscription_cancellation_message_text = (
         DENIED_SUBSCRIPTION_CANCELLATION_MESSAGE_TEXT.format(
-            product_name=existing_product["name"].title()
+            product_name=existing_subscription["product_name"].title()
         )
     )
 
@@ -1,134 +1,364 @@
-import asyncio
+import re
+import json
 import time
 import sqlite3
 import logging
+import math
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import pytz
-import requests
 import pandas as pd
 import numpy as np
-from bs4 import BeautifulSoup
 
 from .config import (
     URL_MAPPING,
     MIN_ODDS_FACTOR,
     PYTHON_TO_SQLITE_DTYPE_MAPPING,
     BET_TYPES_TO_FILTER_OUT,
+    FILTER_POLL_MAX_WORKERS,
+    TELEGRAM_API_URL,
+    TELEGRAM_MESSAGE_MAX_LENGTH,
+    BET_BURGER_SEARCH_URL,
+    BET_BURGER_PER_PAGE,
+    BET_BURGER_MAX_PAGES,
 )
-from .flags import FLAGS
+from . import http_client
+from .bet_mapping import get_betting_mapping
 
 
-# TODO: Remove this function and instead just use normal requests library. Handle all exceptions in respective places
-def make_request(url, headers=None, params=None, data=None, method="GET"):
+# Obtain the bets from BetBurger
+def process_bets_with_retry(token, filter_ids):
+    """
+    Poll every filter and merge the bets of all their pages
 
-    try:
-        response = requests.request(
-            method, url, headers=headers, params=params, data=data
-        )
-        # If the response was successful, no Exception will be raised
-        response.raise_for_status()
-    except requests.RequestException as e:
-        # If the request failed, print the error message
-        print(f"Request failed: {e}")
-        return None
+    Args:
+        token: str - BetBurger access token
+        filter_ids: list | str - BetBurger filter ids, a single filter id is also accepted
 
-    return response
+    Returns:
+        pd.DataFrame - The bets of all the filters, de-duplicated on the bet id
+    """
 
+    bets = list(iter_bets(token, filter_ids))
+    if not bets:
+        return pd.DataFrame()
 
-def get_betting_mapping():
+    return pd.concat(bets, ignore_index=True)
 
-    bet_mappings = {}
-    url = "https://www.betburger.com/api/entity_ids"
-    response = make_request(url)
-    # Check if the request was successful (status code 200)
-    if response:
 
-        # Parse the HTML content with BeautifulSoup
-        soup = BeautifulSoup(response.text, "html.parser")
+def iter_bets(
+    token, filter_ids, cache=None, per_page=BET_BURGER_PER_PAGE, poll_state=None
+):
+    """
+    Poll every filter and yield their bets a page at a time, in the order the pages arrive
+
+    The first page of every filter is requested right away and the next ones are requested
+    concurrently once the first page tells how many bets the filter has, so the first bets can be
+    processed while the other pages are still being fetched. A filter stops being paged as soon as
+    one of its pages only contains bets that were already seen at the same price, its pages that were
+    not requested yet are cancelled.
+
+    Args:
+        token: str - BetBurger access token
+        filter_ids: list | str - BetBurger filter ids, a single filter id is also accepted
+        cache: RecentBetCache (Optional) - The cache of the recently seen bets and their price
+        per_page: int (Optional) - Number of bets requested per page
+        poll_state: dict (Optional) - Filled in place with "bet_ids", the ids of all the polled bets,
+            "groups", their (bookmaker_event_id, market_and_bet_type) pairs, "complete", False when a page failed or
+            was not requested, and "confirmed_empty", True when every filter reported a total of 0 bets.
+            The pages skipped because of an unchanged page are filled with the bets the filter had at the
+            previous poll, so the same dict is passed to every poll
+
+    Yields:
+        pd.DataFrame - The bets of a page, without the ones already yielded for another page or filter
+    """
+
+    if not isinstance(filter_ids, (list, tuple)):
+        filter_ids = [filter_ids]
+
+    yielded_ids = set()
+    pending = {}
+
+    if poll_state is None:
+        poll_state = {}
+    # Only the bets of the filters that were fully polled last time can stand in for skipped pages
+    previous_filter_bets = {
+        filter_id: bets
+        for filter_id, bets in poll_state.get("filter_bets", {}).items()
+        if filter_id not in poll_state.get("incomplete_filters", set())
+    }
+    poll_state.update(
+        bet_ids=set(),
+        groups=set(),
+        filter_bets={filter_id: {} for filter_id in filter_ids},
+        incomplete_filters=set(),
+        complete=bool(filter_ids),
+        confirmed_empty=bool(filter_ids),
+    )
+    executor = ThreadPoolExecutor(max_workers=FILTER_POLL_MAX_WORKERS)
 
-        # Find the h2 tag with the specified title
-        target_h2 = soup.find(
-            "span", {"title": "translation missing: en.bet.Variation"}
+    def request_page(filter_id, page):
+        future = executor.submit(
+            fetch_bets_page_with_retry, token, filter_id, page, per_page
         )
-
-        # Check if the h2 tag is found
-        if target_h2:
-            # Find the table element following the target h2 tag
-            target_table = target_h2.find_next("table")
-
-            # Check if the table element is found
-            if target_table:
-                # Find the tbody element within the table
-                tbody = target_table.find("tbody")
-
-                # Check if the tbody element is found
-                if tbody:
-                    # Extract all rows from the tbody
-                    rows = tbody.find_all("tr")
-
-                    # Now 'rows' contains the contents of the table body
-                    for row in rows:
-                        # Extract and print the data from each row
-                        cells = row.find_all("td")
-                        row_data = [cell.text.strip() for cell in cells]
-                        id, name = int(row_data[0]), row_data[1]
-                        bet_mappings[id] = name
-
-                else:
-                    print("tbody not found.")
-            else:
-                print("Table not found.")
+        pending[future] = (filter_id, page)
+
+    def add_bets(filter_id, bets):
+        bets = dict(bets)
+        poll_state["filter_bets"][filter_id].update(bets)
+        poll_state["bet_ids"].update(bets)
+        poll_state["groups"].update(bets.values())
+
+    def mark_incomplete(filter_id):
+        poll_state["incomplete_filters"].add(filter_id)
+        poll_state["complete"] = False
+
+    def stop_filter(filter_id, next_pages):
+        skipped = bool(next_pages)
+        for future, (pending_filter_id, _) in list(pending.items()):
+            if pending_filter_id == filter_id and future.cancel():
+                del pending[future]
+                skipped = True
+
+        # The skipped pages are assumed to still have the bets of the previous poll
+        if not skipped:
+            return
+        if filter_id in previous_filter_bets:
+            add_bets(filter_id, previous_filter_bets[filter_id])
         else:
-            print("h2 tag not found.")
-    else:
-        print(f"Failed to retrieve the content. Status code: {response.status_code}")
-
-    return bet_mappings
+            mark_incomplete(filter_id)
 
-
-# Obtain the bets from BetBurger
-def process_bets_with_retry(token, filter_id):
+    try:
+        for filter_id in filter_ids:
+            request_page(filter_id, 1)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                filter_id, page = pending.pop(future)
+                response_json = future.result()
+                if not response_json:
+                    mark_incomplete(filter_id)
+                    poll_state["confirmed_empty"] = False
+                    continue
+
+                # A malformed page is skipped, the other pages of the poll are still processed
+                try:
+                    # Mapping the outcome ids to the outcome names
+                    bets_df = transform_bets(
+                        response_json["bets"],
+                        response_json["source"]["value_bets"],
+                        get_betting_mapping(),
+                    )
+                    next_pages = get_next_pages(response_json, page, per_page)
+
+                    # The pages past BET_BURGER_MAX_PAGES are never requested
+                    total = response_json.get("total")
+                    is_capped = (total or 0) > BET_BURGER_MAX_PAGES * per_page or (
+                        total is None
+                        and page >= BET_BURGER_MAX_PAGES
+                        and len(response_json["bets"]) >= per_page
+                    )
+                except Exception as e:
+                    logging.error(
+                        f"Error parsing page {page} of the bets for filter {filter_id}: {e}...skipping it"
+                    )
+
+                    # Log the error in a file
+                    with open("error.log", "a") as f:
+                        f.write(
+                            f"Error parsing page {page} of the bets for filter {filter_id}: {e}\n"
+                        )
+
+                    mark_incomplete(filter_id)
+                    poll_state["confirmed_empty"] = False
+                    continue
+
+                if is_capped:
+                    mark_incomplete(filter_id)
+                if page == 1 and response_json.get("total") != 0:
+                    poll_state["confirmed_empty"] = False
+                if not bets_df.empty:
+                    add_bets(
+                        filter_id,
+                        zip(
+                            bets_df["id"].tolist(),
+                            zip(
+                                bets_df["bookmaker_event_id"].tolist(),
+                                bets_df["market_and_bet_type"].tolist(),
+                            ),
+                        ),
+                    )
+                if (
+                    cache is not None
+                    and not bets_df.empty
+                    and cache.is_unchanged(get_bet_prices(bets_df))
+                ):
+                    logging.info(
+                        f"Page {page} of filter {filter_id} only has bets that were already seen...skipping its other pages"
+                    )
+                    stop_filter(filter_id, next_pages)
+                    continue
+
+                for next_page in next_pages:
+                    request_page(filter_id, next_page)
+
+                if bets_df.empty:
+                    continue
+
+                # The same bet can match more than one filter or move to another page between two requests
+                bets_df = bets_df[~bets_df.id.isin(yielded_ids)].drop_duplicates(
+                    subset="id", ignore_index=True
+                )
+                yielded_ids.update(bets_df.id)
+
+                if not bets_df.empty:
+                    yield bets_df
+    finally:
+        # The consumer can stop before the last page, the pages that were not requested yet are dropped
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_next_pages(response_json, page, per_page):
+    """
+    Get the pages to request after a page was received
+
+    All the other pages are requested after the first one when the response tells the total number of
+    bets, otherwise the next page is requested as long as the pages are full.
+
+    Args:
+        response_json: dict - The response of the page
+        page: int - The number of the page, starting from 1
+        per_page: int - Number of bets requested per page
+
+    Returns:
+        range - The pages to request
+    """
+
+    total = response_json.get("total")
+    if total is not None:
+        if page != 1:
+            return range(0)
+
+        return range(2, min(math.ceil(total / per_page), BET_BURGER_MAX_PAGES) + 1)
+
+    if len(response_json["bets"]) < per_page or page >= BET_BURGER_MAX_PAGES:
+        return range(0)
+
+    return range(page + 1, page + 2)
+
+
+def fetch_bets_page_with_retry(token, filter_id, page=1, per_page=BET_BURGER_PER_PAGE):
     retries = 3
     delay = 2
 
     for i in range(retries):
         try:
-            bets = process_bets(token, filter_id)
-            return bets
+            return fetch_bets_page(token, filter_id, page, per_page)
         except Exception as e:
-            logging.error(f"Error retrieving bets: {e}")
+            logging.error(
+                f"Error retrieving page {page} of the bets for filter {filter_id}: {e}"
+            )
 
             # Log the error in a file
             with open("error.log", "a") as f:
-                f.write(f"Error retrieving bets: {e}\n")
+                f.write(
+                    f"Error retrieving page {page} of the bets for filter {filter_id}: {e}\n"
+                )
 
             if i < retries - 1:
                 logging.info(f"Retrying in {delay} seconds...")
                 time.sleep(delay)
             else:
-                logging.error("Failed to retrieve bets after multiple retries")
-
-    return pd.DataFrame()
+                logging.error(
+                    f"Failed to retrieve page {page} of the bets for filter {filter_id} after multiple retries"
+                )
 
+    return None
 
-def process_bets(token, filter, per_page=500):
 
-    url = "https://rest-api-pr.betburger.com/api/v1/valuebets/bot_pro_search"
+def fetch_bets_page(token, filter, page=1, per_page=BET_BURGER_PER_PAGE):
 
-    payload = f"access_token={token}&search_filter%5B%5D={filter}&per_page={per_page}"
+    payload = f"access_token={token}&search_filter%5B%5D={filter}&per_page={per_page}&page={page}"
     headers = {
         "Accept": "application/json",
         "Content-Type": "application/x-www-form-urlencoded",
     }
 
-    response = requests.request("POST", url, headers=headers, data=payload)
+    response = http_client.request(
+        "POST", BET_BURGER_SEARCH_URL, headers=headers, data=payload
+    )
     # If the response was successful, no Exception will be raised
     response.raise_for_status()
 
-    response_json = response.json()
+    return response.json()
+
+
+def process_bets(token, filter, per_page=BET_BURGER_PER_PAGE, page=1):
+
+    response_json = fetch_bets_page(token, filter, page, per_page)
     outcomes = response_json["bets"]
     value_bets = response_json["source"]["value_bets"]
 
+    # Mapping the outcome ids to the outcome names
+    outcome_mapping = get_betting_mapping()
+
+    return transform_bets(outcomes, value_bets, outcome_mapping)
+
+
+def fill_templates(templates, placeholders):
+    """
+    Vectorized substitution of placeholders in a column of string templates
+
+    Rows are grouped by template, so the Python level work is proportional to the number
+    of distinct templates rather than the number of rows.
+
+    Args:
+        templates: pd.Series - Template string for every row
+        placeholders: dict - Mapping between each placeholder and a Series with its value for every row
+
+    Returns:
+        pd.Series - The filled in templates, aligned with the input
+    """
+
+    # The group keeps the placeholders in the output of re.split
+    pattern = re.compile(
+        "({})".format("|".join(re.escape(placeholder) for placeholder in placeholders))
+    )
+    values = {
+        placeholder: column.to_numpy(dtype=object)
+        for placeholder, column in placeholders.items()
+    }
+
+    filled = np.empty(len(templates), dtype=object)
+    for template, positions in templates.groupby(templates, sort=False).indices.items():
+
+        # Concatenate the literal parts of the template with the placeholder columns
+        result = np.full(len(positions), "", dtype=object)
+        for part in pattern.split(template):
+            if not part:
+                continue
+            result = result + (values[part][positions] if part in values else part)
+
+        filled[positions] = result
+
+    return pd.Series(filled, index=templates.index)
+
+
+def transform_bets(outcomes, value_bets, outcome_mapping):
+    """
+    Transform the raw BetBurger outcomes and value bets into the bets stored in the database
+
+    Args:
+        outcomes: list[dict] - The "bets" returned by the BetBurger API
+        value_bets: list[dict] - The "source.value_bets" returned by the BetBurger API
+        outcome_mapping: dict - Mapping between the outcome ids and the outcome names
+
+    Returns:
+        pd.DataFrame - The bets that can be sent, one row per outcome
+    """
+
     # Check if there are any outcomes that came back in the request
     if not outcomes:
         return pd.DataFrame()
@@ -141,9 +371,6 @@ def process_bets(token, filter, per_page=500):
 
     value_bets_df = pd.DataFrame(value_bets)[["bet_id", "avg_koef", "percent"]]
 
-    # Mapping the outcome ids to the outcome names
-    outcome_mapping = get_betting_mapping()
-
     best_bets_df = (
         outcomes_df[
             [
@@ -191,37 +418,29 @@ def process_bets(token, filter, per_page=500):
     best_bets_df["bet_url"] = (
         best_bets_df["bookmaker_id"].map(URL_MAPPING).fillna("{bookmaker_event_link}")
     )
-    best_bets_df["bet_url"] = best_bets_df.apply(
-        lambda row: row["bet_url"].replace(
-            "{bookmaker_event_link}",
-            (
-                row["bookmaker_event_direct_link"]
-                if not pd.isna(row["bookmaker_event_direct_link"])
-                else "null"
-            ),
-        ),
-        axis=1,
+    best_bets_df["bet_url"] = fill_templates(
+        best_bets_df["bet_url"],
+        {
+            "{bookmaker_event_link}": best_bets_df[
+                "bookmaker_event_direct_link"
+            ].fillna("null")
+        },
     )
 
-    # Setting the betting information
-    best_bets_df["outcome_name"] = best_bets_df.apply(
-        lambda row: (
-            row["outcome_name"]
-            .replace("Team1", row["home"])
-            .replace("Team2", row["away"])
-            .replace("%s", row["market_and_bet_type_param"])
-            if row["swap_teams"] == False
-            else row["outcome_name"]
-            .replace("Team1", row["away"])
-            .replace("Team2", row["home"])
-            .replace("%s", row["market_and_bet_type_param"])
-        ),
-        axis=1,
+    # Setting the betting information, the teams are reversed for the swapped bets
+    swapped = best_bets_df["swap_teams"] != False
+    best_bets_df["outcome_name"] = fill_templates(
+        best_bets_df["outcome_name"],
+        {
+            "Team1": best_bets_df["home"].where(~swapped, best_bets_df["away"]),
+            "Team2": best_bets_df["away"].where(~swapped, best_bets_df["home"]),
+            "%s": best_bets_df["market_and_bet_type_param"],
+        },
     )
 
-    best_bets_df["bet_info"] = best_bets_df.apply(
-        lambda row: f"{row['outcome_name']} @ {round(row['koef'], 2)}", axis=1
-    )
+    # Python's round is used on purpose, Series.round rounds the .xx5 odds differently
+    koef_text = best_bets_df["koef"].map(lambda koef: str(round(koef, 2)))
+    best_bets_df["bet_info"] = best_bets_df["outcome_name"] + " @ " + koef_text
 
     best_bets_df = best_bets_df.drop(
         [
@@ -242,37 +461,75 @@ def process_bets(token, filter, per_page=500):
     return best_bets_df
 
 
-def filter_new_bets(api_bets, db_bets):
+def get_bet_prices(bets_df):
+    """
+    Get the price of the bets, the (koef, koef_last_modified_at) pair that changes when BetBurger re-prices them
+
+    Args:
+        bets_df: pd.DataFrame - The bets
+
+    Returns:
+        dict - The price of every bet id
+    """
+
+    return dict(
+        zip(
+            bets_df["id"].tolist(),
+            zip(bets_df["koef"].tolist(), bets_df["koef_last_modified_at"].tolist()),
+        )
+    )
 
-    new_bets = []
-    # Filter the records that are not in the database and insert them
 
-    ids_to_insert = set(api_bets.id) - set(db_bets.id)
-    new_bets_df = api_bets[api_bets.id.isin(ids_to_insert)]
+def diff_bets(db, bets_df, cache):
+    """
+    Classify the polled bets as new, re-priced or unchanged
 
-    return new_bets_df
+    The price of every bet is compared with the snapshot of the cache, only the cache misses are
+    looked up in the database.
 
+    Args:
+        db: Database - The bets database
+        bets_df: pd.DataFrame - The bets retrieved from the API
+        cache: RecentBetCache - The cache of the recently seen bets and their price
 
-def load_duplicate_records(bets, db):
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame] - The new bets and the re-priced bets
+    """
 
-    ids = tuple(bets.id)
-    ids_str = str(ids) if len(ids) > 1 else f"('{ids[0]}')"
+    prices = get_bet_prices(bets_df)
+    snapshot, unknown_ids = cache.lookup(prices)
+    if unknown_ids:
+        snapshot.update(db.get_prices(unknown_ids))
 
-    filtered_db_records = db.get_data(ids_str)
-    filtered_db_df = pd.DataFrame(filtered_db_records, columns=bets.columns)
+    is_new = [id not in snapshot for id in prices]
+    is_repriced = [
+        id in snapshot and snapshot[id] != price for id, price in prices.items()
+    ]
 
-    new_bets_df = filter_new_bets(bets, filtered_db_df)
+    return bets_df[is_new], bets_df[is_repriced]
 
-    return new_bets_df
 
+def store_bets(db, bets_df):
+    """
+    Write the new and re-priced bets to the database in one batched upsert
 
-def insert_new_bets(db, new_bets_df, new_bets):
+    Args:
+        db: Database - The bets database
+        bets_df: pd.DataFrame - The bets to write
+
+    Returns:
+        int - Number of bets that were written
+    """
+
+    if bets_df.empty:
+        return 0
+
+    bets = bets_df.to_dict("records")
     try:
-        # Insert the new bets into the database
-        db.insert_data(new_bets)
+        written = db.upsert_data(bets)
     except sqlite3.OperationalError as e:
         column_name = str(e).split(" ")[-1]
-        column_dtype = new_bets_df.dtypes[column_name]
+        column_dtype = bets_df.dtypes[column_name]
         logging.warning(
             f"There was a difficulty inserting the new bets into the database...adding column {column_name} and retrying"
         )
@@ -280,100 +537,289 @@ def insert_new_bets(db, new_bets_df, new_bets):
         sqlite_dtype = PYTHON_TO_SQLITE_DTYPE_MAPPING.get(column_dtype, "TEXT")
         # Add the missing column to the database and try to insert the new bets again
         db.add_columns(column_name, sqlite_dtype)
-        db.insert_data(new_bets)
+        written = db.upsert_data(bets)
 
+    return written
 
-def get_flag_by_name(name):
 
-    retrieved_flag = list(
-        filter(lambda flag_data: flag_data["name"].lower() == name.lower(), FLAGS)
-    )
+def sync_bets(db, bets_df, cache):
+    """
+    Find the new and re-priced bets of a poll and store them, the unchanged bets are not written
+
+    Args:
+        db: Database - The bets database
+        bets_df: pd.DataFrame - The bets retrieved from the API
+        cache: RecentBetCache - The cache of the recently seen bets and their price
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame] - The new bets and the re-priced bets
+    """
 
-    if retrieved_flag:
-        return retrieved_flag[0]["emoji"]
+    new_bets_df, repriced_bets_df = diff_bets(db, bets_df, cache)
+    store_bets(db, pd.concat([new_bets_df, repriced_bets_df], ignore_index=True))
 
-    return "🇪🇺"
+    # Only cached once stored, a failed write is retried by the next poll
+    cache.update(get_bet_prices(bets_df))
+
+    return new_bets_df, repriced_bets_df
+
+
+def get_group_bets(db, groups):
+    """
+    Get all the stored bets of the groups, with their latest price
+
+    Args:
+        db: Database - The bets database
+        groups: iterable - The (bookmaker_event_id, market_and_bet_type) pairs to look up
+
+    Returns:
+        pd.DataFrame - The stored bets of the groups
+    """
+
+    return pd.DataFrame(db.get_group_bets(groups))
+
+
+DEFAULT_FLAG = "🇪🇺"
+
+
+@functools.cache
+def get_flag_index():
+    """
+    Index the flag emojis by lowercase country name and alias
+
+    The flags table is imported and indexed the first time a flag is looked up, so the entry points
+    that never format a bet don't load it. The aliases take precedence over the country names.
+
+    Returns:
+        dict - The flag emojis by lowercase name
+    """
+
+    from .flags import FLAG_EMOJIS, FLAG_CODES, FLAG_ALIASES
+
+    names = {**FLAG_CODES, **FLAG_ALIASES}
+    return {name.lower(): FLAG_EMOJIS[code] for name, code in names.items()}
+
+
+def get_flag_by_name(name):
+    return get_flag_index().get(name.strip().lower(), DEFAULT_FLAG)
 
 
 def format_messages(best_bets_df, base_message, time_zone, sport_emoji):
-    messages_to_send = []
-    for i, df in best_bets_df.groupby(["bookmaker_event_id", "market_and_bet_type"]):
-        cur_msg = base_message
-        bet_group = df.to_dict(orient="records")
-
-        raw_time = pd.to_datetime(bet_group[0]["started_at"])
-        event_time = (
-            pytz.utc.localize(raw_time).astimezone(time_zone).strftime("%A %H:%M")
+    """
+    Format one message per event and bet type, see format_message_groups
+
+    Returns:
+        list[str] - The messages, ordered by event and bet type
+    """
+
+    return [
+        message
+        for _, message in format_message_groups(
+            best_bets_df, base_message, time_zone, sport_emoji
         )
+    ]
+
+
+def format_message_groups(best_bets_df, base_message, time_zone, sport_emoji):
+    """
+    Format one message per event and bet type, together with the group it was formatted for
+
+    The bets are sorted so that every group is a contiguous slice, the event details are computed as
+    columns over the first bet of every group and the messages are rendered in a single pass.
+
+    Args:
+        best_bets_df: pd.DataFrame - The bets to send
+        base_message: str - Template of the messages
+        time_zone: pytz.timezone - Time zone the match time is shown in
+        sport_emoji: str - Emoji of the sport
 
-        league_info = bet_group[0]["league"].split(".")
-        country_name, league_name = league_info[0], league_info[-1].strip()
+    Returns:
+        list[tuple[tuple, str]] - The (bookmaker_event_id, market_and_bet_type) group and the message,
+        ordered by event and bet type
+    """
 
-        # If the league name is not found, then there is no country name
-        if len(league_info) < 2:
-            country_name = ""
+    group_columns = ["bookmaker_event_id", "market_and_bet_type"]
+    if best_bets_df.empty:
+        return []
 
-        flag = get_flag_by_name(country_name)
+    # A stable sort keeps the bets of a group in their original order
+    bets_df = best_bets_df.dropna(subset=group_columns).sort_values(
+        group_columns, kind="stable"
+    )
+    if bets_df.empty:
+        return []
+
+    group_keys = bets_df[group_columns].to_numpy()
+    is_group_start = np.ones(len(bets_df), dtype=bool)
+    is_group_start[1:] = (group_keys[1:] != group_keys[:-1]).any(axis=1)
+    group_starts = np.flatnonzero(is_group_start)
+    group_ends = np.append(group_starts[1:], len(bets_df))
+
+    bet_lines = ("- " + bets_df["bet_info"] + " (1u)").tolist()
+    min_odds = bets_df["min_koef"].map(lambda koef: str(round(koef, 1))).tolist()
+
+    # Only the first bet of every group is used for the event details
+    first_bets = bets_df.iloc[group_starts]
+
+    event_times = (
+        pd.to_datetime(first_bets["started_at"])
+        .dt.tz_localize(pytz.utc)
+        .dt.tz_convert(time_zone)
+        .dt.strftime("%A %H:%M")
+    )
+
+    league_info = first_bets["league"].str.split(".")
+    league_names = league_info.str[-1].str.strip()
+
+    # If the league name is not found, then there is no country name
+    country_names = league_info.str[0].where(league_info.str.len() >= 2, "")
+    flags = country_names.map(
+        {country: get_flag_by_name(country) for country in country_names.unique()}
+    )
+
+    groups = zip(
+        first_bets["bookmaker_event_id"].tolist(),
+        first_bets["market_and_bet_type"].tolist(),
+    )
 
-        messages_to_send.append(
-            cur_msg.format(
+    return [
+        (
+            group,
+            base_message.format(
                 league_name=f"{flag} {league_name}",
                 sport_emoji=sport_emoji,
-                event_name=bet_group[0]["event_name"],
-                bets="\n\t".join([f"- {bet['bet_info']} (1u)" for bet in bet_group]),
-                min_odds=" & ".join(
-                    [str(round(min_odd["min_koef"], 1)) for min_odd in bet_group]
-                ),
+                event_name=event_name,
+                bets="\n\t".join(bet_lines[group_start:group_end]),
+                min_odds=" & ".join(min_odds[group_start:group_end]),
                 match_time=event_time,
-                bet_url=bet_group[0]["bet_url"],
-            )
+                bet_url=bet_url,
+            ),
         )
+        for group, group_start, group_end, flag, league_name, event_name, event_time, bet_url in zip(
+            groups,
+            group_starts,
+            group_ends,
+            flags,
+            league_names,
+            first_bets["event_name"],
+            event_times,
+            first_bets["bet_url"],
+        )
+    ]
+
 
-    return messages_to_send
+def get_message_length(message):
+    """Length of a message as Telegram counts it, in UTF-16 code units"""
 
+    return len(message.encode("utf-16-le")) // 2
+
+
+def pack_messages(
+    messages, pack_keys, max_length=TELEGRAM_MESSAGE_MAX_LENGTH, separator="\n"
+):
+    """
+    Merge the consecutive messages with the same pack key into as few messages as fit in max_length
+
+    A message that is longer than max_length on its own is kept as it is.
+
+    Args:
+        messages: list[tuple[tuple, str]] - The groups and messages, as returned by format_message_groups
+        pack_keys: list - The pack key of every message, messages with different keys are never merged
+        max_length: int (Optional) - Maximum length of a packed message
+        separator: str (Optional) - Text put between two merged messages
+
+    Returns:
+        list[tuple[list[tuple], str]] - The groups shown by every packed message and its text
+    """
+
+    separator_length = get_message_length(separator)
+
+    packed, lengths, last_key = [], [], object()
+    for (group, message), pack_key in zip(messages, pack_keys):
+        length = get_message_length(message)
+
+        if (
+            packed
+            and pack_key == last_key
+            and lengths[-1] + separator_length + length <= max_length
+        ):
+            groups, text = packed[-1]
+            groups.append(group)
+            packed[-1] = (groups, text + separator + message)
+            lengths[-1] += separator_length + length
+        else:
+            packed.append(([group], message))
+            lengths.append(length)
 
-def send_message(token, chat_id, message):
+        last_key = pack_key
 
-    url = f"https://api.telegram.org/bot{token}/sendMessage"
+    return packed
+
+
+def send_message(token, chat_id, message, api_url=TELEGRAM_API_URL):
+    """
+    Send a message to a Telegram chat
+
+    Args:
+        token: str - Telegram bot token
+        chat_id: str - Telegram chat id
+        message: str - HTML formatted message
+        api_url: str (Optional) - Base URL of the Telegram Bot API
+
+    Returns:
+        dict - The Telegram response, which is also returned for failed requests (e.g. 429s)
+    """
+
+    url = f"{api_url}/bot{token}/sendMessage"
     params = {"chat_id": chat_id, "text": message, "parse_mode": "HTML"}
-    response = make_request(url, params=params, method="POST")
+    response = http_client.request("POST", url, params=params)
 
     return response.json()
 
 
-async def send_message_with_retry(
-    token, chat_id, message, retry_count=3, backoff_delay=1
-):
-    for i in range(retry_count):
-        try:
-            response = send_message(token, chat_id, message)
-            return response
-        except Exception as e:
-            print(f"Failed to send message. Retrying in {backoff_delay} seconds...")
-            await asyncio.sleep(backoff_delay)
-            backoff_delay *= 2
-    return None
+def edit_message(token, chat_id, message_id, message, api_url=TELEGRAM_API_URL):
+    """
+    Replace the text of a message that was already posted in a Telegram chat
 
+    Args:
+        token: str - Telegram bot token
+        chat_id: str - Telegram chat id
+        message_id: int - Id of the message to edit
+        message: str - HTML formatted message
+        api_url: str (Optional) - Base URL of the Telegram Bot API
 
-async def send_messages_with_retry(
-    token, chat_id, messages, max_rate=20, rate_limit_interval=60
-):
-    futures = []
-    count = 0
-    start_time = time.time()
-
-    for message in messages:
-        if count >= max_rate:
-            elapsed_time = time.time() - start_time
-            if elapsed_time < rate_limit_interval:
-                sleep_time = rate_limit_interval - elapsed_time
-                print(f"Rate limit reached. Sleeping for {sleep_time} seconds...")
-                await asyncio.sleep(sleep_time)
-                count = 0
-                start_time = time.time()
-
-        future = send_message_with_retry(token, chat_id, message)
-        futures.append(future)
-        count += 1
-
-    await asyncio.gather(*futures)
+    Returns:
+        dict - The Telegram response, which is also returned for failed requests (e.g. 429s)
+    """
+
+    url = f"{api_url}/bot{token}/editMessageText"
+    params = {
+        "chat_id": chat_id,
+        "message_id": message_id,
+        "text": message,
+        "parse_mode": "HTML",
+    }
+    response = http_client.request("POST", url, params=params)
+
+    return response.json()
+
+
+def delete_messages(token, chat_id, message_ids, api_url=TELEGRAM_API_URL):
+    """
+    Delete messages of a Telegram chat in a single call, the messages that can't be found are skipped
+
+    Args:
+        token: str - Telegram bot token
+        chat_id: str - Telegram chat id
+        message_ids: list[int] - Ids of the messages to delete, at most 100
+        api_url: str (Optional) - Base URL of the Telegram Bot API
+
+    Returns:
+        dict - The Telegram response, which is also returned for failed requests (e.g. 429s)
+    """
+
+    url = f"{api_url}/bot{token}/deleteMessages"
+    params = {"chat_id": chat_id, "message_ids": json.dumps(message_ids)}
+    response = http_client.request("POST", url, params=params)
+
+    return response.json()